@@ -34,6 +34,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'health.middleware.ReadReplicaMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -41,6 +42,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'health.middleware.RequestProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'backend.urls'
@@ -73,6 +75,33 @@ DATABASES = {
     }
 }
 
+# Optional read replica: read-only view and API requests read from it, writes
+# and the report pipeline stay on the primary. Locally, point it at a second
+# SQLite file refreshed from the primary (e.g. `sqlite3 db.sqlite3 ".backup replica.sqlite3"`).
+DATABASE_REPLICA_NAME = os.getenv("DATABASE_REPLICA_NAME", "")
+if DATABASE_REPLICA_NAME:
+    DATABASES['replica'] = {
+        'ENGINE': os.getenv("DATABASE_REPLICA_ENGINE", "django.db.backends.sqlite3"),
+        'NAME': DATABASE_REPLICA_NAME,
+        'HOST': os.getenv("DATABASE_REPLICA_HOST", ""),
+        'PORT': os.getenv("DATABASE_REPLICA_PORT", ""),
+        'USER': os.getenv("DATABASE_REPLICA_USER", ""),
+        'PASSWORD': os.getenv("DATABASE_REPLICA_PASSWORD", ""),
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['health.db_routing.PrimaryReplicaRouter']
+# After a write, that browser keeps reading from the primary for this long.
+READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", "30"))
+
+# On-demand request profiles (?profile=1 for staff, or a signed X-Profile-Token header).
+PROFILE_DIR = os.getenv("PROFILE_DIR", str(BASE_DIR / "profiles"))
+PROFILE_TOKEN_MAX_AGE = int(os.getenv("PROFILE_TOKEN_MAX_AGE", "3600"))
+# Only the newest PROFILE_KEEP profiles are kept; older ones are deleted as new ones are written.
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", "100"))
+# tracemalloc is process-wide: while a profile runs it slows every thread and
+# the peak includes other threads' allocations. Opt in with 1 on single-threaded servers.
+PROFILE_TRACE_MEMORY = os.getenv("PROFILE_TRACE_MEMORY", "0") == "1"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -141,4 +170,84 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
 GROQ_VISION_MODEL = os.getenv("GROQ_VISION_MODEL", "llama-3.2-11b-vision-preview")
-
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
+
+# Analysis routes as provider:model in preference order. Each call goes to the fastest
+# healthy route (EWMA latency and error rate) and falls back down the rest.
+# Gemini is opt-in, e.g. LLM_ROUTES="groq:llama-3.1-8b-instant,gemini:gemini-2.0-flash".
+LLM_ROUTES = os.getenv("LLM_ROUTES", f"groq:{GROQ_MODEL}")
+LLM_ROUTER_EWMA_ALPHA = float(os.getenv("LLM_ROUTER_EWMA_ALPHA", "0.3"))
+LLM_ROUTER_MAX_ERROR_RATE = float(os.getenv("LLM_ROUTER_MAX_ERROR_RATE", "0.5"))
+# An unhealthy route is tried again after this long so it can recover.
+LLM_ROUTER_PROBE_SECONDS = int(os.getenv("LLM_ROUTER_PROBE_SECONDS", "60"))
+LLM_MODEL_CATALOG_SECONDS = int(os.getenv("LLM_MODEL_CATALOG_SECONDS", "3600"))
+
+# Provider endpoints; point them at `manage.py run_provider_stub` to work offline.
+GROQ_BASE_URL = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1")
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "https://generativelanguage.googleapis.com/v1beta/openai")
+TRANSLATE_BASE_URL = os.getenv("TRANSLATE_BASE_URL", "https://translate.googleapis.com")
+# Used by the "http" TTS provider: POST {"text", "voice"} to <TTS_BASE_URL>/tts for audio/mpeg.
+TTS_BASE_URL = os.getenv("TTS_BASE_URL", "")
+
+# Provider backends by kind and name; each is imported on first use (see health/providers).
+HEALTH_PROVIDERS = {
+    "ocr": {"tesseract": "health.local_ocr.tesseract_text"},
+    "llm": {"groq": "health.providers.groq.provider", "gemini": "health.providers.gemini.provider"},
+    "translation": {"google": "health.providers.google_translate.translate"},
+    "tts": {
+        "edge": "health.providers.speech.edge_tts_synthesize",
+        "http": "health.providers.speech.http_synthesize",
+    },
+}
+TRANSLATION_PROVIDER = os.getenv("TRANSLATION_PROVIDER", "google")
+# Empty picks "http" when TTS_BASE_URL is set, else "edge".
+TTS_PROVIDER = os.getenv("TTS_PROVIDER", "")
+
+# Shared outbound quota for Groq across all workers (0 disables a budget).
+GROQ_REQUESTS_PER_MINUTE = int(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30"))
+GROQ_TOKENS_PER_MINUTE = int(os.getenv("GROQ_TOKENS_PER_MINUTE", "6000"))
+GROQ_RATE_LIMIT_MAX_WAIT = float(os.getenv("GROQ_RATE_LIMIT_MAX_WAIT", "20"))
+
+# Coalesce identical concurrent provider calls across processes via lease rows.
+# RESULT_TTL > 0 also lets later callers reuse a finished result for that many seconds (0 = waiters only).
+SINGLE_FLIGHT_CROSS_PROCESS = os.getenv("SINGLE_FLIGHT_CROSS_PROCESS", "1") == "1"
+SINGLE_FLIGHT_LEASE_SECONDS = float(os.getenv("SINGLE_FLIGHT_LEASE_SECONDS", "180"))
+SINGLE_FLIGHT_RESULT_TTL = float(os.getenv("SINGLE_FLIGHT_RESULT_TTL", "0"))
+SINGLE_FLIGHT_SWEEP_SECONDS = float(os.getenv("SINGLE_FLIGHT_SWEEP_SECONDS", "300"))
+
+# Reuse a report's stored pipeline stage outputs when their inputs and code are unchanged.
+PIPELINE_STAGE_CACHE = True
+
+# Bulk multi-report ingest
+BULK_UPLOAD_MAX_FILES = 50
+BULK_UPLOAD_MAX_MEMBER_BYTES = 20 * 1024 * 1024
+BULK_UPLOAD_MAX_TOTAL_BYTES = 200 * 1024 * 1024
+BULK_OCR_WORKERS = 4
+# Default worker count for manage.py reprocess_reports.
+REPROCESS_WORKERS = int(os.getenv("REPROCESS_WORKERS", "4"))
+
+# PDF reports: text layer parsed locally, scanned pages go to vision OCR
+PDF_TEXT_WORKERS = 4
+PDF_PARALLEL_MIN_PAGES = 8
+PDF_MAX_VISION_PAGES = 5
+
+# Tiered image OCR: local engine first, vision model only below this score
+OCR_LOCAL_ENGINE = os.getenv("OCR_LOCAL_ENGINE", "tesseract")
+OCR_LOCAL_MIN_CONFIDENCE = float(os.getenv("OCR_LOCAL_MIN_CONFIDENCE", "0.6"))
+
+# Split tall report images into overlapping bands OCR'd concurrently (1 disables)
+OCR_TILES = int(os.getenv("OCR_TILES", "1"))
+OCR_TILE_OVERLAP = 0.12
+OCR_TILE_MIN_ASPECT = 1.2
+
+# Resumable chunked uploads (PUT chunks with an Upload-Offset header)
+CHUNKED_UPLOAD_MAX_BYTES = 50 * 1024 * 1024
+CHUNKED_UPLOAD_MAX_CHUNK_BYTES = 5 * 1024 * 1024
+# Longer than any single chunk write; a writer killed mid-chunk blocks the upload at most this long.
+CHUNKED_UPLOAD_WRITER_LEASE_SECONDS = 120
+# Unfinished uploads idle this long are deleted with their partial files.
+CHUNKED_UPLOAD_EXPIRY_HOURS = 24
+CHUNKED_UPLOAD_SWEEP_SECONDS = 3600
+
+# Rendered report detail fragments; keys change whenever the report or history does
+REPORT_FRAGMENT_CACHE_SECONDS = int(os.getenv("REPORT_FRAGMENT_CACHE_SECONDS", "86400"))
@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.template.response import TemplateResponse
+from django.urls import path
 
+from .cohorts import DIMENSIONS, cohort_statistics
 from .models import AnalysisResult, LabParameter, MedicalReport
 
 
@@ -16,6 +19,27 @@ class MedicalReportAdmin(admin.ModelAdmin):
     readonly_fields = ("doctor_suggestions",)
     inlines = [LabParameterInline]
 
+    def get_urls(self):
+        custom = [
+            path("cohorts/", self.admin_site.admin_view(self.cohort_stats_view), name="health_cohort_stats"),
+        ]
+        return custom + super().get_urls()
+
+    def cohort_stats_view(self, request):
+        parameter = request.GET.get("parameter", "HbA1c").strip() or "HbA1c"
+        stats = cohort_statistics(parameter, refresh=bool(request.GET.get("refresh")))
+        context = {
+            **self.admin_site.each_context(request),
+            "title": f"Cohort distribution: {parameter}",
+            "parameter": parameter,
+            "stats": stats,
+            "units": [
+                (unit, data["users"], [(dimension, data["groups"][dimension]) for dimension in ("all",) + DIMENSIONS])
+                for unit, data in stats["units"].items()
+            ],
+        }
+        return TemplateResponse(request, "admin/health/cohort_stats.html", context)
+
 
 @admin.register(AnalysisResult)
 class AnalysisResultAdmin(admin.ModelAdmin):
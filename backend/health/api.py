@@ -0,0 +1,72 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import condition
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .models import MedicalReport
+from .serializers import LabParameterSerializer, MedicalReportDetailSerializer, MedicalReportListSerializer
+from .trends import build_trend_series
+
+
+def _etag(*parts) -> str:
+    return hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _history_etag(request, *args, **kwargs) -> str:
+    # Any upload, reprocess, analysis write or delete changes one of these.
+    stamp = MedicalReport.objects.filter(user=request.user).aggregate(
+        count=Count("id"),
+        reports=Max("updated_at"),
+        analyses=Max("analysis__updated_at"),
+    )
+    return _etag(request.user.pk, stamp["count"], stamp["reports"], stamp["analyses"])
+
+
+def _report_etag(request, report_id: int, *args, **kwargs) -> str | None:
+    stamp = (
+        MedicalReport.objects.filter(user=request.user, id=report_id)
+        .values_list("updated_at", "analysis__updated_at")
+        .first()
+    )
+    if stamp is None:
+        return None
+    return _etag(request.user.pk, report_id, *stamp)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@condition(etag_func=_history_etag)
+def report_list_api(request):
+    reports = MedicalReport.objects.filter(user=request.user).order_by("-report_date", "-created_at")
+    return Response(MedicalReportListSerializer(reports, many=True).data)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@condition(etag_func=_report_etag)
+def report_detail_api(request, report_id: int):
+    report = get_object_or_404(
+        MedicalReport.objects.filter(user=request.user).select_related("analysis").prefetch_related("parameters"),
+        id=report_id,
+    )
+    return Response(MedicalReportDetailSerializer(report).data)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@condition(etag_func=_report_etag)
+def report_parameters_api(request, report_id: int):
+    report = get_object_or_404(MedicalReport.objects.filter(user=request.user), id=report_id)
+    return Response(LabParameterSerializer(report.parameters.order_by("id"), many=True).data)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@condition(etag_func=_history_etag)
+def trend_series_api(request):
+    names = request.query_params.getlist("name") or None
+    return Response({"series": build_trend_series(request.user, names=names)})
@@ -0,0 +1,89 @@
+"""Deterministic synthetic reports, analysis contexts and narratives for the benchmark commands."""
+
+import random
+from datetime import date, timedelta
+
+from .trends import trend_statistics_from_reports
+
+
+PARAMETERS_PER_REPORT = 20
+
+
+def synthetic_report_text(lines: int, seed: int = 7) -> str:
+    """OCR-like report text: mostly parameter rows with the odd doctor note."""
+    rng = random.Random(seed)
+    rows = []
+    for index in range(lines):
+        if index % 10 == 9:
+            rows.append(f"Doctor advice: repeat panel {index // 10} after 4 weeks and keep hydration adequate.")
+            continue
+        low = rng.uniform(1, 100)
+        rows.append(f"Marker {index:04d} {low * rng.uniform(0.7, 1.4):.1f} mg/dL {low:.1f}-{low * 1.3:.1f}")
+    return "\n".join(rows)
+
+
+def _synthetic_parameters(rng: random.Random) -> list[dict]:
+    parameters = []
+    for index in range(PARAMETERS_PER_REPORT):
+        ref_min = rng.uniform(1, 100)
+        ref_max = ref_min * 1.3
+        value = round(ref_min * rng.uniform(0.7, 1.5), 2)
+        risk_flag = "low" if value < ref_min else "high" if value > ref_max else "normal"
+        parameters.append(
+            {
+                "name": f"Marker {index:02d}",
+                "value": value,
+                "unit": "mg/dL",
+                "ref_min": round(ref_min, 2),
+                "ref_max": round(ref_max, 2),
+                "risk_flag": risk_flag,
+            }
+        )
+    return parameters
+
+
+def synthetic_context(history: int, seed: int = 7) -> dict:
+    """An analysis context shaped like ``prepare_llm_context`` output, without the database."""
+    rng = random.Random(seed)
+    start = date(2020, 1, 1)
+    reports = []
+    for index in range(history):
+        parameters = _synthetic_parameters(rng)
+        reports.append(
+            {
+                "report_id": index + 1,
+                "date": str(start + timedelta(days=30 * index)),
+                "parameter_count": len(parameters),
+                "parameters": parameters,
+                "report_text_excerpt": "",
+                "doctor_notes_or_comments": ["Repeat panel after 4 weeks."],
+            }
+        )
+    return {
+        "current_report_id": history,
+        "user_context": {"language_preference": "English", "lifestyle": {"sleep_hours": 7}},
+        "reports": reports,
+        "trend_statistics": trend_statistics_from_reports(reports),
+        "current_report_doctor_suggestions": ["Repeat panel after 4 weeks."],
+    }
+
+
+def synthetic_narrative(length: int, seed: int = 7) -> str:
+    """Model-style narrative text with numbers and wording the language guardrail rewrites."""
+    rng = random.Random(seed)
+    sentences = (
+        "Marker {a} is {v:.1f} against a range of {lo:.1f} to {hi:.1f}.",
+        "You have borderline anaemia based on marker {a}.",
+        "This is not dangerous but worth tracking over {n} weeks.",
+        "Values moved by {v:.1f} percent since the previous report.",
+        "A severe change would need prompt review.",
+    )
+    parts, size = [], 0
+    while size < length:
+        low = rng.uniform(1, 100)
+        sentence = rng.choice(sentences).format(
+            a=rng.randrange(PARAMETERS_PER_REPORT), v=low * 1.1, lo=low, hi=low * 1.3, n=rng.randrange(2, 12)
+        )
+        parts.append(sentence)
+        size += len(sentence) + 1
+    return " ".join(parts)[:length]
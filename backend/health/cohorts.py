@@ -0,0 +1,190 @@
+from datetime import date
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db.models import Count, Max, Min
+
+from .models import LabParameter
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+DIMENSIONS = ("location_type", "age_band", "diet_type")
+PERCENTILES = (10, 25, 50, 75, 90)
+AGE_BANDS = ((0, 18, "<18"), (18, 30, "18-29"), (30, 45, "30-44"), (45, 60, "45-59"), (60, 200, "60+"))
+CACHE_TIMEOUT_SECONDS = 24 * 60 * 60
+
+
+def cohort_statistics(parameter: str, bins: int = 40, chunk_size: int = 5000, refresh: bool = False) -> dict:
+    """Population distribution of one lab parameter, cached for the day."""
+    key = f"cohort-stats:{parameter.strip().lower()}:{bins}:{date.today().isoformat()}"
+    if not refresh:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    result = compute_cohort_statistics(parameter, bins=bins, chunk_size=chunk_size)
+    cache.set(key, result, CACHE_TIMEOUT_SECONDS)
+    return result
+
+
+def compute_cohort_statistics(parameter: str, bins: int = 40, chunk_size: int = 5000) -> dict:
+    """Distribution of one lab parameter across users, per unit, in fixed-bin histograms.
+
+    Each user counts once per unit, with their latest reading, so someone tested
+    forty times weighs as much as someone tested once, and values in different
+    units are never binned together. Rows stream in ``chunk_size`` pieces, so
+    memory is bounded by one chunk plus one histogram per unit and cohort value;
+    percentiles are interpolated from the histograms.
+    """
+    # Imported here: admin loads this module in every process, but only this
+    # computation needs numpy.
+    import numpy as np
+
+    queryset = LabParameter.objects.filter(name__iexact=parameter.strip())
+    result = {"parameter": parameter, "generated_on": date.today().isoformat(), "users": 0, "units": {}}
+
+    # Histogram range per unit from the raw readings: a superset of the latest ones.
+    bounds = {}
+    for row in queryset.values("unit").annotate(low=Min("value"), high=Max("value"), readings=Count("id")).order_by(
+        "-readings"
+    ):
+        key = _unit_key(row["unit"])
+        label, low, high = bounds.get(key, ((row["unit"] or "").strip() or "no unit", row["low"], row["high"]))
+        bounds[key] = (label, min(low, row["low"]), max(high, row["high"]))
+    if not bounds:
+        return result
+
+    edges = {}
+    accumulators = {}
+    for key, (_, low, high) in bounds.items():
+        low, high = float(low), float(high)
+        edges[key] = np.linspace(low, high if high > low else low + 1.0, bins + 1)
+        accumulators[key] = {dimension: {} for dimension in ("all",) + DIMENSIONS}
+
+    # Newest first within each user, so the first row per (user, unit) is the latest reading.
+    rows = (
+        queryset.order_by("report__user_id", "-report__report_date", "-report__created_at", "-id")
+        .values_list(
+            "report__user_id",
+            "unit",
+            "value",
+            "report__user__userprofile__location_type",
+            "report__user__userprofile__age",
+            "report__user__userprofile__diet_type",
+        )
+        .iterator(chunk_size=chunk_size)
+    )
+    current_user, seen_units = None, set()
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        latest = {}
+        for row in chunk:
+            if row[0] != current_user:
+                current_user, seen_units = row[0], set()
+            key = _unit_key(row[1])
+            if key not in seen_units:
+                seen_units.add(key)
+                latest.setdefault(key, []).append(row)
+        for key, selected in latest.items():
+            values = np.fromiter((row[2] for row in selected), dtype=np.float64, count=len(selected))
+            bin_index = np.clip(np.searchsorted(edges[key], values, side="right") - 1, 0, bins - 1)
+            labels = {
+                "all": np.full(len(selected), "all", dtype=object),
+                "location_type": np.asarray([row[3] or "unknown" for row in selected], dtype=object),
+                "age_band": np.asarray([_age_band(row[4]) for row in selected], dtype=object),
+                "diet_type": np.asarray([(row[5] or "unknown").strip().lower() for row in selected], dtype=object),
+            }
+            for dimension, dimension_labels in labels.items():
+                _accumulate(accumulators[key][dimension], dimension_labels, values, bin_index, bins)
+
+    units = []
+    for key, (label, _, _) in bounds.items():
+        groups = {
+            dimension: {name: _summarize(accumulator, edges[key]) for name, accumulator in sorted(found.items())}
+            for dimension, found in accumulators[key].items()
+        }
+        units.append(
+            (
+                label,
+                {
+                    "users": groups["all"]["all"]["count"] if groups["all"] else 0,
+                    "bin_edges": [round(float(edge), 4) for edge in edges[key]],
+                    "groups": groups,
+                },
+            )
+        )
+    # Most common unit first.
+    result["units"] = dict(sorted(units, key=lambda item: -item[1]["users"]))
+    result["users"] = queryset.values("report__user_id").distinct().count()
+    return result
+
+
+def _unit_key(unit: str | None) -> str:
+    return " ".join((unit or "").split()).lower()
+
+
+def _accumulate(groups: dict, labels: "np.ndarray", values: "np.ndarray", bin_index: "np.ndarray", bins: int) -> None:
+    import numpy as np
+
+    unique_labels, inverse = np.unique(labels, return_inverse=True)
+    k = len(unique_labels)
+    histogram = np.bincount(inverse * bins + bin_index, minlength=k * bins).reshape(k, bins)
+    counts = np.bincount(inverse, minlength=k)
+    sums = np.bincount(inverse, values, k)
+    squares = np.bincount(inverse, values * values, k)
+    minimums = np.full(k, np.inf)
+    maximums = np.full(k, -np.inf)
+    np.minimum.at(minimums, inverse, values)
+    np.maximum.at(maximums, inverse, values)
+
+    for index, label in enumerate(unique_labels):
+        accumulator = groups.setdefault(
+            str(label),
+            {"histogram": np.zeros(bins, dtype=np.int64), "count": 0, "sum": 0.0, "sumsq": 0.0, "min": np.inf, "max": -np.inf},
+        )
+        accumulator["histogram"] += histogram[index]
+        accumulator["count"] += int(counts[index])
+        accumulator["sum"] += float(sums[index])
+        accumulator["sumsq"] += float(squares[index])
+        accumulator["min"] = min(accumulator["min"], float(minimums[index]))
+        accumulator["max"] = max(accumulator["max"], float(maximums[index]))
+
+
+def _summarize(accumulator: dict, edges: "np.ndarray") -> dict:
+    import numpy as np
+
+    count = accumulator["count"]
+    mean = accumulator["sum"] / count
+    variance = max(0.0, accumulator["sumsq"] / count - mean * mean)
+    cumulative = np.cumsum(accumulator["histogram"])
+    percentiles = {}
+    for percentile in PERCENTILES:
+        target = count * percentile / 100.0
+        index = int(np.searchsorted(cumulative, target, side="left"))
+        below = cumulative[index - 1] if index else 0
+        in_bin = accumulator["histogram"][index]
+        fraction = (target - below) / in_bin if in_bin else 0.0
+        estimate = edges[index] + fraction * (edges[index + 1] - edges[index])
+        percentiles[f"p{percentile}"] = round(float(np.clip(estimate, accumulator["min"], accumulator["max"])), 3)
+    return {
+        "count": count,
+        "mean": round(mean, 3),
+        "std": round(variance**0.5, 3),
+        "min": round(accumulator["min"], 3),
+        "max": round(accumulator["max"], 3),
+        "percentiles": percentiles,
+        "histogram": accumulator["histogram"].tolist(),
+    }
+
+
+def _age_band(age) -> str:
+    if age is None:
+        return "unknown"
+    for low, high, label in AGE_BANDS:
+        if low <= age < high:
+            return label
+    return "unknown"
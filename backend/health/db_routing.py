@@ -0,0 +1,66 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+
+PRIMARY_ALIAS = "default"
+REPLICA_ALIAS = "replica"
+
+# Session rows must be fresh right after login, so they are never read from the replica.
+PRIMARY_ONLY_APPS = ("sessions",)
+
+# Where reads go for the current request or thread. Unmarked code (pipeline
+# workers, management commands, background threads) always uses the primary.
+_read_alias: ContextVar[str] = ContextVar("db_read_alias", default=PRIMARY_ALIAS)
+
+
+def replica_alias() -> str | None:
+    return REPLICA_ALIAS if REPLICA_ALIAS in settings.DATABASES else None
+
+
+@contextmanager
+def use_primary():
+    """Read from the primary inside the block; also works as a decorator."""
+    token = _read_alias.set(PRIMARY_ALIAS)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+@contextmanager
+def use_replica():
+    """Read from the replica inside the block when one is configured."""
+    token = _read_alias.set(replica_alias() or PRIMARY_ALIAS)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """Writes always go to the primary; reads follow ``use_replica``/``use_primary``."""
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias == PRIMARY_ALIAS or model._meta.app_label in PRIMARY_ONLY_APPS:
+            return PRIMARY_ALIAS
+        # Reads inside a write transaction must see that transaction.
+        if connections[PRIMARY_ALIAS].in_atomic_block:
+            return PRIMARY_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        # Once a block has written, its later reads must see the write too.
+        if _read_alias.get() != PRIMARY_ALIAS:
+            _read_alias.set(PRIMARY_ALIAS)
+        return PRIMARY_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
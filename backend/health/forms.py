@@ -1,7 +1,17 @@
+import os
+import re
+import zipfile
+from datetime import date
+
 from django import forms
+from django.conf import settings
+from django.core.files.base import ContentFile
 
 from .models import MedicalReport
 
+BULK_ALLOWED_EXTENSIONS = (".txt", ".pdf", ".png", ".jpg", ".jpeg", ".webp", ".bmp")
+DATE_IN_NAME_PATTERN = re.compile(r"(\d{4})[-_.](\d{2})[-_.](\d{2})")
+
 
 class MedicalReportUploadForm(forms.ModelForm):
     ocr_text = forms.CharField(
@@ -37,3 +47,133 @@ class MedicalReportUploadForm(forms.ModelForm):
         if not report_file and not ocr_text:
             raise forms.ValidationError("Upload a file or paste report text.")
         return cleaned_data
+
+
+class MultipleFileInput(forms.ClearableFileInput):
+    allow_multiple_selected = True
+
+
+class MultipleFileField(forms.FileField):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("widget", MultipleFileInput())
+        super().__init__(*args, **kwargs)
+
+    def clean(self, data, initial=None):
+        single_clean = super().clean
+        if isinstance(data, (list, tuple)):
+            return [single_clean(item, initial) for item in data]
+        return [single_clean(data, initial)] if data else []
+
+
+class BulkReportUploadForm(forms.Form):
+    report_files = MultipleFileField(
+        label="Report Files or ZIP",
+        help_text="Select several reports at once, or one ZIP archive of .txt, PDF and image reports.",
+    )
+    report_date = forms.DateField(
+        label="Default Report Date",
+        widget=forms.DateInput(attrs={"type": "date"}),
+        help_text="Used for files without a date in their name or in the list below.",
+    )
+    file_dates = forms.CharField(
+        required=False,
+        label="Per-file Dates (optional)",
+        widget=forms.Textarea(
+            attrs={
+                "rows": 5,
+                "placeholder": "cbc_jan.jpg: 2025-01-14\nlipids.txt: 2025-06-02",
+            }
+        ),
+    )
+
+    def clean_file_dates(self):
+        mapping = {}
+        for raw_line in (self.cleaned_data.get("file_dates") or "").splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+            name, sep, value = line.rpartition(":")
+            if not sep or not name.strip():
+                raise forms.ValidationError(f"Use 'file name: YYYY-MM-DD' per line, got '{line}'.")
+            try:
+                mapping[name.strip().lower()] = date.fromisoformat(value.strip())
+            except ValueError as exc:
+                raise forms.ValidationError(f"Invalid date for '{name.strip()}'.") from exc
+        return mapping
+
+    def clean(self):
+        cleaned_data = super().clean()
+        uploads = cleaned_data.get("report_files") or []
+        default_date = cleaned_data.get("report_date")
+        file_dates = cleaned_data.get("file_dates") or {}
+        if not uploads or not default_date:
+            return cleaned_data
+
+        max_files = int(getattr(settings, "BULK_UPLOAD_MAX_FILES", 50))
+        entries = []
+        for upload in uploads:
+            if upload.name.lower().endswith(".zip"):
+                entries.extend(_expand_zip(upload, max_files - len(entries)))
+            elif upload.name.lower().endswith(BULK_ALLOWED_EXTENSIONS):
+                entries.append((os.path.basename(upload.name), upload))
+            else:
+                raise forms.ValidationError(f"Unsupported file type: {upload.name}")
+            if len(entries) > max_files:
+                raise forms.ValidationError(f"Upload at most {max_files} reports at once.")
+
+        if not entries:
+            raise forms.ValidationError("No supported report files were found in the upload.")
+
+        cleaned_data["entries"] = [
+            (name, content, file_dates.get(name.lower()) or _date_from_name(name) or default_date)
+            for name, content in entries
+        ]
+        return cleaned_data
+
+
+def _expand_zip(upload, slots: int) -> list[tuple[str, ContentFile]]:
+    """Read the report members of ``upload``, at most ``slots`` of them.
+
+    Counts and declared sizes are checked from the central directory before any
+    member is decompressed; zipfile stops reading a member at its declared size.
+    """
+    max_files = int(getattr(settings, "BULK_UPLOAD_MAX_FILES", 50))
+    max_member_bytes = int(getattr(settings, "BULK_UPLOAD_MAX_MEMBER_BYTES", 20 * 1024 * 1024))
+    max_total_bytes = int(getattr(settings, "BULK_UPLOAD_MAX_TOTAL_BYTES", 200 * 1024 * 1024))
+    try:
+        archive = zipfile.ZipFile(upload)
+    except zipfile.BadZipFile as exc:
+        raise forms.ValidationError(f"{upload.name} is not a valid ZIP archive.") from exc
+
+    with archive:
+        members = []
+        total_bytes = 0
+        for member in archive.infolist():
+            name = os.path.basename(member.filename)
+            if member.is_dir() or not name or name.startswith("."):
+                continue
+            if not name.lower().endswith(BULK_ALLOWED_EXTENSIONS):
+                continue
+            if len(members) >= slots:
+                raise forms.ValidationError(f"Upload at most {max_files} reports at once.")
+            if member.file_size > max_member_bytes:
+                raise forms.ValidationError(f"{name} in {upload.name} is too large.")
+            total_bytes += member.file_size
+            if total_bytes > max_total_bytes:
+                raise forms.ValidationError(f"{upload.name} is too large once extracted.")
+            members.append((name, member))
+
+        try:
+            return [(name, ContentFile(archive.read(member), name=name)) for name, member in members]
+        except (zipfile.BadZipFile, OSError) as exc:
+            raise forms.ValidationError(f"{upload.name} could not be extracted.") from exc
+
+
+def _date_from_name(name: str) -> date | None:
+    match = DATE_IN_NAME_PATTERN.search(name)
+    if not match:
+        return None
+    try:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
@@ -1,6 +1,9 @@
-import google.generativeai as genai
+from django.conf import settings
+from django.core.cache import cache
 
 
+RESOLVED_MODEL_KEY = "gemini-resolved-model"
+DEFAULT_MODEL = "models/gemini-2.0-flash"
 PREFERRED_MODELS = [
     "models/gemini-2.0-flash",
     "models/gemini-2.0-flash-lite",
@@ -10,11 +13,23 @@ PREFERRED_MODELS = [
 
 
 def resolve_gemini_model_name() -> str:
+    """The best available Gemini model, resolved once per ``LLM_MODEL_CATALOG_SECONDS``."""
+    cached = cache.get(RESOLVED_MODEL_KEY)
+    if cached:
+        return cached
     try:
+        import google.generativeai as genai
+
         models = list(genai.list_models())
     except Exception:
-        return "models/gemini-2.0-flash"
+        # Not cached, so the catalog is asked again once the API is reachable.
+        return DEFAULT_MODEL
+    name = _pick_model(models)
+    cache.set(RESOLVED_MODEL_KEY, name, timeout=int(getattr(settings, "LLM_MODEL_CATALOG_SECONDS", 3600)))
+    return name
+
 
+def _pick_model(models: list) -> str:
     eligible = []
     for model in models:
         methods = getattr(model, "supported_generation_methods", []) or []
@@ -28,4 +43,4 @@ def resolve_gemini_model_name() -> str:
     if eligible:
         return eligible[0]
 
-    return "models/gemini-2.0-flash"
+    return DEFAULT_MODEL
@@ -1,6 +1,7 @@
 import re
 from typing import Any
 
+from ..narratives import get_catalog
 from .safety_language import validate_language
 
 
@@ -18,10 +19,11 @@ def run_output_guardrails(
     input_confidence: float = 1.0,
 ) -> dict[str, Any]:
     output = dict(ai_output or {})
+    catalog = get_catalog(output.get("language"))
     language_meta = {}
 
     for field in TEXT_FIELDS:
-        safe_text, meta = validate_language(str(output.get(field, "") or ""))
+        safe_text, meta = validate_language(str(output.get(field, "") or ""), catalog.text("disclaimer"))
         output[field] = safe_text
         language_meta[field] = meta
 
@@ -36,10 +38,7 @@ def run_output_guardrails(
     }
 
     if claims["hallucination_detected"]:
-        caution = (
-            " Some generated claims could not be verified against extracted lab values, "
-            "so this summary should be reviewed carefully with a clinician."
-        )
+        caution = catalog.text("caution")
         output["mentor_summary"] = (output.get("mentor_summary") or "").strip() + caution
         output["trend_analysis"] = (output.get("trend_analysis") or "").strip() + caution
 
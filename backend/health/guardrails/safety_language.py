@@ -15,13 +15,19 @@ ALARM_SOFTENERS = {
     "immediately": "soon",
 }
 
+DEFAULT_DISCLAIMER = "This is educational support only, not a diagnosis or prescription."
+
 PRESCRIPTION_PATTERNS = [
     re.compile(r"\b(start|take|use)\s+[a-z0-9\s-]+\s+mg\b", re.IGNORECASE),
     re.compile(r"\bprescribe\b", re.IGNORECASE),
 ]
 
 
-def validate_language(text: str) -> tuple[str, dict]:
+def validate_language(text: str, disclaimer: str | None = None) -> tuple[str, dict]:
+    """Soften diagnostic wording and make sure the disclaimer is present.
+
+    ``disclaimer`` is the localized sentence for non-English fallback text.
+    """
     value = (text or "").strip()
     if not value:
         return "", {"diagnosis_rewrites": 0, "alarm_softened": 0, "prescription_removed": 0}
@@ -42,8 +48,9 @@ def validate_language(text: str) -> tuple[str, dict]:
         value, count = pattern.subn("discuss treatment options with your clinician", value)
         prescription_removed += count
 
-    if "educational support only" not in value.lower():
-        value = value.rstrip() + " This is educational support only, not a diagnosis or prescription."
+    disclaimer = disclaimer or DEFAULT_DISCLAIMER
+    if "educational support only" not in value.lower() and disclaimer not in value:
+        value = value.rstrip() + " " + disclaimer
 
     return value, {
         "diagnosis_rewrites": diagnosis_rewrites,
@@ -0,0 +1,158 @@
+"""Latency-aware routing of analysis requests across LLM providers and models.
+
+Routes are ``provider:model`` pairs from ``settings.LLM_ROUTES`` in preference
+order; a route is used only if its provider's API key is set and the model is
+in the provider's model list (cached for ``LLM_MODEL_CATALOG_SECONDS``). Each
+route keeps an exponentially weighted moving average of its latency and error
+rate in the cache (shared by all workers with a shared cache). A call goes to
+the fastest healthy route first and falls back down the remaining routes; an
+unhealthy route is retried once ``LLM_ROUTER_PROBE_SECONDS`` have passed since
+its last attempt, so it can recover.
+"""
+
+import os
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import metrics
+from .providers import get_provider
+from .rate_limit import RateLimitExceeded
+
+
+STATE_PREFIX = "llm-route:"
+CATALOG_PREFIX = "llm-catalog:"
+# How long a failed catalog lookup is remembered before asking the provider again.
+CATALOG_FAILURE_SECONDS = 60
+
+
+class NoRouteAvailable(Exception):
+    pass
+
+
+def configured_routes() -> list[tuple[str, str]]:
+    """Routes from ``LLM_ROUTES`` whose provider has an API key, in preference order."""
+    routes = []
+    for entry in str(getattr(settings, "LLM_ROUTES", "") or "").split(","):
+        provider, _, model = entry.strip().partition(":")
+        provider, model = provider.strip().lower(), model.strip()
+        if provider and model and _api_key(provider) and (provider, model) not in routes:
+            routes.append((provider, model))
+    return routes
+
+
+def plan(routes: list[tuple[str, str]] | None = None) -> list[tuple[str, str]]:
+    """Order ``routes`` for one call: healthy by EWMA latency, then the rest as fallbacks.
+
+    Routes without samples keep their preference position ahead of measured ones,
+    so every route gets measured; routes missing from the provider's model
+    catalog are dropped.
+    """
+    routes = [route for route in (configured_routes() if routes is None else routes) if _in_catalog(*route)]
+    states = cache.get_many([_state_key(*route) for route in routes])
+    max_error_rate = float(getattr(settings, "LLM_ROUTER_MAX_ERROR_RATE", 0.5))
+    probe_seconds = float(getattr(settings, "LLM_ROUTER_PROBE_SECONDS", 60))
+    now = time.time()
+
+    unsampled, healthy, unhealthy = [], [], []
+    for route in routes:
+        state = states.get(_state_key(*route))
+        if not state:
+            unsampled.append(route)
+        elif state["error_rate"] < max_error_rate or now - state["updated"] >= probe_seconds:
+            healthy.append((state["latency_ms"], route))
+        else:
+            unhealthy.append(route)
+    healthy.sort(key=lambda item: item[0])
+    return unsampled + [route for _, route in healthy] + unhealthy
+
+
+def chat_completion(payload: dict, timeout: int) -> tuple[dict, tuple[str, str]]:
+    """Send ``payload`` (without ``model``) along the planned routes; return the first success.
+
+    Raises ``NoRouteAvailable`` with every route's error when all of them fail.
+    """
+    routes = plan()
+    if not routes:
+        raise NoRouteAvailable("No LLM route is configured.")
+
+    errors = []
+    for provider, model in routes:
+        started = time.perf_counter()
+        try:
+            data = get_provider("llm", provider).chat_completion({**payload, "model": model}, timeout=timeout)
+        except RateLimitExceeded as exc:
+            # Our own quota held the request back; the route itself did not fail.
+            errors.append(f"{provider}:{model}: {exc}")
+            continue
+        except Exception as exc:
+            record(provider, model, time.perf_counter() - started, ok=False)
+            errors.append(f"{provider}:{model}: {exc}")
+            continue
+        record(provider, model, time.perf_counter() - started, ok=True)
+        return data, (provider, model)
+    raise NoRouteAvailable(" | ".join(errors))
+
+
+def record(provider: str, model: str, seconds: float, ok: bool) -> dict:
+    """Fold one call into the route's latency and error-rate averages."""
+    alpha = float(getattr(settings, "LLM_ROUTER_EWMA_ALPHA", 0.3))
+    key = _state_key(provider, model)
+    state = cache.get(key)
+    latency_ms = seconds * 1000
+    error = 0.0 if ok else 1.0
+    if state is None:
+        # Failures say little about speed, so they do not seed the latency average.
+        state = {"latency_ms": latency_ms if ok else 0.0, "error_rate": error, "samples": 0}
+    else:
+        if ok:
+            state["latency_ms"] = alpha * latency_ms + (1 - alpha) * state["latency_ms"]
+        state["error_rate"] = alpha * error + (1 - alpha) * state["error_rate"]
+    state["samples"] += 1
+    state["updated"] = time.time()
+    cache.set(key, state, timeout=None)
+
+    metrics.observe(f"llm.{provider}", seconds)
+    if not ok:
+        metrics.incr(f"llm.{provider}.error")
+    return state
+
+
+def route_stats() -> dict[str, dict]:
+    routes = configured_routes()
+    states = cache.get_many([_state_key(*route) for route in routes])
+    return {f"{provider}:{model}": states.get(_state_key(provider, model)) for provider, model in routes}
+
+
+def model_catalog(provider: str) -> set[str] | None:
+    """Model ids the provider currently serves, cached for ``LLM_MODEL_CATALOG_SECONDS``.
+
+    ``None`` when the catalog cannot be fetched; routing then trusts the configuration.
+    """
+    key = CATALOG_PREFIX + provider
+    cached = cache.get(key)
+    if cached is not None:
+        return set(cached) if cached else None
+    try:
+        models = sorted(get_provider("llm", provider).list_models())
+    except Exception:
+        cache.set(key, [], timeout=CATALOG_FAILURE_SECONDS)
+        return None
+    cache.set(key, models, timeout=int(getattr(settings, "LLM_MODEL_CATALOG_SECONDS", 3600)))
+    return set(models) if models else None
+
+
+def _in_catalog(provider: str, model: str) -> bool:
+    catalog = model_catalog(provider)
+    return catalog is None or model in catalog
+
+
+def _api_key(provider: str) -> str:
+    # Read from settings so routing decisions never import a provider SDK.
+    name = f"{provider.upper()}_API_KEY"
+    return getattr(settings, name, "") or os.getenv(name, "")
+
+
+def _state_key(provider: str, model: str) -> str:
+    return f"{STATE_PREFIX}{provider}:{model}"
@@ -0,0 +1,28 @@
+from .providers import ProviderNotConfigured, get_provider
+
+
+class LocalOcrUnavailable(Exception):
+    pass
+
+
+def tesseract_text(path: str) -> str:
+    try:
+        import pytesseract
+        from PIL import Image
+    except ImportError as exc:
+        raise LocalOcrUnavailable("Local OCR requires pytesseract and Pillow.") from exc
+
+    try:
+        with Image.open(path) as image:
+            # Lab sheets are tabular; treat the page as one uniform text block.
+            return pytesseract.image_to_string(image.convert("L"), config="--psm 6")
+    except pytesseract.TesseractNotFoundError as exc:
+        raise LocalOcrUnavailable("Tesseract binary is not installed.") from exc
+
+
+def local_ocr_text(engine: str, path: str) -> str:
+    try:
+        reader = get_provider("ocr", engine)
+    except ProviderNotConfigured as exc:
+        raise LocalOcrUnavailable(f"Unknown local OCR engine: {engine}") from exc
+    return reader(path)
@@ -0,0 +1,241 @@
+import gc
+import json
+import math
+import random
+import re
+import statistics
+import timeit
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from health.benchmarking import PARAMETERS_PER_REPORT, synthetic_context, synthetic_narrative, synthetic_report_text
+from health.guardrails.output_guardrails import validate_claims
+from health.guardrails.safety_language import validate_language
+from health.models import LabParameter, MedicalReport
+from health.services import _extract_report_notes, _parse_lines_to_parameters, fallback_analysis, prepare_llm_context
+
+
+REPORT_SIZES = (10, 100, 1000)
+HISTORY_LENGTHS = (5, 50)
+NARRATIVE_LENGTHS = (1000, 10000)
+DEFAULT_THRESHOLD = 0.25
+# A slowdown must exceed this many combined standard deviations of noise to count,
+# but noise never widens the allowed slowdown to more than twice the threshold.
+NOISE_SIGMAS = 3
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks the report parsing, context building, fallback analysis and guardrail hot paths "
+        "on synthetic inputs; compares ops/sec and peak allocations against stored baselines. "
+        "Timings are scaled by a fixed calibration workload so a slower machine is not a regression, "
+        "noisy cases get up to twice the threshold, and an apparent regression is measured again "
+        "before it is reported."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=7, help="Timing rounds per case; the median round is kept.")
+        parser.add_argument("--filter", default="", help="Only run cases whose name contains this text.")
+        parser.add_argument(
+            "--baseline",
+            default=str(Path(settings.BASE_DIR) / "benchmarks" / "baselines.json"),
+            help="Baseline file to compare against or update.",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=None,
+            help=f"Allowed slowdown or allocation growth as a fraction (default: the baseline file's, else {DEFAULT_THRESHOLD}).",
+        )
+        parser.add_argument("--check", action="store_true", help="Fail when a case regresses past the threshold.")
+        parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline.")
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        baseline_path = Path(options["baseline"])
+        baseline = _load_baseline(baseline_path)
+        threshold = options["threshold"]
+        if threshold is None:
+            threshold = float(baseline.get("threshold", DEFAULT_THRESHOLD))
+
+        repeat = max(1, options["repeat"])
+        # Baselines are compared relative to a fixed pure-Python workload so that a
+        # slower or busier machine does not read as a regression. It is measured
+        # before and after the cases so that load changes during the run even out.
+        calibration_runs = [measure(_calibration_workload, repeat=repeat)]
+
+        results = {}
+        with _synthetic_history_reports(options["seed"]) as reports_by_length:
+            cases = {
+                name: fn
+                for name, fn in _cases(reports_by_length, options["seed"])
+                if not options["filter"] or options["filter"] in name
+            }
+            if not cases:
+                raise CommandError(f"No benchmark case matches {options['filter']!r}.")
+            for name, fn in cases.items():
+                results[name] = measure(fn, repeat=repeat)
+            calibration_runs.append(measure(_calibration_workload, repeat=repeat))
+            calibration = {
+                "ops_per_sec": round(statistics.median(run["ops_per_sec"] for run in calibration_runs), 1),
+                "spread": max(run["spread"] for run in calibration_runs),
+            }
+            scale = (
+                calibration["ops_per_sec"] / baseline["calibration_ops_per_sec"]
+                if baseline.get("calibration_ops_per_sec")
+                else 1.0
+            )
+
+            regressions = []
+            for name, result in results.items():
+                previous = baseline.get("cases", {}).get(name)
+                if previous and _regressed(result, previous, scale, threshold, calibration["spread"]):
+                    # Confirm with a second measurement before calling it a regression;
+                    # a single noisy round should not fail the gate.
+                    retry = measure(cases[name], repeat=repeat)
+                    if retry["ops_per_sec"] > result["ops_per_sec"]:
+                        result = results[name] = retry
+                line = (
+                    f"{name:<32} {result['ops_per_sec']:>12,.1f} ops/s +/-{result['spread']:>4.0%} "
+                    f"{result['peak_kib']:>10,.1f} KiB peak"
+                )
+                if previous:
+                    speed, memory = _changes(result, previous, scale)
+                    line += f"  ({speed:+.0%} speed, {memory:+.0%} memory)"
+                    if _regressed(result, previous, scale, threshold, calibration["spread"]):
+                        regressions.append(name)
+                        line += "  REGRESSION"
+                self.stdout.write(line)
+
+        if options["update_baseline"]:
+            merged = {**baseline.get("cases", {}), **results}
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(baseline_path, "w", encoding="utf-8") as handle:
+                json.dump(
+                    {
+                        "threshold": threshold,
+                        "calibration_ops_per_sec": calibration["ops_per_sec"],
+                        "cases": dict(sorted(merged.items())),
+                    },
+                    handle,
+                    indent=2,
+                )
+                handle.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"Baseline for {len(results)} cases written to {baseline_path}."))
+
+        if options["check"] and regressions:
+            raise CommandError(
+                f"{len(regressions)} hot path(s) regressed by more than {threshold:.0%}: {', '.join(regressions)}"
+            )
+
+
+def _regressed(result: dict, previous: dict, scale: float, threshold: float, calibration_spread: float) -> bool:
+    speed, memory = _changes(result, previous, scale)
+    return speed < -allowed_slowdown(result, previous, threshold, calibration_spread) or memory > threshold
+
+
+def _changes(result: dict, previous: dict, scale: float) -> tuple[float, float]:
+    speed = result["ops_per_sec"] / (previous["ops_per_sec"] * scale) - 1
+    memory = result["peak_kib"] / previous["peak_kib"] - 1 if previous["peak_kib"] else 0.0
+    return speed, memory
+
+
+def allowed_slowdown(result: dict, previous: dict, threshold: float, calibration_spread: float = 0.0) -> float:
+    """The threshold, widened to ``NOISE_SIGMAS`` times the combined measured noise, at most doubled."""
+    noise = math.sqrt(result.get("spread", 0.0) ** 2 + previous.get("spread", 0.0) ** 2 + calibration_spread**2)
+    return min(2 * threshold, max(threshold, NOISE_SIGMAS * noise))
+
+
+def _load_baseline(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as handle:
+        try:
+            return json.load(handle)
+        except ValueError as exc:
+            raise CommandError(f"Baseline {path} is not valid JSON: {exc}") from exc
+
+
+def _calibration_workload():
+    rng = random.Random(0)
+    values = sorted(rng.random() for _ in range(2000))
+    text = " ".join(f"{value:.3f}" for value in values)
+    return len(re.findall(r"\d+\.\d+", text))
+
+
+def measure(fn, repeat: int = 7) -> dict:
+    """Median throughput over ``repeat`` rounds, its relative spread and the peak traced allocation of one call.
+
+    ``spread`` is the coefficient of variation of the rounds, used to widen the
+    regression threshold for noisy cases.
+    """
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    rounds = [seconds / number for seconds in timer.repeat(repeat=repeat, number=number)]
+    median = statistics.median(rounds)
+    spread = statistics.stdev(rounds) / statistics.fmean(rounds) if len(rounds) > 1 else 0.0
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"ops_per_sec": round(1 / median, 1), "spread": round(spread, 3), "peak_kib": round(peak / 1024, 1)}
+
+
+def _cases(reports_by_length: dict, seed: int):
+    for size in REPORT_SIZES:
+        text = synthetic_report_text(size, seed)
+        yield f"parse_lines/report={size}", lambda text=text: _parse_lines_to_parameters(text)
+        # Note extraction stops after six notes (one per ten synthetic lines), so sizes of
+        # 100 and up scan about the same 60 lines and run at about the same rate.
+        yield f"extract_notes/report={size}", lambda text=text: _extract_report_notes(text)
+    for length in HISTORY_LENGTHS:
+        report = reports_by_length[length]
+        context = synthetic_context(length, seed)
+        yield f"prepare_context/history={length}", lambda report=report: prepare_llm_context(report)
+        yield f"fallback_analysis/history={length}", lambda context=context: fallback_analysis(context)
+    parameters = synthetic_context(1, seed)["reports"][0]["parameters"]
+    for length in NARRATIVE_LENGTHS:
+        narrative = synthetic_narrative(length, seed)
+        yield f"validate_claims/narrative={length}", lambda text=narrative: validate_claims(text, parameters)
+        yield f"validate_language/narrative={length}", lambda text=narrative: validate_language(text)
+
+
+@contextmanager
+def _synthetic_history_reports(seed: int):
+    """Seed one throwaway user per history length and roll everything back on exit.
+
+    Yields the latest report of each user, keyed by history length.
+    """
+    context = synthetic_context(max(HISTORY_LENGTHS), seed)
+    with transaction.atomic():
+        latest = {}
+        for length in HISTORY_LENGTHS:
+            user = User.objects.create_user(username=f"benchmark-{seed}-{length}")
+            reports = MedicalReport.objects.bulk_create(
+                [
+                    MedicalReport(user=user, report_date=item["date"], ocr_text=synthetic_report_text(PARAMETERS_PER_REPORT))
+                    for item in context["reports"][:length]
+                ]
+            )
+            LabParameter.objects.bulk_create(
+                [
+                    LabParameter(report=report, **parameter)
+                    for report, item in zip(reports, context["reports"])
+                    for parameter in item["parameters"]
+                ]
+            )
+            latest[length] = reports[-1]
+        try:
+            yield latest
+        finally:
+            transaction.set_rollback(True)
@@ -0,0 +1,67 @@
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# What a cold process imports before it can do its job.
+TARGETS = {
+    "worker": "import backend.wsgi, backend.urls",
+    "manage.py (any command)": "import django; django.setup()",
+    "manage.py check_groq": (
+        "import django; django.setup(); "
+        "from django.core.management import load_command_class; load_command_class('health', 'check_groq')"
+    ),
+    "manage.py loadtest": (
+        "import django; django.setup(); "
+        "from django.core.management import load_command_class; load_command_class('health', 'loadtest')"
+    ),
+}
+# Heavy third-party packages worth knowing about when they show up at startup.
+WATCHED_PACKAGES = ("requests", "numpy", "PIL", "edge_tts", "google.generativeai", "pyarrow", "pypdf", "pypdfium2")
+
+
+class Command(BaseCommand):
+    help = "Measures cold-process import time for a web worker and selected management commands."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=5, help="Cold processes per target; the median is reported.")
+        parser.add_argument("--target", action="append", choices=sorted(TARGETS), help="Limit to these targets.")
+
+    def handle(self, *args, **options):
+        for name in options["target"] or TARGETS:
+            runs = [_import_profile(TARGETS[name]) for _ in range(max(1, options["repeat"]))]
+            total_ms = statistics.median(run["total_ms"] for run in runs)
+            loaded = [package for package in WATCHED_PACKAGES if package in runs[-1]["modules"]]
+            self.stdout.write(
+                f"{name:<24} {total_ms:>8.1f} ms  {len(runs[-1]['modules']):>5} modules  "
+                f"heavy: {', '.join(loaded) or '-'}"
+            )
+
+
+def _import_profile(statement: str) -> dict:
+    """Run ``statement`` in a fresh interpreter under ``-X importtime``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=settings.BASE_DIR,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "backend.settings"},
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode:
+        raise CommandError(f"Import of {statement!r} failed:\n{completed.stderr[-2000:]}")
+
+    total_us, modules = 0, set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        total_us += int(self_us)
+        modules.add(module.strip())
+    return {"total_ms": total_us / 1000, "modules": modules}
+
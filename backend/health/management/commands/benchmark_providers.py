@@ -0,0 +1,213 @@
+import base64
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from health import llm_router
+from health.benchmarking import synthetic_context, synthetic_report_text
+from health.provider_stub import StubBehavior, running_stub
+from health.providers import ProviderNotConfigured, get_provider
+from health.services import build_analysis_payload, build_vision_ocr_payload
+
+
+WORKLOADS = ("analysis", "ocr")
+
+
+class Command(BaseCommand):
+    help = (
+        "Replays representative analysis and OCR requests against each configured provider/model at "
+        "increasing concurrency; reports TTFB, latency percentiles, tokens/sec and error and 429 rates. "
+        "Requests are streamed so time to first token can be measured. Calls bypass the shared Groq "
+        "quota and retries, so run it against a key that is not serving users."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workload", action="append", choices=WORKLOADS, help="Default: all workloads.")
+        parser.add_argument(
+            "--route",
+            action="append",
+            help="provider:model to benchmark. Default: LLM_ROUTES for analysis and Groq with GROQ_VISION_MODEL for OCR.",
+        )
+        parser.add_argument("--concurrency", default="1,4,8", help="Comma-separated concurrency levels.")
+        parser.add_argument("--requests", type=int, default=8, help="Requests per level (at least the concurrency).")
+        parser.add_argument("--history", type=int, default=5, help="Reports in the synthetic analysis context.")
+        parser.add_argument("--timeout", type=float, default=60.0)
+        parser.add_argument("--stub", action="store_true", help="Run against an in-process provider stub.")
+        parser.add_argument("--stub-latency-ms", type=float, default=300.0)
+        parser.add_argument("--stub-rate-limit-rate", type=float, default=0.0)
+        parser.add_argument("--output", default="", help="Also write the results as JSON here.")
+
+    def handle(self, *args, **options):
+        try:
+            levels = sorted({max(1, int(level)) for level in options["concurrency"].split(",") if level.strip()})
+        except ValueError as exc:
+            raise CommandError("--concurrency must be comma-separated integers.") from exc
+
+        with ExitStack() as stack:
+            if options["stub"]:
+                behavior = StubBehavior(
+                    latency_ms=options["stub_latency_ms"],
+                    spread_ms=options["stub_latency_ms"] / 3,
+                    distribution="lognormal",
+                    rate_limit_rate=options["stub_rate_limit_rate"],
+                )
+                server = stack.enter_context(running_stub(behavior))
+                stack.enter_context(
+                    override_settings(**server.provider_settings(), GROQ_API_KEY="stub", GEMINI_API_KEY="stub")
+                )
+            results = []
+            for workload in options["workload"] or WORKLOADS:
+                payload = _payload(workload, options["history"])
+                for provider, model in _routes(workload, options["route"]):
+                    try:
+                        url, headers = get_provider("llm", provider).chat_request()
+                    except ProviderNotConfigured as exc:
+                        raise CommandError(str(exc)) from exc
+                    for level in levels:
+                        calls = [
+                            (url, headers, {**payload, "model": model}, options["timeout"])
+                            for _ in range(max(options["requests"], level))
+                        ]
+                        started = time.perf_counter()
+                        with ThreadPoolExecutor(max_workers=level) as pool:
+                            samples = list(pool.map(lambda call: timed_call(*call), calls))
+                        summary = {
+                            "workload": workload,
+                            "route": f"{provider}:{model}",
+                            "concurrency": level,
+                            **summarize(samples, time.perf_counter() - started),
+                        }
+                        results.append(summary)
+                        self.stdout.write(_format_row(summary))
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                json.dump({"stub": options["stub"], "results": results}, handle, indent=2)
+                handle.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"{len(results)} results written to {options['output']}."))
+
+
+def _routes(workload: str, explicit: list[str] | None) -> list[tuple[str, str]]:
+    if explicit:
+        routes = []
+        for entry in explicit:
+            provider, _, model = entry.partition(":")
+            if not provider or not model:
+                raise CommandError(f"Route {entry!r} must look like provider:model.")
+            routes.append((provider.strip().lower(), model.strip()))
+        return routes
+    if workload == "analysis":
+        routes = llm_router.configured_routes()
+    else:
+        vision = str(getattr(settings, "GROQ_VISION_MODEL", "") or "").split(",")[0].strip()
+        # Vision OCR only runs on Groq.
+        routes = [("groq", vision)] if vision and get_provider("llm", "groq").is_configured() else []
+    if not routes:
+        raise CommandError(f"No configured provider for the {workload} workload; set an API key or use --stub.")
+    return routes
+
+
+def _payload(workload: str, history: int) -> dict:
+    if workload == "analysis":
+        return build_analysis_payload(synthetic_context(max(1, history)))
+    return build_vision_ocr_payload(_report_image_data_url())
+
+
+def _report_image_data_url() -> str:
+    """A rendered lab sheet, roughly the size of a phone photo after upload."""
+    from PIL import Image, ImageDraw
+
+    lines = synthetic_report_text(30).splitlines()
+    image = Image.new("RGB", (1200, 40 * len(lines) + 80), "white")
+    draw = ImageDraw.Draw(image)
+    for index, line in enumerate(lines):
+        draw.text((40, 40 + index * 40), line, fill="black")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def timed_call(url: str, headers: dict, payload: dict, timeout: float) -> dict:
+    """One streamed chat completion: status, time to first token, total time and output tokens."""
+    body = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+    started = time.perf_counter()
+    sample = {"status": None, "ttfb": None, "latency": 0.0, "tokens": 0, "tokens_estimated": False}
+    try:
+        with requests.post(url, headers=headers, json=body, stream=True, timeout=timeout) as response:
+            sample["status"] = response.status_code
+            if response.status_code != 200:
+                return {**sample, "latency": time.perf_counter() - started}
+            characters, usage = 0, None
+            for line in response.iter_lines():
+                if not line.startswith(b"data: "):
+                    continue
+                if sample["ttfb"] is None:
+                    sample["ttfb"] = time.perf_counter() - started
+                data = line[len(b"data: ") :]
+                if data == b"[DONE]":
+                    break
+                chunk = json.loads(data)
+                for choice in chunk.get("choices") or []:
+                    characters += len((choice.get("delta") or {}).get("content") or "")
+                # OpenAI-style usage chunk, or Groq's x_groq block on the last chunk.
+                usage = chunk.get("usage") or (chunk.get("x_groq") or {}).get("usage") or usage
+    except (requests.RequestException, ValueError) as exc:
+        return {**sample, "error": str(exc), "latency": time.perf_counter() - started}
+
+    sample["latency"] = time.perf_counter() - started
+    if usage and usage.get("completion_tokens"):
+        sample["tokens"] = int(usage["completion_tokens"])
+    else:
+        sample["tokens"], sample["tokens_estimated"] = max(1, characters // 4) if characters else 0, True
+    return sample
+
+
+def summarize(samples: list[dict], elapsed: float) -> dict:
+    ok = [sample for sample in samples if sample["status"] == 200]
+    rate_limited = sum(1 for sample in samples if sample["status"] == 429)
+    errors = len(samples) - len(ok) - rate_limited
+    generation = [
+        sample["tokens"] / (sample["latency"] - sample["ttfb"])
+        for sample in ok
+        if sample["ttfb"] is not None and sample["latency"] > sample["ttfb"] and sample["tokens"]
+    ]
+    return {
+        "requests": len(samples),
+        "ok": len(ok),
+        "rate_limited": rate_limited,
+        "errors": errors,
+        "rate_limited_rate": round(rate_limited / len(samples), 4),
+        "error_rate": round(errors / len(samples), 4),
+        "ttfb_ms": _percentiles([sample["ttfb"] for sample in ok if sample["ttfb"] is not None]),
+        "latency_ms": _percentiles([sample["latency"] for sample in ok]),
+        "tokens_per_sec": round(sum(sample["tokens"] for sample in ok) / elapsed, 1) if elapsed else 0.0,
+        "per_request_tokens_per_sec": round(float(np.median(generation)), 1) if generation else None,
+        "tokens_estimated": any(sample["tokens_estimated"] for sample in ok),
+    }
+
+
+def _percentiles(seconds: list[float]) -> dict:
+    if not seconds:
+        return {}
+    p50, p95, p99 = np.percentile(np.asarray(seconds) * 1000.0, [50, 95, 99])
+    return {"p50": round(float(p50), 1), "p95": round(float(p95), 1), "p99": round(float(p99), 1)}
+
+
+def _format_row(summary: dict) -> str:
+    ttfb = summary["ttfb_ms"].get("p50", float("nan"))
+    latency = summary["latency_ms"]
+    return (
+        f"{summary['workload']:<9} {summary['route']:<36} c={summary['concurrency']:<3} "
+        f"ok {summary['ok']}/{summary['requests']} 429 {summary['rate_limited_rate']:.0%} err {summary['error_rate']:.0%}  "
+        f"ttfb p50 {ttfb:.0f} ms  latency p50/p95/p99 {latency.get('p50', float('nan')):.0f}/"
+        f"{latency.get('p95', float('nan')):.0f}/{latency.get('p99', float('nan')):.0f} ms  "
+        f"{summary['tokens_per_sec']} tok/s"
+    )
@@ -0,0 +1,49 @@
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+
+from health.trends import compute_trend_statistics
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the vectorized trend engine on a synthetic long user history."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--points", type=int, default=10000, help="Total data points in the history.")
+        parser.add_argument("--parameters", type=int, default=40, help="Distinct lab parameters.")
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        rows = synthetic_history(options["points"], options["parameters"], options["seed"])
+        timings = []
+        for _ in range(max(1, options["repeat"])):
+            started = time.perf_counter()
+            stats = compute_trend_statistics(rows)
+            timings.append(time.perf_counter() - started)
+
+        best = min(timings)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(rows)} points / {len(stats)} parameters: "
+                f"best {best * 1000:.1f} ms, median {sorted(timings)[len(timings) // 2] * 1000:.1f} ms "
+                f"({len(rows) / best:,.0f} points/s)"
+            )
+        )
+
+
+def synthetic_history(points: int, parameters: int, seed: int = 7) -> list[tuple]:
+    rng = random.Random(seed)
+    per_parameter = max(1, points // max(1, parameters))
+    start = date(2010, 1, 1)
+    rows = []
+    for index in range(parameters):
+        name = f"Marker {index:03d}"
+        base = rng.uniform(5, 200)
+        drift = rng.uniform(-0.02, 0.02) * base
+        for step in range(per_parameter):
+            value = base + drift * step + rng.gauss(0, base * 0.03)
+            rows.append((name, start + timedelta(days=7 * step), value, base * 0.85, base * 1.15))
+    return rows
@@ -1,6 +1,5 @@
 import os
 
-import google.generativeai as genai
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
@@ -14,6 +13,10 @@ class Command(BaseCommand):
         api_key = getattr(settings, "GEMINI_API_KEY", "") or os.getenv("GEMINI_API_KEY", "")
         if not api_key:
             raise CommandError("GEMINI_API_KEY not set.")
+        try:
+            import google.generativeai as genai
+        except ImportError as exc:
+            raise CommandError("google-generativeai is not installed.") from exc
 
         try:
             genai.configure(api_key=api_key)
@@ -4,6 +4,8 @@ import requests
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
+from health.providers.groq import chat_completions_url
+
 
 class Command(BaseCommand):
     help = "Checks if GROQ_API_KEY is configured and Groq API is reachable."
@@ -16,7 +18,7 @@ class Command(BaseCommand):
         model = getattr(settings, "GROQ_MODEL", "llama-3.1-8b-instant")
         try:
             response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
+                chat_completions_url(),
                 headers={
                     "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json",
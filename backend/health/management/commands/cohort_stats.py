@@ -0,0 +1,50 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from health.cohorts import DIMENSIONS, cohort_statistics
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints the distribution of a lab parameter across users (latest reading each, one table per unit) "
+        "by location type, age band and diet type."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--parameter", default="HbA1c")
+        parser.add_argument("--bins", type=int, default=40, help="Fixed histogram bins across the observed range.")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Rows fetched per database round trip.")
+        parser.add_argument("--refresh", action="store_true", help="Ignore today's cached result.")
+        parser.add_argument("--json", action="store_true", help="Print the full result, histograms included.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        stats = cohort_statistics(
+            options["parameter"],
+            bins=max(1, options["bins"]),
+            chunk_size=max(1, options["chunk_size"]),
+            refresh=options["refresh"],
+        )
+        elapsed = time.perf_counter() - started
+
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, indent=2))
+            return
+
+        self.stdout.write(f"{stats['parameter']}: {stats['users']} users ({stats['generated_on']})")
+        for unit, data in stats["units"].items():
+            self.stdout.write(f"\n[{unit}] {data['users']} users")
+            for dimension in ("all",) + DIMENSIONS:
+                groups = data["groups"][dimension]
+                if not groups:
+                    continue
+                self.stdout.write(f"{dimension}")
+                for label, summary in groups.items():
+                    p = summary["percentiles"]
+                    self.stdout.write(
+                        f"  {label:<12} n={summary['count']:<8} mean={summary['mean']:<8} "
+                        f"p10={p['p10']} p50={p['p50']} p90={p['p90']}"
+                    )
+        self.stdout.write(self.style.SUCCESS(f"\nDone in {elapsed * 1000:.1f} ms"))
@@ -0,0 +1,301 @@
+import io
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import date, timedelta
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import numpy as np
+import requests
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from health.models import MedicalReport
+from health.provider_stub import StubBehavior, running_stub
+
+
+USERNAME_PREFIX = "loadtest-"
+REPORT_LINES = (
+    "Hemoglobin {hb:.1f} g/dL 12-16",
+    "WBC {wbc} cells/uL 4000-11000",
+    "Platelets {plt} 10^3/uL 150-400",
+    "Fasting Glucose {glucose} mg/dL 70-100",
+    "Doctor advice: repeat CBC after 4 weeks and keep hydration adequate.",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulates concurrent users uploading text and image reports, viewing dashboards and "
+        "reports, and calling translate and TTS; prints per-endpoint latency percentiles, "
+        "throughput and error rates as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users.")
+        parser.add_argument("--iterations", type=int, default=5, help="Upload/view cycles per user.")
+        parser.add_argument("--image-every", type=int, default=2, help="Also upload an image every N cycles (0 disables).")
+        parser.add_argument(
+            "--base-url",
+            default="",
+            help="Target a running server instead of an in-process one. Providers are then whatever that server uses.",
+        )
+        parser.add_argument(
+            "--provider-latency-ms",
+            type=float,
+            default=200.0,
+            help="Latency of the in-process Groq, translation and TTS stubs.",
+        )
+        parser.add_argument("--output", default="", help="Write the JSON report here instead of stdout.")
+        parser.add_argument("--keep-data", action="store_true", help="Keep in-process load-test users and reports.")
+
+    def handle(self, *args, **options):
+        users = max(1, options["users"])
+        run_id = uuid.uuid4().hex[:8]
+        latency = max(0.0, options["provider_latency_ms"]) / 1000.0
+
+        with ExitStack() as stack:
+            base_url = options["base_url"].rstrip("/")
+            if not base_url:
+                stack.enter_context(_stub_providers(latency))
+                base_url = stack.enter_context(_InProcessServer())
+            recorder = Recorder()
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=users) as pool:
+                futures = [
+                    pool.submit(
+                        VirtualUser(base_url, f"{USERNAME_PREFIX}{run_id}-{index}", recorder).run,
+                        options["iterations"],
+                        options["image_every"],
+                    )
+                    for index in range(users)
+                ]
+                for future in futures:
+                    future.result()
+            elapsed = time.perf_counter() - started
+
+        if not options["base_url"] and not options["keep_data"]:
+            _delete_run_data(run_id)
+
+        report = {
+            "started_at": timezone.now().isoformat(),
+            "target": options["base_url"] or "in-process",
+            "users": users,
+            "iterations": options["iterations"],
+            "provider_latency_ms": None if options["base_url"] else options["provider_latency_ms"],
+            "duration_seconds": round(elapsed, 3),
+            **recorder.summary(elapsed),
+        }
+        text = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                handle.write(text + "\n")
+            totals = report["totals"]
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{totals['requests']} requests in {elapsed:.1f}s ({totals['throughput_rps']} req/s, "
+                    f"error rate {totals['error_rate']:.1%}); report written to {options['output']}."
+                )
+            )
+        else:
+            self.stdout.write(text)
+
+
+class Recorder:
+    """Thread-safe latency and outcome samples per endpoint."""
+
+    def __init__(self):
+        self._samples: dict[str, list[tuple[float, bool]]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._samples.setdefault(endpoint, []).append((seconds, ok))
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {name: _describe(samples, elapsed) for name, samples in sorted(self._samples.items())}
+        everything = [sample for samples in self._samples.values() for sample in samples]
+        return {"endpoints": endpoints, "totals": _describe(everything, elapsed)}
+
+
+def _describe(samples: list[tuple[float, bool]], elapsed: float) -> dict:
+    if not samples:
+        return {"requests": 0, "errors": 0, "error_rate": 0.0, "throughput_rps": 0.0, "latency_ms": {}}
+    latencies = np.asarray([seconds for seconds, _ in samples]) * 1000.0
+    errors = sum(1 for _, ok in samples if not ok)
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(float(p50), 1),
+            "p95": round(float(p95), 1),
+            "p99": round(float(p99), 1),
+            "mean": round(float(latencies.mean()), 1),
+            "max": round(float(latencies.max()), 1),
+        },
+    }
+
+
+class VirtualUser:
+    """One browser session walking the upload-to-analysis flow."""
+
+    def __init__(self, base_url: str, username: str, recorder: Recorder):
+        self.base_url = base_url
+        self.username = username
+        self.recorder = recorder
+        self.session = requests.Session()
+
+    def run(self, iterations: int, image_every: int) -> None:
+        if not self._signup():
+            return
+        for iteration in range(iterations):
+            self._request("dashboard", "GET", "/")
+            report_url = self._upload_text(iteration)
+            if report_url:
+                self._request("report_detail", "GET", report_url)
+            if image_every and iteration % image_every == 0:
+                self._upload_image(iteration)
+            self._post_json("translate", "/health/translate/", {"text": "Hemoglobin is stable.", "target_lang": "hi-IN"})
+            self._post_json("tts", "/health/tts/", {"text": "Hemoglobin is stable.", "target_lang": "en-IN"})
+
+    def _signup(self) -> bool:
+        self.session.get(self.base_url + "/signup/", timeout=60)
+        password = uuid.uuid4().hex + "Aa1!"
+        response = self._request(
+            "signup",
+            "POST",
+            "/signup/",
+            data={
+                "username": self.username,
+                "email": f"{self.username}@example.com",
+                "password1": password,
+                "password2": password,
+                "age": 40,
+                "location_type": "urban",
+            },
+        )
+        return response is not None and response.status_code == 302
+
+    def _upload_text(self, iteration: int) -> str | None:
+        values = {"hb": 11.5 + iteration * 0.1, "wbc": 6000 + iteration * 50, "plt": 220 + iteration, "glucose": 95 + iteration}
+        response = self._request(
+            "upload_text",
+            "POST",
+            "/health/upload/",
+            data={
+                "report_date": (date(2024, 1, 1) + timedelta(days=30 * iteration)).isoformat(),
+                "ocr_text": "\n".join(line.format(**values) for line in REPORT_LINES),
+            },
+        )
+        if response is None or response.status_code != 302:
+            return None
+        return response.headers.get("Location")
+
+    def _upload_image(self, iteration: int) -> None:
+        self._request(
+            "upload_image",
+            "POST",
+            "/health/upload/",
+            data={"report_date": (date(2024, 1, 15) + timedelta(days=30 * iteration)).isoformat()},
+            files={"report_file": (f"report-{iteration}.png", _report_image(self.username, iteration), "image/png")},
+        )
+
+    def _post_json(self, endpoint: str, path: str, payload: dict) -> None:
+        self._request(
+            endpoint,
+            "POST",
+            path,
+            data=json.dumps(payload),
+            headers={"Content-Type": "application/json", "X-CSRFToken": self.session.cookies.get("csrftoken", "")},
+        )
+
+    def _request(self, endpoint: str, method: str, path: str, **kwargs):
+        url = path if path.startswith("http") else self.base_url + path
+        if method == "POST" and "data" in kwargs and isinstance(kwargs["data"], dict):
+            kwargs["data"] = {**kwargs["data"], "csrfmiddlewaretoken": self.session.cookies.get("csrftoken", "")}
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, allow_redirects=False, timeout=120, **kwargs)
+        except requests.RequestException:
+            self.recorder.record(endpoint, time.perf_counter() - started, False)
+            return None
+        self.recorder.record(endpoint, time.perf_counter() - started, response.status_code < 400)
+        return response
+
+
+def _report_image(username: str, iteration: int) -> bytes:
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError as exc:
+        raise CommandError("Image uploads require Pillow.") from exc
+
+    # Unique text per user and cycle so content-hash dedup does not short-circuit the upload.
+    image = Image.new("RGB", (600, 400), "white")
+    draw = ImageDraw.Draw(image)
+    for row, line in enumerate(REPORT_LINES[:3]):
+        draw.text((20, 30 + row * 40), line.format(hb=12.0, wbc=7000, plt=240, glucose=90), fill="black")
+    draw.text((20, 360), f"{username} #{iteration}", fill="black")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class _InProcessServer:
+    """Serve the project on an ephemeral localhost port for the duration of the block."""
+
+    def __enter__(self) -> str:
+        self.server = make_server(
+            "127.0.0.1", 0, get_wsgi_application(), server_class=_ThreadingWSGIServer, handler_class=_QuietHandler
+        )
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+def _delete_run_data(run_id: str) -> None:
+    """Remove the run's users, their reports and the uploaded report files."""
+    users = User.objects.filter(username__startswith=f"{USERNAME_PREFIX}{run_id}-")
+    for report in MedicalReport.objects.filter(user__in=users).exclude(report_file=""):
+        report.report_file.delete(save=False)
+    users.delete()
+
+
+def _stub_providers(latency: float) -> ExitStack:
+    """Point Groq, Google Translate and TTS at a fixed-latency local provider stub."""
+    stack = ExitStack()
+    server = stack.enter_context(running_stub(StubBehavior(latency_ms=latency * 1000.0)))
+    stack.enter_context(
+        override_settings(
+            **server.provider_settings(),
+            GROQ_API_KEY="loadtest",
+            GROQ_REQUESTS_PER_MINUTE=0,
+            GROQ_TOKENS_PER_MINUTE=0,
+            OCR_LOCAL_ENGINE="",
+            ALLOWED_HOSTS=["127.0.0.1", "localhost"],
+        )
+    )
+    return stack
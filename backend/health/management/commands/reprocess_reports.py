@@ -0,0 +1,233 @@
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from health.models import MedicalReport
+from health.services import process_report
+
+
+SELECTION_OPTIONS = ("user", "report", "since", "until", "analyzed_before", "incomplete")
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-runs process_report over the selected reports, oldest first, with a bounded worker pool, "
+        "checkpointing progress so an interrupted run resumes where it stopped and retries failed reports."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", action="append", help="User id or username; repeat for several.")
+        parser.add_argument("--report", action="append", type=int, help="Report id; repeat for several.")
+        parser.add_argument("--since", help="Reports dated on or after YYYY-MM-DD.")
+        parser.add_argument("--until", help="Reports dated on or before YYYY-MM-DD.")
+        parser.add_argument(
+            "--analyzed-before",
+            help="Reports whose analysis is older than this ISO date/time, or that have none.",
+        )
+        parser.add_argument("--incomplete", action="store_true", help="Only reports without a completed analysis.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=int(getattr(settings, "REPROCESS_WORKERS", 4)),
+            help="Reports processed at once (use 1 on SQLite). Provider calls still wait on the shared rate limit.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=str(Path(settings.BASE_DIR) / "reprocess_checkpoint.json"),
+            help="Progress file; removed once every selected report succeeded.",
+        )
+        parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+        parser.add_argument("--progress-seconds", type=float, default=10.0, help="Seconds between progress lines.")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the selected reports.")
+        parser.add_argument(
+            "--all-stages",
+            action="store_true",
+            help="Re-run every pipeline stage instead of reusing stored stage outputs.",
+        )
+
+    def handle(self, *args, **options):
+        selection = {name: options[name] for name in SELECTION_OPTIONS}
+        report_ids = list(_select(selection).values_list("id", flat=True))
+        if options["dry_run"]:
+            self.stdout.write(f"{len(report_ids)} reports selected.")
+            return
+
+        self._reprocess(report_ids, selection, options)
+
+    def _reprocess(self, report_ids: list[int], selection: dict, options: dict) -> None:
+        # None keeps the PIPELINE_STAGE_CACHE default; --all-stages turns it off for this run only.
+        use_stage_cache = False if options["all_stages"] else None
+        checkpoint_path = Path(options["checkpoint"])
+        checkpoint = _load_checkpoint(checkpoint_path, selection, restart=options["restart"])
+        done = set(checkpoint["done"])
+        pending = [report_id for report_id in report_ids if report_id not in done]
+        if done:
+            self.stdout.write(f"Resuming: {len(report_ids) - len(pending)} of {len(report_ids)} already processed.")
+        if not pending:
+            self.stdout.write(self.style.SUCCESS("Nothing to reprocess."))
+            checkpoint_path.unlink(missing_ok=True)
+            return
+
+        progress = _Progress(self.stdout, total=len(pending), interval=options["progress_seconds"])
+        workers = max(1, options["workers"])
+        interrupted = False
+        checkpoint["failed"] = {}
+
+        # Only ``workers`` reports are in flight at a time, so an interrupt loses at most that much work.
+        queue = iter(pending)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            in_flight = {}
+            try:
+                while True:
+                    while len(in_flight) < workers:
+                        report_id = next(queue, None)
+                        if report_id is None:
+                            break
+                        in_flight[pool.submit(_reprocess_one, report_id, use_stage_cache)] = report_id
+                    if not in_flight:
+                        break
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        report_id = in_flight.pop(future)
+                        error = future.result()
+                        if error is None:
+                            checkpoint["done"].append(report_id)
+                        else:
+                            checkpoint["failed"][str(report_id)] = error
+                        _write_checkpoint(checkpoint_path, checkpoint)
+                        progress.step(failed=error is not None)
+            except KeyboardInterrupt:
+                interrupted = True
+                self.stdout.write("Interrupted; finishing reports already in flight.")
+                pool.shutdown(wait=True, cancel_futures=True)
+                for future, report_id in in_flight.items():
+                    if not future.cancelled() and future.result() is None:
+                        checkpoint["done"].append(report_id)
+                _write_checkpoint(checkpoint_path, checkpoint)
+
+        progress.report(final=True)
+        failed = checkpoint["failed"]
+        for report_id, error in failed.items():
+            self.stderr.write(f"Report {report_id}: {error}")
+        if interrupted or failed:
+            self.stdout.write(f"Checkpoint kept at {checkpoint_path}; run the same command again to resume.")
+            if failed:
+                raise CommandError(f"{len(failed)} reports failed.")
+            return
+        checkpoint_path.unlink(missing_ok=True)
+        self.stdout.write(self.style.SUCCESS(f"Reprocessed {progress.completed} reports."))
+
+
+def _select(selection: dict):
+    reports = MedicalReport.objects.all()
+    if selection["user"]:
+        ids = [value for value in selection["user"] if value.isdigit()]
+        names = [value for value in selection["user"] if not value.isdigit()]
+        reports = reports.filter(user_id__in=ids) | reports.filter(user__username__in=names)
+    if selection["report"]:
+        reports = reports.filter(id__in=selection["report"])
+    if selection["since"]:
+        reports = reports.filter(report_date__gte=_parse_day(selection["since"], "--since"))
+    if selection["until"]:
+        reports = reports.filter(report_date__lte=_parse_day(selection["until"], "--until"))
+    if selection["analyzed_before"]:
+        try:
+            moment = parse_datetime(selection["analyzed_before"])
+        except ValueError:
+            moment = None
+        if moment is None:
+            day = _parse_day(selection["analyzed_before"], "--analyzed-before")
+            moment = datetime.combine(day, datetime.min.time())
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        reports = reports.filter(analysis__updated_at__lt=moment) | reports.filter(analysis__isnull=True)
+    if selection["incomplete"]:
+        reports = reports.filter(analysis_completed=False)
+    # Oldest first, so a newer report's context sees its reprocessed history where possible.
+    return reports.order_by("report_date", "created_at", "id")
+
+
+def _parse_day(value: str, option: str) -> date:
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise CommandError(f"{option} must be YYYY-MM-DD.")
+    return parsed
+
+
+def _reprocess_one(report_id: int, use_stage_cache: bool | None) -> str | None:
+    try:
+        process_report(report_id, use_stage_cache=use_stage_cache)
+    except MedicalReport.DoesNotExist:
+        return "report no longer exists"
+    except Exception as exc:
+        return f"{type(exc).__name__}: {exc}"
+    finally:
+        connections.close_all()
+    return None
+
+
+def _load_checkpoint(path: Path, selection: dict, restart: bool) -> dict:
+    fresh = {"selection": selection, "done": [], "failed": {}}
+    if restart or not path.exists():
+        return fresh
+    try:
+        with open(path, encoding="utf-8") as handle:
+            stored = json.load(handle)
+    except (OSError, ValueError) as exc:
+        raise CommandError(f"Cannot read checkpoint {path}: {exc}. Use --restart to discard it.") from exc
+    if stored.get("selection") != selection:
+        raise CommandError(f"Checkpoint {path} was written for a different selection. Use --restart to discard it.")
+    return {**fresh, "done": list(stored.get("done", []))}
+
+
+def _write_checkpoint(path: Path, checkpoint: dict) -> None:
+    # Write-then-rename so a crash mid-write never leaves a truncated checkpoint.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump(checkpoint, handle)
+    os.replace(temporary, path)
+
+
+class _Progress:
+    def __init__(self, stdout, total: int, interval: float):
+        self.stdout = stdout
+        self.total = total
+        self.interval = interval
+        self.completed = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self.last_report = self.started
+
+    def step(self, failed: bool) -> None:
+        if failed:
+            self.failed += 1
+        else:
+            self.completed += 1
+        if time.perf_counter() - self.last_report >= self.interval:
+            self.report()
+
+    def report(self, final: bool = False) -> None:
+        now = time.perf_counter()
+        self.last_report = now
+        elapsed = now - self.started
+        finished = self.completed + self.failed
+        rate = finished / elapsed if elapsed else 0.0
+        remaining = self.total - finished
+        eta = f"{remaining / rate:.0f}s" if rate and not final else "-"
+        self.stdout.write(
+            f"{finished}/{self.total} reports ({self.failed} failed)  {rate * 60:.1f} reports/min  "
+            f"elapsed {elapsed:.0f}s  ETA {eta}"
+        )
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from health.provider_stub import LATENCY_DISTRIBUTIONS, ProviderStubServer, StubBehavior
+
+
+class Command(BaseCommand):
+    help = "Serves local stand-ins for the Groq chat, Google Translate and TTS endpoints."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--latency-ms", type=float, default=300.0, help="Mean response latency.")
+        parser.add_argument("--latency-spread-ms", type=float, default=100.0, help="Spread (stddev or half-range).")
+        parser.add_argument("--latency-distribution", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500.")
+        parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429.")
+        parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s.")
+        parser.add_argument("--stream-chunk-ms", type=float, default=20.0, help="Delay between streamed chunks.")
+        parser.add_argument("--seed", type=int, default=None)
+        parser.add_argument("--verbose", action="store_true", help="Log every request.")
+
+    def handle(self, *args, **options):
+        behavior = StubBehavior(
+            latency_ms=options["latency_ms"],
+            spread_ms=options["latency_spread_ms"],
+            distribution=options["latency_distribution"],
+            error_rate=options["error_rate"],
+            rate_limit_rate=options["rate_limit_rate"],
+            retry_after=options["retry_after"],
+            stream_chunk_ms=options["stream_chunk_ms"],
+            seed=options["seed"],
+        )
+        server = ProviderStubServer((options["host"], options["port"]), behavior, verbose=options["verbose"])
+        self.stdout.write(self.style.SUCCESS(f"Provider stub listening on {server.base_url}. Point the app at it with:"))
+        for name, value in server.provider_settings().items():
+            self.stdout.write(f"  {name}={value}")
+        self.stdout.write("  GROQ_API_KEY=<any non-empty value>")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,64 @@
+"""Process-independent counters and timers for /health/metrics/.
+
+Counters live in the database, so every worker adds to and reads the same
+totals; each increment is a single atomic ``UPDATE ... SET value = value + n``.
+"""
+
+import time
+from contextlib import contextmanager
+
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import F
+
+from .models import MetricCounter
+
+
+def incr(name: str, delta: int = 1) -> None:
+    # Counting never fails the request being counted: the write runs in a
+    # savepoint and is dropped when the database is busy.
+    for _ in range(2):
+        try:
+            with transaction.atomic():
+                if not MetricCounter.objects.filter(name=name).update(value=F("value") + delta):
+                    MetricCounter.objects.create(name=name, value=delta)
+            return
+        except IntegrityError:
+            continue  # another worker created the row first; update it
+        except DatabaseError:
+            return
+
+
+def observe(name: str, seconds: float) -> None:
+    incr(f"{name}.count")
+    incr(f"{name}.total_ms", int(round(seconds * 1000)))
+
+
+@contextmanager
+def timer(name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - started)
+
+
+def snapshot(prefix: str = "") -> dict:
+    """Current counters, with ``<timer>.avg_ms`` and ``<cache>.hit_ratio`` derived."""
+    data = dict(MetricCounter.objects.filter(name__startswith=prefix).order_by("name").values_list("name", "value"))
+    for name in list(data):
+        if name.endswith(".count") and data[name]:
+            base = name[: -len(".count")]
+            data[f"{base}.avg_ms"] = round(data.get(f"{base}.total_ms", 0) / data[name], 1)
+        if name.endswith(".hit"):
+            base = name[: -len(".hit")]
+            data[f"{base}.hit_ratio"] = ratio(data[name], data.get(f"{base}.miss", 0))
+    return data
+
+
+def reset(prefix: str = "") -> None:
+    MetricCounter.objects.filter(name__startswith=prefix).delete()
+
+
+def ratio(hits: int, misses: int) -> float:
+    total = hits + misses
+    return round(hits / total, 3) if total else 0.0
@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.http import HttpResponse
+
+from .db_routing import replica_alias, use_primary, use_replica
+from .profiling import RequestProfile, token_is_valid
+
+
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+PRIMARY_STICKY_COOKIE = "db_primary"
+PROFILE_PARAM = "profile"
+PROFILE_HEADER = "HTTP_X_PROFILE_TOKEN"
+
+
+class ReadReplicaMiddleware:
+    """Serve read-only requests from the replica, except right after this browser wrote.
+
+    Any unsafe request (an upload, a profile edit, a login) sets a short-lived
+    cookie; while it is present, the browser's reads stay on the primary so it
+    sees its own writes despite replication lag.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not replica_alias():
+            return self.get_response(request)
+
+        read_only = request.method in READ_ONLY_METHODS
+        if read_only and not request.COOKIES.get(PRIMARY_STICKY_COOKIE):
+            with use_replica():
+                return self.get_response(request)
+
+        with use_primary():
+            response = self.get_response(request)
+        if not read_only:
+            response.set_cookie(
+                PRIMARY_STICKY_COOKIE,
+                "1",
+                max_age=int(getattr(settings, "READ_YOUR_WRITES_SECONDS", 30)),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class RequestProfilingMiddleware:
+    """Profile one request on demand for staff (``?profile=1``) or a signed ``X-Profile-Token``.
+
+    The profile is stored under ``PROFILE_DIR`` and its id and a ``Server-Timing``
+    breakdown are added to the response; ``?profile=download`` returns the
+    ``.prof`` file instead of the page. Untriggered requests pay one dict lookup.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = request.GET.get(PROFILE_PARAM)
+        token = request.META.get(PROFILE_HEADER)
+        if not (mode or token) or not self._allowed(request, token):
+            return self.get_response(request)
+
+        profile = RequestProfile(request)
+        with profile.capture():
+            response = self.get_response(request)
+        stats_path = profile.store(response.status_code)
+        if mode == "download":
+            response = HttpResponse(stats_path.read_bytes(), content_type="application/octet-stream")
+            response["Content-Disposition"] = f'attachment; filename="profile-{profile.id}.prof"'
+        response["X-Profile-Id"] = profile.id
+        response["Server-Timing"] = profile.server_timing()
+        return response
+
+    def _allowed(self, request, token: str | None) -> bool:
+        if token:
+            return token_is_valid(token)
+        user = getattr(request, "user", None)
+        return bool(user and user.is_staff)
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('health', '0003_medicalreport_doctor_suggestions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderRateBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.CharField(max_length=50, unique=True)),
+                ('request_allowance', models.FloatField(default=0)),
+                ('token_allowance', models.FloatField(default=0)),
+                ('refilled_at', models.FloatField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('health', '0008_report_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PipelineStageResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.CharField(max_length=30)),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('output', models.JSONField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('report', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_results', to='health.medicalreport')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('report', 'stage'), name='unique_report_stage')],
+            },
+        ),
+    ]
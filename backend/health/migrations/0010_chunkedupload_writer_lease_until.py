@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('health', '0009_pipelinestageresult'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chunkedupload',
+            name='writer_lease_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
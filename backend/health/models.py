@@ -1,3 +1,5 @@
+import uuid
+
 from django.contrib.auth.models import User
 from django.db import models
 
@@ -9,7 +11,9 @@ class MedicalReport(models.Model):
     analysis_completed = models.BooleanField(default=False)
     ocr_text = models.TextField(blank=True)
     doctor_suggestions = models.JSONField(default=list, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-report_date", "-created_at"]
@@ -46,9 +50,82 @@ class AnalysisResult(models.Model):
     doctor_summary = models.TextField(blank=True)
     raw_response = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
 
     def __str__(self):
         return f"Analysis for report {self.report_id}"
+
+
+class ProviderRateBucket(models.Model):
+    provider = models.CharField(max_length=50, unique=True)
+    request_allowance = models.FloatField(default=0)
+    token_allowance = models.FloatField(default=0)
+    refilled_at = models.FloatField(default=0)
+
+    def __str__(self):
+        return f"{self.provider}: {self.request_allowance:.1f} req / {self.token_allowance:.0f} tok"
+
+
+class MetricCounter(models.Model):
+    # One row per counter, shared by every worker process.
+    name = models.CharField(max_length=200, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name}={self.value}"
+
+
+class ProviderCallLease(models.Model):
+    STATUS_CHOICES = [
+        ("running", "Running"),
+        ("done", "Done"),
+    ]
+
+    key = models.CharField(max_length=64, unique=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="running")
+    result = models.JSONField(null=True, blank=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.key[:12]} ({self.status})"
+
+
+class ChunkedUpload(models.Model):
+    STATUS_CHOICES = [
+        ("uploading", "Uploading"),
+        ("complete", "Complete"),
+    ]
+
+    upload_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="chunked_uploads")
+    filename = models.CharField(max_length=255)
+    report_date = models.DateField()
+    total_size = models.BigIntegerField()
+    received_bytes = models.BigIntegerField(default=0)
+    content_hash = models.CharField(max_length=64, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="uploading")
+    report = models.ForeignKey(MedicalReport, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    # Set while a chunk is being written; expires so a killed writer never blocks the upload.
+    writer_lease_until = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.received_bytes}/{self.total_size})"
+
+
+class PipelineStageResult(models.Model):
+    report = models.ForeignKey(MedicalReport, on_delete=models.CASCADE, related_name="stage_results")
+    stage = models.CharField(max_length=30)
+    fingerprint = models.CharField(max_length=64)
+    output = models.JSONField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["report", "stage"], name="unique_report_stage")]
+
+    def __str__(self):
+        return f"Report {self.report_id} {self.stage} ({self.fingerprint[:12]})"
@@ -0,0 +1,1102 @@
+"""Message catalogs for the offline fallback analysis, one per narration language.
+
+Templates are compiled once at import, so a fallback narrative is rendered
+locally in the user's preferred language without a translation round-trip.
+"""
+
+from string import Template
+
+
+DEFAULT_LANGUAGE = "en"
+
+# Free-text profile preferences that are language names rather than codes.
+LANGUAGE_ALIASES = {
+    "english": "en",
+    "hindi": "hi",
+    "tamil": "ta",
+    "telugu": "te",
+    "kannada": "kn",
+    "malayalam": "ml",
+    "bengali": "bn",
+    "bangla": "bn",
+    "marathi": "mr",
+    "gujarati": "gu",
+    "punjabi": "pa",
+    "urdu": "ur",
+    "spanish": "es",
+    "french": "fr",
+    "german": "de",
+}
+
+_CATALOG_SOURCES = {
+    "en": {
+        "none": "none",
+        "not_provided": "not provided",
+        "none_identified": "none identified",
+        "not_available": "NA",
+        "symptoms_default": "no symptoms shared currently",
+        "conditions_default": "no major past conditions shared",
+        "medications_default": "no current medicines listed",
+        "mentor_notes": " I also noticed report comments/notes: $notes.",
+        "mentor_no_params": (
+            "No lab parameters could be extracted from the latest upload. Please upload a clearer photo or paste "
+            "report text in structured lines.$notes_line"
+        ),
+        "mentor_lifestyle": "Sleep: ${sleep}h, Activity: $activity, Diet: $diet.",
+        "mentor_summary": (
+            "I reviewed your latest report together with your profile and previous records. In this report, "
+            "$normal_count markers are in the normal range. Markers running higher than range: $high. Markers "
+            "below range: $low. Your shared symptoms: $symptoms. Past conditions: $conditions. Current "
+            "medicines: $medications. Lifestyle context: $lifestyle$notes_line Please treat this as educational "
+            "guidance and confirm with your clinician."
+        ),
+        "trend_analysis": (
+            "$trend_hint This trend view is generated from available records and may be limited by OCR quality "
+            "or missing ranges. For richer narrative insight, set GROQ_API_KEY."
+        ),
+        "doctor_note_highlights": "Report note highlights: $notes. ",
+        "doctor_summary": (
+            "Longitudinal review prepared with profile context. Current high markers: $high. Current low "
+            "markers: $low. Reported symptoms: $symptoms. Past conditions: $conditions. ${note_highlights}Please "
+            "correlate with clinical history and examination."
+        ),
+        "narrative_no_params": (
+            "I could not reliably read lab values from this upload, so I cannot give a trustworthy "
+            "interpretation yet. Please upload a clearer scan or paste the report text line by line, and I will "
+            "re-build your trend story. From your profile, I still consider your context important: symptoms are "
+            "$symptoms, past history is $conditions, and medications are $medications. Lifestyle currently "
+            "reflects sleep around $sleep hours, activity level $activity, and diet type $diet. Once the values "
+            "are readable, I will connect these factors with your marker patterns and give you a complete "
+            "interpretation."
+        ),
+        "narrative_stable": "Most markers appear stable or within expected range in this cycle.",
+        "narrative_attention": "The main points needing attention are higher markers: $high, and lower markers: $low.",
+        "narrative_notes": " I also factored in your report notes: $notes.",
+        "narrative": (
+            "I reviewed this report in the context of your previous records and your personal health background, "
+            "so this is not just a one-time reading. You currently have $normal_count markers in normal range, "
+            "and $stability_note When I map this to your day-to-day context, your current symptoms are "
+            "$symptoms, your background history is $conditions, and your medicine list shows $medications. Your "
+            "routine currently reflects sleep around $sleep hours, activity level $activity, and a $diet diet, "
+            "which can meaningfully influence energy, recovery, and longer-term marker movement over time. "
+            "Across timeline comparison, $trend_hint The practical takeaway is to continue monitoring "
+            "consistency rather than reacting to one isolated number: keep sleep and activity regular, repeat "
+            "follow-up testing on schedule, and watch for any new symptoms that match trend shifts rather than "
+            "isolated fluctuations.$doctor_note_line Use this as a structured discussion aid with your clinician "
+            "so decisions are based on your full history, not a single report snapshot."
+        ),
+        "trend_single": "Only one report is available, so trend direction is limited.",
+        "trend_insufficient": "Not enough comparable parameters for trend analysis.",
+        "trend_snapshot": "Trend snapshot: $lines.",
+        "trend_line": "$name is $direction across your reports",
+        "trend_out_most": " and has been outside its reference range for most of that time",
+        "trend_out_part": " and was outside its reference range for part of that time",
+        "trend_shift": ", including a sudden shift between readings",
+        "delta_up": "$name increased by $delta",
+        "delta_down": "$name decreased by $delta",
+        "delta_flat": "$name stayed stable",
+        "direction_improving": "improving",
+        "direction_worsening": "worsening",
+        "direction_stable": "stable",
+        "direction_rising": "rising",
+        "direction_falling": "falling",
+        "disclaimer": "This is educational support only, not a diagnosis or prescription.",
+        "caution": (
+            " Some generated claims could not be verified against extracted lab values, so this summary should "
+            "be reviewed carefully with a clinician."
+        ),
+    },
+    "hi": {
+        "none": "कोई नहीं",
+        "not_provided": "नहीं बताया गया",
+        "none_identified": "कोई नहीं मिला",
+        "not_available": "उपलब्ध नहीं",
+        "symptoms_default": "अभी कोई लक्षण साझा नहीं किए गए",
+        "conditions_default": "कोई बड़ी पुरानी बीमारी साझा नहीं की गई",
+        "medications_default": "कोई वर्तमान दवा सूचीबद्ध नहीं",
+        "mentor_notes": " मैंने रिपोर्ट की टिप्पणियाँ/नोट्स भी देखे: $notes।",
+        "mentor_no_params": (
+            "नवीनतम अपलोड से कोई लैब पैरामीटर नहीं निकाला जा सका। कृपया अधिक साफ़ फ़ोटो अपलोड करें या रिपोर्ट का "
+            "टेक्स्ट पंक्ति-दर-पंक्ति पेस्ट करें।$notes_line"
+        ),
+        "mentor_lifestyle": "नींद: $sleep घंटे, गतिविधि: $activity, आहार: $diet।",
+        "mentor_summary": (
+            "मैंने आपकी नवीनतम रिपोर्ट को आपकी प्रोफ़ाइल और पिछले रिकॉर्ड के साथ देखा है। इस रिपोर्ट में "
+            "$normal_count मार्कर सामान्य सीमा में हैं। सीमा से ऊपर वाले मार्कर: $high। सीमा से नीचे वाले "
+            "मार्कर: $low। आपके बताए लक्षण: $symptoms। पुरानी बीमारियाँ: $conditions। वर्तमान दवाएँ: "
+            "$medications। जीवनशैली: $lifestyle$notes_line कृपया इसे शैक्षिक मार्गदर्शन मानें और अपने डॉक्टर से "
+            "पुष्टि करें।"
+        ),
+        "trend_analysis": (
+            "$trend_hint यह ट्रेंड उपलब्ध रिकॉर्ड से बनाया गया है और OCR गुणवत्ता या गायब संदर्भ सीमाओं के कारण "
+            "सीमित हो सकता है। अधिक विस्तृत विश्लेषण के लिए GROQ_API_KEY सेट करें।"
+        ),
+        "doctor_note_highlights": "रिपोर्ट नोट्स की मुख्य बातें: $notes। ",
+        "doctor_summary": (
+            "प्रोफ़ाइल संदर्भ के साथ दीर्घकालिक समीक्षा तैयार की गई। वर्तमान उच्च मार्कर: $high। वर्तमान निम्न "
+            "मार्कर: $low। बताए गए लक्षण: $symptoms। पुरानी बीमारियाँ: $conditions। ${note_highlights}कृपया "
+            "नैदानिक इतिहास और जाँच के साथ मिलान करें।"
+        ),
+        "narrative_no_params": (
+            "मैं इस अपलोड से लैब मान भरोसेमंद तरीके से नहीं पढ़ सका, इसलिए अभी विश्वसनीय व्याख्या नहीं दे सकता। "
+            "कृपया अधिक साफ़ स्कैन अपलोड करें या रिपोर्ट का टेक्स्ट पंक्ति-दर-पंक्ति पेस्ट करें, फिर मैं आपकी "
+            "ट्रेंड कहानी दोबारा बनाऊँगा। आपकी प्रोफ़ाइल से: लक्षण $symptoms, पुराना इतिहास $conditions, और "
+            "दवाएँ $medications हैं। जीवनशैली में लगभग $sleep घंटे की नींद, गतिविधि स्तर $activity और आहार "
+            "प्रकार $diet दिखता है। मान पढ़ने योग्य होते ही मैं इन बातों को आपके मार्करों से जोड़कर पूरी "
+            "व्याख्या दूँगा।"
+        ),
+        "narrative_stable": "इस बार अधिकांश मार्कर स्थिर या अपेक्षित सीमा में दिखते हैं।",
+        "narrative_attention": "ध्यान देने वाले मुख्य बिंदु हैं — ऊँचे मार्कर: $high, और निचले मार्कर: $low।",
+        "narrative_notes": " मैंने आपकी रिपोर्ट के नोट्स को भी ध्यान में रखा: $notes।",
+        "narrative": (
+            "मैंने यह रिपोर्ट आपके पिछले रिकॉर्ड और आपकी व्यक्तिगत स्वास्थ्य पृष्ठभूमि के संदर्भ में देखी है, "
+            "इसलिए यह केवल एक बार की रीडिंग नहीं है। अभी आपके $normal_count मार्कर सामान्य सीमा में हैं, और "
+            "$stability_note आपके रोज़मर्रा के संदर्भ में, आपके वर्तमान लक्षण $symptoms हैं, पृष्ठभूमि इतिहास "
+            "$conditions है, और दवाओं की सूची में $medications है। आपकी दिनचर्या में लगभग $sleep घंटे की नींद, "
+            "गतिविधि स्तर $activity और $diet आहार है, जो समय के साथ ऊर्जा, रिकवरी और मार्करों के बदलाव को "
+            "प्रभावित कर सकते हैं। समय-रेखा की तुलना में, $trend_hint व्यावहारिक सलाह यह है कि किसी एक संख्या पर "
+            "प्रतिक्रिया देने के बजाय निरंतर निगरानी करें: नींद और गतिविधि नियमित रखें, समय पर फॉलो-अप जाँच "
+            "दोहराएँ, और ट्रेंड से मेल खाते किसी भी नए लक्षण पर ध्यान दें।$doctor_note_line इसे अपने डॉक्टर के "
+            "साथ चर्चा के सहायक के रूप में उपयोग करें ताकि निर्णय आपके पूरे इतिहास पर आधारित हों, किसी एक "
+            "रिपोर्ट पर नहीं।"
+        ),
+        "trend_single": "केवल एक रिपोर्ट उपलब्ध है, इसलिए ट्रेंड की दिशा सीमित है।",
+        "trend_insufficient": "ट्रेंड विश्लेषण के लिए पर्याप्त तुलनीय पैरामीटर नहीं हैं।",
+        "trend_snapshot": "ट्रेंड झलक: $lines।",
+        "trend_line": "$name आपकी रिपोर्टों में $direction है",
+        "trend_out_most": " और अधिकांश समय अपनी संदर्भ सीमा से बाहर रहा है",
+        "trend_out_part": " और कुछ समय अपनी संदर्भ सीमा से बाहर रहा",
+        "trend_shift": ", जिसमें रीडिंग के बीच अचानक बदलाव भी शामिल है",
+        "delta_up": "$name $delta बढ़ा",
+        "delta_down": "$name $delta घटा",
+        "delta_flat": "$name स्थिर रहा",
+        "direction_improving": "सुधर रहा",
+        "direction_worsening": "बिगड़ रहा",
+        "direction_stable": "स्थिर",
+        "direction_rising": "बढ़ रहा",
+        "direction_falling": "घट रहा",
+        "disclaimer": "यह केवल शैक्षिक सहायता है, निदान या दवा का पर्चा नहीं।",
+        "caution": (
+            " कुछ दावे निकाले गए लैब मानों से सत्यापित नहीं हो सके, इसलिए इस सारांश की डॉक्टर के साथ सावधानी से "
+            "समीक्षा करें।"
+        ),
+    },
+    "ta": {
+        "none": "எதுவும் இல்லை",
+        "not_provided": "குறிப்பிடப்படவில்லை",
+        "none_identified": "எதுவும் கண்டறியப்படவில்லை",
+        "not_available": "கிடைக்கவில்லை",
+        "symptoms_default": "தற்போது அறிகுறிகள் எதுவும் பகிரப்படவில்லை",
+        "conditions_default": "முக்கிய முந்தைய நோய்கள் எதுவும் பகிரப்படவில்லை",
+        "medications_default": "தற்போதைய மருந்துகள் எதுவும் பட்டியலிடப்படவில்லை",
+        "mentor_notes": " அறிக்கையில் உள்ள குறிப்புகளையும் கவனித்தேன்: $notes.",
+        "mentor_no_params": (
+            "சமீபத்திய பதிவேற்றத்திலிருந்து ஆய்வக அளவுகளைப் பிரித்தெடுக்க முடியவில்லை. தெளிவான புகைப்படத்தைப் "
+            "பதிவேற்றவும் அல்லது அறிக்கை உரையை வரி வரியாக ஒட்டவும்.$notes_line"
+        ),
+        "mentor_lifestyle": "தூக்கம்: $sleep மணி நேரம், செயல்பாடு: $activity, உணவு: $diet.",
+        "mentor_summary": (
+            "உங்கள் சமீபத்திய அறிக்கையை உங்கள் சுயவிவரம் மற்றும் முந்தைய பதிவுகளுடன் சேர்த்துப் பார்த்தேன். இந்த "
+            "அறிக்கையில் $normal_count அளவுகள் இயல்பான வரம்பில் உள்ளன. வரம்பை விட அதிகமான அளவுகள்: $high. வரம்பை "
+            "விட குறைவான அளவுகள்: $low. நீங்கள் பகிர்ந்த அறிகுறிகள்: $symptoms. முந்தைய நோய்கள்: $conditions. "
+            "தற்போதைய மருந்துகள்: $medications. வாழ்க்கை முறை: $lifestyle$notes_line இதைக் கல்வி சார்ந்த "
+            "வழிகாட்டுதலாகக் கருதி உங்கள் மருத்துவரிடம் உறுதிப்படுத்திக் கொள்ளவும்."
+        ),
+        "trend_analysis": (
+            "$trend_hint இந்தப் போக்கு கிடைக்கும் பதிவுகளிலிருந்து உருவாக்கப்பட்டது; OCR தரம் அல்லது விடுபட்ட "
+            "வரம்புகளால் வரையறுக்கப்படலாம். விரிவான விளக்கத்திற்கு GROQ_API_KEY ஐ அமைக்கவும்."
+        ),
+        "doctor_note_highlights": "அறிக்கைக் குறிப்புகளின் முக்கிய அம்சங்கள்: $notes. ",
+        "doctor_summary": (
+            "சுயவிவரச் சூழலுடன் நீண்டகால மதிப்பாய்வு தயாரிக்கப்பட்டது. தற்போதைய அதிக அளவுகள்: $high. தற்போதைய "
+            "குறைந்த அளவுகள்: $low. தெரிவிக்கப்பட்ட அறிகுறிகள்: $symptoms. முந்தைய நோய்கள்: $conditions. "
+            "${note_highlights}மருத்துவ வரலாறு மற்றும் பரிசோதனையுடன் ஒப்பிட்டுப் பார்க்கவும்."
+        ),
+        "narrative_no_params": (
+            "இந்தப் பதிவேற்றத்திலிருந்து ஆய்வக மதிப்புகளை நம்பகமாகப் படிக்க முடியவில்லை, எனவே இப்போது நம்பகமான "
+            "விளக்கத்தைத் தர இயலாது. தெளிவான ஸ்கேனைப் பதிவேற்றவும் அல்லது அறிக்கை உரையை வரி வரியாக ஒட்டவும். "
+            "உங்கள் சுயவிவரத்தின்படி: அறிகுறிகள் $symptoms, முந்தைய வரலாறு $conditions, மருந்துகள் $medications. "
+            "சுமார் $sleep மணி நேரத் தூக்கம், செயல்பாட்டு நிலை $activity, உணவு வகை $diet. மதிப்புகள் "
+            "படிக்கக்கூடியதாக ஆனதும், இவற்றை உங்கள் அளவுகளுடன் இணைத்து முழுமையான விளக்கத்தைத் தருகிறேன்."
+        ),
+        "narrative_stable": "இந்த முறை பெரும்பாலான அளவுகள் நிலையாக அல்லது எதிர்பார்த்த வரம்பில் உள்ளன.",
+        "narrative_attention": "கவனிக்க வேண்டியவை — அதிகமான அளவுகள்: $high, குறைவான அளவுகள்: $low.",
+        "narrative_notes": " உங்கள் அறிக்கைக் குறிப்புகளையும் கருத்தில் கொண்டேன்: $notes.",
+        "narrative": (
+            "இந்த அறிக்கையை உங்கள் முந்தைய பதிவுகள் மற்றும் தனிப்பட்ட உடல்நலப் பின்னணியுடன் சேர்த்துப் "
+            "பார்த்தேன், எனவே இது ஒரு முறை அளவீடு மட்டும் அல்ல. தற்போது $normal_count அளவுகள் இயல்பான வரம்பில் "
+            "உள்ளன, மேலும் $stability_note உங்கள் அன்றாடச் சூழலில், தற்போதைய அறிகுறிகள் $symptoms, பின்னணி "
+            "வரலாறு $conditions, மருந்துப் பட்டியல் $medications. சுமார் $sleep மணி நேரத் தூக்கம், செயல்பாட்டு "
+            "நிலை $activity, $diet உணவு ஆகியவை காலப்போக்கில் ஆற்றல், மீட்பு மற்றும் அளவுகளின் மாற்றத்தைப் "
+            "பாதிக்கலாம். காலவரிசை ஒப்பீட்டில், $trend_hint ஒரு தனி எண்ணுக்கு எதிர்வினையாற்றாமல் தொடர்ந்து "
+            "கண்காணிப்பதே நடைமுறை ஆலோசனை: தூக்கம் மற்றும் செயல்பாட்டை சீராக வைத்திருங்கள், திட்டமிட்டபடி "
+            "மறுபரிசோதனை செய்யுங்கள், போக்குடன் ஒத்துப்போகும் புதிய அறிகுறிகளைக் கவனியுங்கள்.$doctor_note_line "
+            "உங்கள் முழு வரலாற்றின் அடிப்படையில் முடிவுகள் எடுக்க, இதை உங்கள் மருத்துவருடன் கலந்துரையாடும் "
+            "உதவியாகப் பயன்படுத்துங்கள்."
+        ),
+        "trend_single": "ஒரே ஒரு அறிக்கை மட்டுமே உள்ளது, எனவே போக்கின் திசை வரையறுக்கப்பட்டுள்ளது.",
+        "trend_insufficient": "போக்கு பகுப்பாய்விற்கு ஒப்பிடக்கூடிய போதுமான அளவுகள் இல்லை.",
+        "trend_snapshot": "போக்கு சுருக்கம்: $lines.",
+        "trend_line": "உங்கள் அறிக்கைகளில் $name $direction",
+        "trend_out_most": ", பெரும்பாலான நேரம் அதன் குறிப்பு வரம்பிற்கு வெளியே இருந்தது",
+        "trend_out_part": ", சில நேரம் அதன் குறிப்பு வரம்பிற்கு வெளியே இருந்தது",
+        "trend_shift": ", அளவீடுகளுக்கு இடையே திடீர் மாற்றமும் உள்ளது",
+        "delta_up": "$name $delta அதிகரித்தது",
+        "delta_down": "$name $delta குறைந்தது",
+        "delta_flat": "$name நிலையாக உள்ளது",
+        "direction_improving": "மேம்பட்டு வருகிறது",
+        "direction_worsening": "மோசமடைந்து வருகிறது",
+        "direction_stable": "நிலையாக உள்ளது",
+        "direction_rising": "உயர்ந்து வருகிறது",
+        "direction_falling": "குறைந்து வருகிறது",
+        "disclaimer": "இது கல்வி சார்ந்த உதவி மட்டுமே, நோயறிதலோ மருந்துச் சீட்டோ அல்ல.",
+        "caution": (
+            " சில கூற்றுகளைப் பிரித்தெடுக்கப்பட்ட ஆய்வக மதிப்புகளுடன் சரிபார்க்க முடியவில்லை, எனவே இந்தச் "
+            "சுருக்கத்தை மருத்துவருடன் கவனமாக மதிப்பாய்வு செய்யவும்."
+        ),
+    },
+    "te": {
+        "none": "ఏవీ లేవు",
+        "not_provided": "ఇవ్వబడలేదు",
+        "none_identified": "ఏవీ గుర్తించబడలేదు",
+        "not_available": "అందుబాటులో లేదు",
+        "symptoms_default": "ప్రస్తుతం లక్షణాలు ఏవీ పంచుకోలేదు",
+        "conditions_default": "ముఖ్యమైన గత వ్యాధులు ఏవీ పంచుకోలేదు",
+        "medications_default": "ప్రస్తుత మందులు ఏవీ నమోదు కాలేదు",
+        "mentor_notes": " నివేదికలోని వ్యాఖ్యలు/గమనికలను కూడా గమనించాను: $notes.",
+        "mentor_no_params": (
+            "తాజా అప్‌లోడ్ నుండి ల్యాబ్ విలువలను తీయలేకపోయాము. దయచేసి స్పష్టమైన ఫోటోను అప్‌లోడ్ చేయండి లేదా "
+            "నివేదిక పాఠ్యాన్ని వరుసల వారీగా అతికించండి.$notes_line"
+        ),
+        "mentor_lifestyle": "నిద్ర: $sleep గంటలు, శారీరక శ్రమ: $activity, ఆహారం: $diet.",
+        "mentor_summary": (
+            "మీ తాజా నివేదికను మీ ప్రొఫైల్ మరియు గత రికార్డులతో కలిపి పరిశీలించాను. ఈ నివేదికలో $normal_count "
+            "మార్కర్లు సాధారణ పరిధిలో ఉన్నాయి. పరిధి కంటే ఎక్కువ ఉన్న మార్కర్లు: $high. పరిధి కంటే తక్కువ ఉన్న "
+            "మార్కర్లు: $low. మీరు చెప్పిన లక్షణాలు: $symptoms. గత వ్యాధులు: $conditions. ప్రస్తుత మందులు: "
+            "$medications. జీవనశైలి: $lifestyle$notes_line దీనిని విద్యాపరమైన మార్గదర్శకంగా భావించి మీ "
+            "వైద్యునితో నిర్ధారించుకోండి."
+        ),
+        "trend_analysis": (
+            "$trend_hint ఈ ధోరణి అందుబాటులో ఉన్న రికార్డుల నుండి రూపొందించబడింది; OCR నాణ్యత లేదా లేని పరిధుల "
+            "వల్ల పరిమితం కావచ్చు. మరింత వివరమైన విశ్లేషణ కోసం GROQ_API_KEY సెట్ చేయండి."
+        ),
+        "doctor_note_highlights": "నివేదిక గమనికల ముఖ్యాంశాలు: $notes. ",
+        "doctor_summary": (
+            "ప్రొఫైల్ సందర్భంతో దీర్ఘకాలిక సమీక్ష సిద్ధం చేయబడింది. ప్రస్తుత అధిక మార్కర్లు: $high. ప్రస్తుత "
+            "తక్కువ మార్కర్లు: $low. తెలిపిన లక్షణాలు: $symptoms. గత వ్యాధులు: $conditions. "
+            "${note_highlights}వైద్య చరిత్ర మరియు పరీక్షతో సరిపోల్చండి."
+        ),
+        "narrative_no_params": (
+            "ఈ అప్‌లోడ్ నుండి ల్యాబ్ విలువలను నమ్మకంగా చదవలేకపోయాను, కాబట్టి ఇప్పుడే విశ్వసనీయమైన వివరణ "
+            "ఇవ్వలేను. దయచేసి స్పష్టమైన స్కాన్‌ను అప్‌లోడ్ చేయండి లేదా నివేదిక పాఠ్యాన్ని వరుసల వారీగా "
+            "అతికించండి. మీ ప్రొఫైల్ ప్రకారం: లక్షణాలు $symptoms, గత చరిత్ర $conditions, మందులు $medications. "
+            "సుమారు $sleep గంటల నిద్ర, శ్రమ స్థాయి $activity, ఆహార రకం $diet. విలువలు చదవగలిగేలా ఉన్నప్పుడు "
+            "వీటిని మీ మార్కర్లతో అనుసంధానించి పూర్తి వివరణ ఇస్తాను."
+        ),
+        "narrative_stable": "ఈ సారి చాలా మార్కర్లు స్థిరంగా లేదా ఆశించిన పరిధిలో ఉన్నాయి.",
+        "narrative_attention": "శ్రద్ధ అవసరమైన ముఖ్య అంశాలు — అధిక మార్కర్లు: $high, తక్కువ మార్కర్లు: $low.",
+        "narrative_notes": " మీ నివేదిక గమనికలను కూడా పరిగణనలోకి తీసుకున్నాను: $notes.",
+        "narrative": (
+            "ఈ నివేదికను మీ గత రికార్డులు మరియు వ్యక్తిగత ఆరోగ్య నేపథ్యంతో కలిపి పరిశీలించాను, కాబట్టి ఇది "
+            "ఒక్కసారి రీడింగ్ మాత్రమే కాదు. ప్రస్తుతం $normal_count మార్కర్లు సాధారణ పరిధిలో ఉన్నాయి, మరియు "
+            "$stability_note మీ రోజువారీ సందర్భంలో, ప్రస్తుత లక్షణాలు $symptoms, నేపథ్య చరిత్ర $conditions, "
+            "మందుల జాబితా $medications. సుమారు $sleep గంటల నిద్ర, శ్రమ స్థాయి $activity, $diet ఆహారం కాలక్రమేణా "
+            "శక్తి, కోలుకోవడం మరియు మార్కర్ల మార్పులను ప్రభావితం చేయవచ్చు. కాలక్రమ పోలికలో, $trend_hint ఒక్క "
+            "సంఖ్యకు స్పందించడం కంటే నిరంతరం పర్యవేక్షించడమే ఆచరణాత్మక సూచన: నిద్ర మరియు శ్రమను క్రమంగా ఉంచండి, "
+            "సమయానికి ఫాలో-అప్ పరీక్షలు చేయించుకోండి, ధోరణికి సరిపోయే కొత్త లక్షణాలను "
+            "గమనించండి.$doctor_note_line మీ పూర్తి చరిత్ర ఆధారంగా నిర్ణయాలు తీసుకునేందుకు దీనిని మీ వైద్యునితో "
+            "చర్చకు సహాయకంగా ఉపయోగించండి."
+        ),
+        "trend_single": "ఒకే నివేదిక అందుబాటులో ఉంది, కాబట్టి ధోరణి దిశ పరిమితంగా ఉంది.",
+        "trend_insufficient": "ధోరణి విశ్లేషణకు సరిపడా పోల్చదగిన మార్కర్లు లేవు.",
+        "trend_snapshot": "ధోరణి సారాంశం: $lines.",
+        "trend_line": "మీ నివేదికలలో $name $direction",
+        "trend_out_most": ", ఎక్కువ కాలం దాని సూచన పరిధికి వెలుపల ఉంది",
+        "trend_out_part": ", కొంత కాలం దాని సూచన పరిధికి వెలుపల ఉంది",
+        "trend_shift": ", రీడింగ్‌ల మధ్య ఆకస్మిక మార్పుతో సహా",
+        "delta_up": "$name $delta పెరిగింది",
+        "delta_down": "$name $delta తగ్గింది",
+        "delta_flat": "$name స్థిరంగా ఉంది",
+        "direction_improving": "మెరుగుపడుతోంది",
+        "direction_worsening": "క్షీణిస్తోంది",
+        "direction_stable": "స్థిరంగా ఉంది",
+        "direction_rising": "పెరుగుతోంది",
+        "direction_falling": "తగ్గుతోంది",
+        "disclaimer": "ఇది విద్యాపరమైన సహాయం మాత్రమే, రోగ నిర్ధారణ లేదా ప్రిస్క్రిప్షన్ కాదు.",
+        "caution": (
+            " కొన్ని వాదనలను సేకరించిన ల్యాబ్ విలువలతో ధృవీకరించలేకపోయాము, కాబట్టి ఈ సారాంశాన్ని వైద్యునితో "
+            "జాగ్రత్తగా సమీక్షించండి."
+        ),
+    },
+    "kn": {
+        "none": "ಯಾವುದೂ ಇಲ್ಲ",
+        "not_provided": "ನೀಡಿಲ್ಲ",
+        "none_identified": "ಯಾವುದೂ ಕಂಡುಬಂದಿಲ್ಲ",
+        "not_available": "ಲಭ್ಯವಿಲ್ಲ",
+        "symptoms_default": "ಪ್ರಸ್ತುತ ಯಾವುದೇ ಲಕ್ಷಣಗಳನ್ನು ಹಂಚಿಕೊಂಡಿಲ್ಲ",
+        "conditions_default": "ಯಾವುದೇ ಪ್ರಮುಖ ಹಿಂದಿನ ಕಾಯಿಲೆಗಳನ್ನು ಹಂಚಿಕೊಂಡಿಲ್ಲ",
+        "medications_default": "ಪ್ರಸ್ತುತ ಯಾವುದೇ ಔಷಧಿಗಳನ್ನು ಪಟ್ಟಿ ಮಾಡಿಲ್ಲ",
+        "mentor_notes": " ವರದಿಯಲ್ಲಿನ ಟಿಪ್ಪಣಿಗಳನ್ನೂ ಗಮನಿಸಿದ್ದೇನೆ: $notes.",
+        "mentor_no_params": (
+            "ಇತ್ತೀಚಿನ ಅಪ್‌ಲೋಡ್‌ನಿಂದ ಯಾವುದೇ ಲ್ಯಾಬ್ ಮೌಲ್ಯಗಳನ್ನು ಪಡೆಯಲಾಗಲಿಲ್ಲ. ದಯವಿಟ್ಟು ಸ್ಪಷ್ಟವಾದ ಫೋಟೋ ಅಪ್‌ಲೋಡ್ "
+            "ಮಾಡಿ ಅಥವಾ ವರದಿಯ ಪಠ್ಯವನ್ನು ಸಾಲು ಸಾಲಾಗಿ ಅಂಟಿಸಿ.$notes_line"
+        ),
+        "mentor_lifestyle": "ನಿದ್ರೆ: $sleep ಗಂಟೆ, ಚಟುವಟಿಕೆ: $activity, ಆಹಾರ: $diet.",
+        "mentor_summary": (
+            "ನಿಮ್ಮ ಇತ್ತೀಚಿನ ವರದಿಯನ್ನು ನಿಮ್ಮ ಪ್ರೊಫೈಲ್ ಮತ್ತು ಹಿಂದಿನ ದಾಖಲೆಗಳೊಂದಿಗೆ ಪರಿಶೀಲಿಸಿದ್ದೇನೆ. ಈ ವರದಿಯಲ್ಲಿ "
+            "$normal_count ಮಾರ್ಕರ್‌ಗಳು ಸಾಮಾನ್ಯ ವ್ಯಾಪ್ತಿಯಲ್ಲಿವೆ. ವ್ಯಾಪ್ತಿಗಿಂತ ಹೆಚ್ಚಿರುವ ಮಾರ್ಕರ್‌ಗಳು: $high. "
+            "ವ್ಯಾಪ್ತಿಗಿಂತ ಕಡಿಮೆ ಇರುವ ಮಾರ್ಕರ್‌ಗಳು: $low. ನೀವು ಹಂಚಿಕೊಂಡ ಲಕ್ಷಣಗಳು: $symptoms. ಹಿಂದಿನ ಕಾಯಿಲೆಗಳು: "
+            "$conditions. ಪ್ರಸ್ತುತ ಔಷಧಿಗಳು: $medications. ಜೀವನಶೈಲಿ: $lifestyle$notes_line ಇದನ್ನು ಶೈಕ್ಷಣಿಕ "
+            "ಮಾರ್ಗದರ್ಶನವೆಂದು ಪರಿಗಣಿಸಿ ನಿಮ್ಮ ವೈದ್ಯರೊಂದಿಗೆ ದೃಢೀಕರಿಸಿ."
+        ),
+        "trend_analysis": (
+            "$trend_hint ಈ ಪ್ರವೃತ್ತಿಯನ್ನು ಲಭ್ಯವಿರುವ ದಾಖಲೆಗಳಿಂದ ರಚಿಸಲಾಗಿದೆ; OCR ಗುಣಮಟ್ಟ ಅಥವಾ ಕಾಣೆಯಾದ "
+            "ವ್ಯಾಪ್ತಿಗಳಿಂದ ಸೀಮಿತವಾಗಿರಬಹುದು. ಹೆಚ್ಚು ವಿವರವಾದ ವಿಶ್ಲೇಷಣೆಗೆ GROQ_API_KEY ಹೊಂದಿಸಿ."
+        ),
+        "doctor_note_highlights": "ವರದಿ ಟಿಪ್ಪಣಿಗಳ ಮುಖ್ಯಾಂಶಗಳು: $notes. ",
+        "doctor_summary": (
+            "ಪ್ರೊಫೈಲ್ ಸಂದರ್ಭದೊಂದಿಗೆ ದೀರ್ಘಾವಧಿ ಪರಿಶೀಲನೆ ಸಿದ್ಧಪಡಿಸಲಾಗಿದೆ. ಪ್ರಸ್ತುತ ಹೆಚ್ಚಿನ ಮಾರ್ಕರ್‌ಗಳು: $high. "
+            "ಪ್ರಸ್ತುತ ಕಡಿಮೆ ಮಾರ್ಕರ್‌ಗಳು: $low. ತಿಳಿಸಿದ ಲಕ್ಷಣಗಳು: $symptoms. ಹಿಂದಿನ ಕಾಯಿಲೆಗಳು: $conditions. "
+            "${note_highlights}ವೈದ್ಯಕೀಯ ಇತಿಹಾಸ ಮತ್ತು ಪರೀಕ್ಷೆಯೊಂದಿಗೆ ಹೋಲಿಸಿ ನೋಡಿ."
+        ),
+        "narrative_no_params": (
+            "ಈ ಅಪ್‌ಲೋಡ್‌ನಿಂದ ಲ್ಯಾಬ್ ಮೌಲ್ಯಗಳನ್ನು ವಿಶ್ವಾಸಾರ್ಹವಾಗಿ ಓದಲು ಸಾಧ್ಯವಾಗಲಿಲ್ಲ, ಆದ್ದರಿಂದ ಈಗ ನಂಬಲರ್ಹ ವಿವರಣೆ "
+            "ನೀಡಲಾಗುವುದಿಲ್ಲ. ದಯವಿಟ್ಟು ಸ್ಪಷ್ಟ ಸ್ಕ್ಯಾನ್ ಅಪ್‌ಲೋಡ್ ಮಾಡಿ ಅಥವಾ ವರದಿಯ ಪಠ್ಯವನ್ನು ಸಾಲು ಸಾಲಾಗಿ ಅಂಟಿಸಿ. "
+            "ನಿಮ್ಮ ಪ್ರೊಫೈಲ್ ಪ್ರಕಾರ: ಲಕ್ಷಣಗಳು $symptoms, ಹಿಂದಿನ ಇತಿಹಾಸ $conditions, ಔಷಧಿಗಳು $medications. ಸುಮಾರು "
+            "$sleep ಗಂಟೆ ನಿದ್ರೆ, ಚಟುವಟಿಕೆ ಮಟ್ಟ $activity, ಆಹಾರ ಪ್ರಕಾರ $diet. ಮೌಲ್ಯಗಳು ಓದಲು ಸಾಧ್ಯವಾದ ನಂತರ "
+            "ಇವುಗಳನ್ನು ನಿಮ್ಮ ಮಾರ್ಕರ್‌ಗಳೊಂದಿಗೆ ಜೋಡಿಸಿ ಸಂಪೂರ್ಣ ವಿವರಣೆ ನೀಡುತ್ತೇನೆ."
+        ),
+        "narrative_stable": "ಈ ಬಾರಿ ಹೆಚ್ಚಿನ ಮಾರ್ಕರ್‌ಗಳು ಸ್ಥಿರವಾಗಿವೆ ಅಥವಾ ನಿರೀಕ್ಷಿತ ವ್ಯಾಪ್ತಿಯಲ್ಲಿವೆ.",
+        "narrative_attention": "ಗಮನ ಹರಿಸಬೇಕಾದ ಮುಖ್ಯ ಅಂಶಗಳು — ಹೆಚ್ಚಿನ ಮಾರ್ಕರ್‌ಗಳು: $high, ಕಡಿಮೆ ಮಾರ್ಕರ್‌ಗಳು: $low.",
+        "narrative_notes": " ನಿಮ್ಮ ವರದಿ ಟಿಪ್ಪಣಿಗಳನ್ನೂ ಪರಿಗಣಿಸಿದ್ದೇನೆ: $notes.",
+        "narrative": (
+            "ಈ ವರದಿಯನ್ನು ನಿಮ್ಮ ಹಿಂದಿನ ದಾಖಲೆಗಳು ಮತ್ತು ವೈಯಕ್ತಿಕ ಆರೋಗ್ಯ ಹಿನ್ನೆಲೆಯೊಂದಿಗೆ ಪರಿಶೀಲಿಸಿದ್ದೇನೆ, ಆದ್ದರಿಂದ "
+            "ಇದು ಒಂದು ಬಾರಿಯ ಓದು ಮಾತ್ರವಲ್ಲ. ಪ್ರಸ್ತುತ $normal_count ಮಾರ್ಕರ್‌ಗಳು ಸಾಮಾನ್ಯ ವ್ಯಾಪ್ತಿಯಲ್ಲಿವೆ, ಮತ್ತು "
+            "$stability_note ನಿಮ್ಮ ದೈನಂದಿನ ಸಂದರ್ಭದಲ್ಲಿ, ಪ್ರಸ್ತುತ ಲಕ್ಷಣಗಳು $symptoms, ಹಿನ್ನೆಲೆ ಇತಿಹಾಸ "
+            "$conditions, ಔಷಧಿ ಪಟ್ಟಿ $medications. ಸುಮಾರು $sleep ಗಂಟೆ ನಿದ್ರೆ, ಚಟುವಟಿಕೆ ಮಟ್ಟ $activity ಮತ್ತು "
+            "$diet ಆಹಾರವು ಕಾಲಕ್ರಮೇಣ ಶಕ್ತಿ, ಚೇತರಿಕೆ ಮತ್ತು ಮಾರ್ಕರ್ ಬದಲಾವಣೆಗಳ ಮೇಲೆ ಪರಿಣಾಮ ಬೀರಬಹುದು. ಕಾಲಾನುಕ್ರಮದ "
+            "ಹೋಲಿಕೆಯಲ್ಲಿ, $trend_hint ಒಂದೇ ಸಂಖ್ಯೆಗೆ ಪ್ರತಿಕ್ರಿಯಿಸುವ ಬದಲು ನಿರಂತರವಾಗಿ ಗಮನಿಸುವುದೇ ಪ್ರಾಯೋಗಿಕ ಸಲಹೆ: "
+            "ನಿದ್ರೆ ಮತ್ತು ಚಟುವಟಿಕೆಯನ್ನು ನಿಯಮಿತವಾಗಿಡಿ, ನಿಗದಿತ ಸಮಯದಲ್ಲಿ ಮರುಪರೀಕ್ಷೆ ಮಾಡಿಸಿ, ಪ್ರವೃತ್ತಿಗೆ ಹೊಂದುವ ಹೊಸ "
+            "ಲಕ್ಷಣಗಳನ್ನು ಗಮನಿಸಿ.$doctor_note_line ನಿಮ್ಮ ಸಂಪೂರ್ಣ ಇತಿಹಾಸದ ಆಧಾರದ ಮೇಲೆ ನಿರ್ಧಾರಗಳಿಗಾಗಿ ಇದನ್ನು ನಿಮ್ಮ "
+            "ವೈದ್ಯರೊಂದಿಗೆ ಚರ್ಚೆಗೆ ಸಹಾಯಕವಾಗಿ ಬಳಸಿ."
+        ),
+        "trend_single": "ಒಂದೇ ವರದಿ ಲಭ್ಯವಿದೆ, ಆದ್ದರಿಂದ ಪ್ರವೃತ್ತಿಯ ದಿಕ್ಕು ಸೀಮಿತವಾಗಿದೆ.",
+        "trend_insufficient": "ಪ್ರವೃತ್ತಿ ವಿಶ್ಲೇಷಣೆಗೆ ಸಾಕಷ್ಟು ಹೋಲಿಸಬಹುದಾದ ಮಾರ್ಕರ್‌ಗಳಿಲ್ಲ.",
+        "trend_snapshot": "ಪ್ರವೃತ್ತಿ ಸಾರಾಂಶ: $lines.",
+        "trend_line": "ನಿಮ್ಮ ವರದಿಗಳಲ್ಲಿ $name $direction",
+        "trend_out_most": ", ಹೆಚ್ಚಿನ ಸಮಯ ತನ್ನ ಉಲ್ಲೇಖ ವ್ಯಾಪ್ತಿಯಿಂದ ಹೊರಗಿತ್ತು",
+        "trend_out_part": ", ಸ್ವಲ್ಪ ಸಮಯ ತನ್ನ ಉಲ್ಲೇಖ ವ್ಯಾಪ್ತಿಯಿಂದ ಹೊರಗಿತ್ತು",
+        "trend_shift": ", ಓದುಗಳ ನಡುವೆ ಹಠಾತ್ ಬದಲಾವಣೆಯೂ ಸೇರಿದೆ",
+        "delta_up": "$name $delta ಹೆಚ್ಚಾಗಿದೆ",
+        "delta_down": "$name $delta ಕಡಿಮೆಯಾಗಿದೆ",
+        "delta_flat": "$name ಸ್ಥಿರವಾಗಿದೆ",
+        "direction_improving": "ಸುಧಾರಿಸುತ್ತಿದೆ",
+        "direction_worsening": "ಹದಗೆಡುತ್ತಿದೆ",
+        "direction_stable": "ಸ್ಥಿರವಾಗಿದೆ",
+        "direction_rising": "ಏರುತ್ತಿದೆ",
+        "direction_falling": "ಇಳಿಯುತ್ತಿದೆ",
+        "disclaimer": "ಇದು ಶೈಕ್ಷಣಿಕ ಬೆಂಬಲ ಮಾತ್ರ, ರೋಗನಿರ್ಣಯ ಅಥವಾ ಔಷಧಿ ಚೀಟಿ ಅಲ್ಲ.",
+        "caution": (
+            " ಕೆಲವು ಹೇಳಿಕೆಗಳನ್ನು ಪಡೆದ ಲ್ಯಾಬ್ ಮೌಲ್ಯಗಳೊಂದಿಗೆ ಪರಿಶೀಲಿಸಲಾಗಲಿಲ್ಲ, ಆದ್ದರಿಂದ ಈ ಸಾರಾಂಶವನ್ನು ವೈದ್ಯರೊಂದಿಗೆ "
+            "ಎಚ್ಚರಿಕೆಯಿಂದ ಪರಿಶೀಲಿಸಿ."
+        ),
+    },
+    "ml": {
+        "none": "ഒന്നുമില്ല",
+        "not_provided": "നൽകിയിട്ടില്ല",
+        "none_identified": "ഒന്നും കണ്ടെത്തിയില്ല",
+        "not_available": "ലഭ്യമല്ല",
+        "symptoms_default": "നിലവിൽ ലക്ഷണങ്ങളൊന്നും പങ്കുവെച്ചിട്ടില്ല",
+        "conditions_default": "പ്രധാന മുൻ രോഗങ്ങളൊന്നും പങ്കുവെച്ചിട്ടില്ല",
+        "medications_default": "നിലവിലെ മരുന്നുകളൊന്നും രേഖപ്പെടുത്തിയിട്ടില്ല",
+        "mentor_notes": " റിപ്പോർട്ടിലെ കുറിപ്പുകളും ശ്രദ്ധിച്ചു: $notes.",
+        "mentor_no_params": (
+            "ഏറ്റവും പുതിയ അപ്‌ലോഡിൽ നിന്ന് ലാബ് മൂല്യങ്ങൾ എടുക്കാൻ കഴിഞ്ഞില്ല. വ്യക്തമായ ഫോട്ടോ അപ്‌ലോഡ് "
+            "ചെയ്യുക അല്ലെങ്കിൽ റിപ്പോർട്ട് വാചകം വരിവരിയായി ഒട്ടിക്കുക.$notes_line"
+        ),
+        "mentor_lifestyle": "ഉറക്കം: $sleep മണിക്കൂർ, പ്രവർത്തനം: $activity, ഭക്ഷണം: $diet.",
+        "mentor_summary": (
+            "നിങ്ങളുടെ പുതിയ റിപ്പോർട്ട് പ്രൊഫൈലും മുൻ രേഖകളും ചേർത്ത് പരിശോധിച്ചു. ഈ റിപ്പോർട്ടിൽ $normal_count "
+            "മാർക്കറുകൾ സാധാരണ പരിധിയിലാണ്. പരിധിക്ക് മുകളിലുള്ള മാർക്കറുകൾ: $high. പരിധിക്ക് താഴെയുള്ള "
+            "മാർക്കറുകൾ: $low. നിങ്ങൾ പങ്കുവെച്ച ലക്ഷണങ്ങൾ: $symptoms. മുൻ രോഗങ്ങൾ: $conditions. നിലവിലെ "
+            "മരുന്നുകൾ: $medications. ജീവിതശൈലി: $lifestyle$notes_line ഇത് വിദ്യാഭ്യാസപരമായ മാർഗനിർദേശമായി "
+            "കണക്കാക്കി ഡോക്ടറുമായി ഉറപ്പാക്കുക."
+        ),
+        "trend_analysis": (
+            "$trend_hint ഈ പ്രവണത ലഭ്യമായ രേഖകളിൽ നിന്ന് തയ്യാറാക്കിയതാണ്; OCR ഗുണനിലവാരമോ ഇല്ലാത്ത പരിധികളോ "
+            "കാരണം പരിമിതമാകാം. കൂടുതൽ വിശദമായ വിശകലനത്തിന് GROQ_API_KEY സജ്ജമാക്കുക."
+        ),
+        "doctor_note_highlights": "റിപ്പോർട്ട് കുറിപ്പുകളിലെ പ്രധാന കാര്യങ്ങൾ: $notes. ",
+        "doctor_summary": (
+            "പ്രൊഫൈൽ പശ്ചാത്തലത്തോടെ ദീർഘകാല അവലോകനം തയ്യാറാക്കി. നിലവിലെ ഉയർന്ന മാർക്കറുകൾ: $high. നിലവിലെ "
+            "താഴ്ന്ന മാർക്കറുകൾ: $low. അറിയിച്ച ലക്ഷണങ്ങൾ: $symptoms. മുൻ രോഗങ്ങൾ: $conditions. "
+            "${note_highlights}ക്ലിനിക്കൽ ചരിത്രവും പരിശോധനയുമായി ഒത്തുനോക്കുക."
+        ),
+        "narrative_no_params": (
+            "ഈ അപ്‌ലോഡിൽ നിന്ന് ലാബ് മൂല്യങ്ങൾ വിശ്വസനീയമായി വായിക്കാൻ കഴിഞ്ഞില്ല, അതിനാൽ ഇപ്പോൾ വിശ്വാസയോഗ്യമായ "
+            "വ്യാഖ്യാനം നൽകാനാവില്ല. വ്യക്തമായ സ്കാൻ അപ്‌ലോഡ് ചെയ്യുക അല്ലെങ്കിൽ റിപ്പോർട്ട് വാചകം വരിവരിയായി "
+            "ഒട്ടിക്കുക. നിങ്ങളുടെ പ്രൊഫൈൽ പ്രകാരം: ലക്ഷണങ്ങൾ $symptoms, മുൻ ചരിത്രം $conditions, മരുന്നുകൾ "
+            "$medications. ഏകദേശം $sleep മണിക്കൂർ ഉറക്കം, പ്രവർത്തന നില $activity, ഭക്ഷണരീതി $diet. മൂല്യങ്ങൾ "
+            "വായിക്കാനാകുമ്പോൾ ഇവയെ നിങ്ങളുടെ മാർക്കറുകളുമായി ബന്ധിപ്പിച്ച് പൂർണ്ണ വ്യാഖ്യാനം നൽകാം."
+        ),
+        "narrative_stable": "ഈ ഘട്ടത്തിൽ മിക്ക മാർക്കറുകളും സ്ഥിരമോ പ്രതീക്ഷിത പരിധിയിലോ ആണ്.",
+        "narrative_attention": "ശ്രദ്ധ ആവശ്യമുള്ള പ്രധാന കാര്യങ്ങൾ — ഉയർന്ന മാർക്കറുകൾ: $high, താഴ്ന്ന മാർക്കറുകൾ: $low.",
+        "narrative_notes": " നിങ്ങളുടെ റിപ്പോർട്ട് കുറിപ്പുകളും പരിഗണിച്ചു: $notes.",
+        "narrative": (
+            "ഈ റിപ്പോർട്ട് നിങ്ങളുടെ മുൻ രേഖകളും വ്യക്തിഗത ആരോഗ്യ പശ്ചാത്തലവും ചേർത്താണ് പരിശോധിച്ചത്, അതിനാൽ "
+            "ഇത് ഒറ്റത്തവണ വായന മാത്രമല്ല. നിലവിൽ $normal_count മാർക്കറുകൾ സാധാരണ പരിധിയിലാണ്, കൂടാതെ "
+            "$stability_note നിങ്ങളുടെ ദൈനംദിന സാഹചര്യത്തിൽ, നിലവിലെ ലക്ഷണങ്ങൾ $symptoms, പശ്ചാത്തല ചരിത്രം "
+            "$conditions, മരുന്ന് പട്ടിക $medications. ഏകദേശം $sleep മണിക്കൂർ ഉറക്കം, പ്രവർത്തന നില $activity, "
+            "$diet ഭക്ഷണരീതി എന്നിവ കാലക്രമേണ ഊർജ്ജം, വീണ്ടെടുപ്പ്, മാർക്കർ മാറ്റങ്ങൾ എന്നിവയെ സ്വാധീനിക്കാം. "
+            "കാലക്രമ താരതമ്യത്തിൽ, $trend_hint ഒരു സംഖ്യയോട് മാത്രം പ്രതികരിക്കുന്നതിന് പകരം സ്ഥിരമായി "
+            "നിരീക്ഷിക്കുക എന്നതാണ് പ്രായോഗിക നിർദേശം: ഉറക്കവും പ്രവർത്തനവും ക്രമമായി നിലനിർത്തുക, സമയത്ത് "
+            "തുടർപരിശോധന നടത്തുക, പ്രവണതയുമായി യോജിക്കുന്ന പുതിയ ലക്ഷണങ്ങൾ ശ്രദ്ധിക്കുക.$doctor_note_line "
+            "നിങ്ങളുടെ പൂർണ്ണ ചരിത്രത്തെ അടിസ്ഥാനമാക്കി തീരുമാനങ്ങൾ എടുക്കാൻ ഇത് ഡോക്ടറുമായുള്ള ചർച്ചയ്ക്ക് "
+            "സഹായിയായി ഉപയോഗിക്കുക."
+        ),
+        "trend_single": "ഒരു റിപ്പോർട്ട് മാത്രമേ ലഭ്യമുള്ളൂ, അതിനാൽ പ്രവണതയുടെ ദിശ പരിമിതമാണ്.",
+        "trend_insufficient": "പ്രവണത വിശകലനത്തിന് താരതമ്യം ചെയ്യാവുന്ന മാർക്കറുകൾ മതിയായില്ല.",
+        "trend_snapshot": "പ്രവണത സംഗ്രഹം: $lines.",
+        "trend_line": "നിങ്ങളുടെ റിപ്പോർട്ടുകളിൽ $name $direction",
+        "trend_out_most": ", മിക്ക സമയവും റഫറൻസ് പരിധിക്ക് പുറത്തായിരുന്നു",
+        "trend_out_part": ", കുറച്ച് സമയം റഫറൻസ് പരിധിക്ക് പുറത്തായിരുന്നു",
+        "trend_shift": ", റീഡിംഗുകൾക്കിടയിലെ പെട്ടെന്നുള്ള മാറ്റം ഉൾപ്പെടെ",
+        "delta_up": "$name $delta വർധിച്ചു",
+        "delta_down": "$name $delta കുറഞ്ഞു",
+        "delta_flat": "$name സ്ഥിരമായി തുടർന്നു",
+        "direction_improving": "മെച്ചപ്പെടുന്നു",
+        "direction_worsening": "മോശമാകുന്നു",
+        "direction_stable": "സ്ഥിരമാണ്",
+        "direction_rising": "ഉയരുന്നു",
+        "direction_falling": "താഴുന്നു",
+        "disclaimer": "ഇത് വിദ്യാഭ്യാസപരമായ പിന്തുണ മാത്രമാണ്, രോഗനിർണയമോ കുറിപ്പടിയോ അല്ല.",
+        "caution": (
+            " ചില അവകാശവാദങ്ങൾ എടുത്ത ലാബ് മൂല്യങ്ങളുമായി ഒത്തുനോക്കാൻ കഴിഞ്ഞില്ല, അതിനാൽ ഈ സംഗ്രഹം ഡോക്ടറുമായി "
+            "ശ്രദ്ധാപൂർവം അവലോകനം ചെയ്യുക."
+        ),
+    },
+    "bn": {
+        "none": "কোনোটিই নয়",
+        "not_provided": "দেওয়া হয়নি",
+        "none_identified": "কিছু শনাক্ত হয়নি",
+        "not_available": "উপলব্ধ নয়",
+        "symptoms_default": "বর্তমানে কোনো উপসর্গ জানানো হয়নি",
+        "conditions_default": "কোনো বড় পূর্ববর্তী রোগ জানানো হয়নি",
+        "medications_default": "বর্তমানে কোনো ওষুধ তালিকাভুক্ত নেই",
+        "mentor_notes": " রিপোর্টের মন্তব্য/নোটও লক্ষ্য করেছি: $notes.",
+        "mentor_no_params": (
+            "সাম্প্রতিক আপলোড থেকে কোনো ল্যাব মান বের করা যায়নি। অনুগ্রহ করে আরও স্পষ্ট ছবি আপলোড করুন বা "
+            "রিপোর্টের লেখা লাইন ধরে পেস্ট করুন।$notes_line"
+        ),
+        "mentor_lifestyle": "ঘুম: $sleep ঘণ্টা, শারীরিক কার্যকলাপ: $activity, খাদ্য: $diet.",
+        "mentor_summary": (
+            "আপনার সাম্প্রতিক রিপোর্ট আপনার প্রোফাইল ও আগের রেকর্ডের সাথে মিলিয়ে দেখেছি। এই রিপোর্টে "
+            "$normal_count টি মার্কার স্বাভাবিক সীমায় আছে। সীমার চেয়ে বেশি মার্কার: $high. সীমার চেয়ে কম "
+            "মার্কার: $low. আপনার জানানো উপসর্গ: $symptoms. পূর্ববর্তী রোগ: $conditions. বর্তমান ওষুধ: "
+            "$medications. জীবনযাত্রা: $lifestyle$notes_line এটিকে শিক্ষামূলক নির্দেশনা হিসেবে নিন এবং আপনার "
+            "চিকিৎসকের সাথে নিশ্চিত করুন।"
+        ),
+        "trend_analysis": (
+            "$trend_hint এই প্রবণতা উপলব্ধ রেকর্ড থেকে তৈরি; OCR-এর মান বা অনুপস্থিত সীমার কারণে সীমিত হতে পারে। "
+            "আরও বিস্তারিত বিশ্লেষণের জন্য GROQ_API_KEY সেট করুন।"
+        ),
+        "doctor_note_highlights": "রিপোর্ট নোটের মূল বিষয়: $notes. ",
+        "doctor_summary": (
+            "প্রোফাইল প্রসঙ্গসহ দীর্ঘমেয়াদি পর্যালোচনা প্রস্তুত। বর্তমান উচ্চ মার্কার: $high. বর্তমান নিম্ন "
+            "মার্কার: $low. জানানো উপসর্গ: $symptoms. পূর্ববর্তী রোগ: $conditions. ${note_highlights}ক্লিনিক্যাল "
+            "ইতিহাস ও পরীক্ষার সাথে মিলিয়ে দেখুন।"
+        ),
+        "narrative_no_params": (
+            "এই আপলোড থেকে ল্যাব মান নির্ভরযোগ্যভাবে পড়া যায়নি, তাই এখনই বিশ্বাসযোগ্য ব্যাখ্যা দিতে পারছি না। "
+            "অনুগ্রহ করে স্পষ্ট স্ক্যান আপলোড করুন বা রিপোর্টের লেখা লাইন ধরে পেস্ট করুন। আপনার প্রোফাইল "
+            "অনুযায়ী: উপসর্গ $symptoms, পূর্ব ইতিহাস $conditions, ওষুধ $medications. প্রায় $sleep ঘণ্টা ঘুম, "
+            "কার্যকলাপের মাত্রা $activity, খাদ্যের ধরন $diet. মানগুলো পড়া গেলে এগুলো আপনার মার্কারের সাথে যুক্ত "
+            "করে সম্পূর্ণ ব্যাখ্যা দেব।"
+        ),
+        "narrative_stable": "এই পর্বে বেশিরভাগ মার্কার স্থিতিশীল বা প্রত্যাশিত সীমার মধ্যে আছে।",
+        "narrative_attention": "মনোযোগ দেওয়ার মূল বিষয় — উচ্চ মার্কার: $high, নিম্ন মার্কার: $low.",
+        "narrative_notes": " আপনার রিপোর্টের নোটও বিবেচনা করেছি: $notes.",
+        "narrative": (
+            "এই রিপোর্টটি আপনার আগের রেকর্ড ও ব্যক্তিগত স্বাস্থ্য পটভূমির সাথে মিলিয়ে দেখেছি, তাই এটি কেবল "
+            "একবারের পাঠ নয়। বর্তমানে $normal_count টি মার্কার স্বাভাবিক সীমায় আছে, এবং $stability_note আপনার "
+            "দৈনন্দিন প্রেক্ষাপটে, বর্তমান উপসর্গ $symptoms, পটভূমি ইতিহাস $conditions, ওষুধের তালিকা "
+            "$medications. প্রায় $sleep ঘণ্টা ঘুম, কার্যকলাপের মাত্রা $activity এবং $diet খাদ্যাভ্যাস সময়ের "
+            "সাথে শক্তি, সুস্থতা ও মার্কারের পরিবর্তনে প্রভাব ফেলতে পারে। সময়রেখার তুলনায়, $trend_hint একটি "
+            "সংখ্যায় প্রতিক্রিয়া না দেখিয়ে ধারাবাহিকভাবে পর্যবেক্ষণ করাই ব্যবহারিক পরামর্শ: ঘুম ও কার্যকলাপ "
+            "নিয়মিত রাখুন, সময়মতো পুনরায় পরীক্ষা করান এবং প্রবণতার সাথে মেলে এমন নতুন উপসর্গ লক্ষ্য "
+            "করুন।$doctor_note_line আপনার সম্পূর্ণ ইতিহাসের ভিত্তিতে সিদ্ধান্ত নিতে এটি চিকিৎসকের সাথে আলোচনার "
+            "সহায়ক হিসেবে ব্যবহার করুন।"
+        ),
+        "trend_single": "কেবল একটি রিপোর্ট উপলব্ধ, তাই প্রবণতার দিক সীমিত।",
+        "trend_insufficient": "প্রবণতা বিশ্লেষণের জন্য তুলনীয় মার্কার যথেষ্ট নয়।",
+        "trend_snapshot": "প্রবণতার সারাংশ: $lines.",
+        "trend_line": "আপনার রিপোর্টগুলোতে $name $direction",
+        "trend_out_most": ", এবং বেশিরভাগ সময় রেফারেন্স সীমার বাইরে ছিল",
+        "trend_out_part": ", এবং কিছু সময় রেফারেন্স সীমার বাইরে ছিল",
+        "trend_shift": ", পাঠের মধ্যে হঠাৎ পরিবর্তনসহ",
+        "delta_up": "$name $delta বেড়েছে",
+        "delta_down": "$name $delta কমেছে",
+        "delta_flat": "$name স্থিতিশীল ছিল",
+        "direction_improving": "উন্নতি হচ্ছে",
+        "direction_worsening": "অবনতি হচ্ছে",
+        "direction_stable": "স্থিতিশীল",
+        "direction_rising": "বাড়ছে",
+        "direction_falling": "কমছে",
+        "disclaimer": "এটি কেবল শিক্ষামূলক সহায়তা, রোগনির্ণয় বা প্রেসক্রিপশন নয়।",
+        "caution": (
+            " কিছু দাবি প্রাপ্ত ল্যাব মানের সাথে যাচাই করা যায়নি, তাই এই সারাংশ চিকিৎসকের সাথে সতর্কভাবে "
+            "পর্যালোচনা করুন।"
+        ),
+    },
+    "mr": {
+        "none": "काहीही नाही",
+        "not_provided": "दिलेले नाही",
+        "none_identified": "काहीही आढळले नाही",
+        "not_available": "उपलब्ध नाही",
+        "symptoms_default": "सध्या कोणतीही लक्षणे सांगितलेली नाहीत",
+        "conditions_default": "कोणतेही मोठे पूर्वीचे आजार सांगितलेले नाहीत",
+        "medications_default": "सध्याची कोणतीही औषधे नोंदवलेली नाहीत",
+        "mentor_notes": " अहवालातील टिप्पण्या/नोंदीही लक्षात घेतल्या: $notes.",
+        "mentor_no_params": (
+            "नवीनतम अपलोडमधून कोणतीही लॅब मूल्ये काढता आली नाहीत. कृपया अधिक स्पष्ट फोटो अपलोड करा किंवा "
+            "अहवालाचा मजकूर ओळीनुसार पेस्ट करा.$notes_line"
+        ),
+        "mentor_lifestyle": "झोप: $sleep तास, हालचाल: $activity, आहार: $diet.",
+        "mentor_summary": (
+            "तुमचा नवीनतम अहवाल तुमच्या प्रोफाइल आणि मागील नोंदींसह तपासला. या अहवालात $normal_count मार्कर "
+            "सामान्य मर्यादेत आहेत. मर्यादेपेक्षा जास्त मार्कर: $high. मर्यादेपेक्षा कमी मार्कर: $low. तुम्ही "
+            "सांगितलेली लक्षणे: $symptoms. पूर्वीचे आजार: $conditions. सध्याची औषधे: $medications. जीवनशैली: "
+            "$lifestyle$notes_line हे शैक्षणिक मार्गदर्शन म्हणून घ्या आणि तुमच्या डॉक्टरांकडून खात्री करा."
+        ),
+        "trend_analysis": (
+            "$trend_hint हा कल उपलब्ध नोंदींवरून तयार केला आहे; OCR गुणवत्ता किंवा नसलेल्या मर्यादांमुळे "
+            "मर्यादित असू शकतो. अधिक सविस्तर विश्लेषणासाठी GROQ_API_KEY सेट करा."
+        ),
+        "doctor_note_highlights": "अहवाल नोंदींचे मुख्य मुद्दे: $notes. ",
+        "doctor_summary": (
+            "प्रोफाइल संदर्भासह दीर्घकालीन आढावा तयार केला. सध्याचे उच्च मार्कर: $high. सध्याचे कमी मार्कर: "
+            "$low. सांगितलेली लक्षणे: $symptoms. पूर्वीचे आजार: $conditions. ${note_highlights}कृपया क्लिनिकल "
+            "इतिहास आणि तपासणीशी जुळवून पाहा."
+        ),
+        "narrative_no_params": (
+            "या अपलोडमधून लॅब मूल्ये विश्वासार्हपणे वाचता आली नाहीत, त्यामुळे आत्ता विश्वासार्ह अर्थ सांगता येत "
+            "नाही. कृपया स्पष्ट स्कॅन अपलोड करा किंवा अहवालाचा मजकूर ओळीनुसार पेस्ट करा. तुमच्या प्रोफाइलनुसार: "
+            "लक्षणे $symptoms, पूर्वीचा इतिहास $conditions, औषधे $medications. सुमारे $sleep तास झोप, हालचालीची "
+            "पातळी $activity, आहार प्रकार $diet. मूल्ये वाचता आल्यावर हे घटक तुमच्या मार्करशी जोडून संपूर्ण अर्थ "
+            "सांगेन."
+        ),
+        "narrative_stable": "या वेळी बहुतेक मार्कर स्थिर किंवा अपेक्षित मर्यादेत आहेत.",
+        "narrative_attention": "लक्ष देण्याजोगे मुख्य मुद्दे — उच्च मार्कर: $high, कमी मार्कर: $low.",
+        "narrative_notes": " तुमच्या अहवालातील नोंदीही विचारात घेतल्या: $notes.",
+        "narrative": (
+            "हा अहवाल तुमच्या मागील नोंदी आणि वैयक्तिक आरोग्य पार्श्वभूमीसह तपासला आहे, त्यामुळे हे केवळ एकदाचे "
+            "वाचन नाही. सध्या $normal_count मार्कर सामान्य मर्यादेत आहेत, आणि $stability_note तुमच्या दैनंदिन "
+            "संदर्भात, सध्याची लक्षणे $symptoms, पार्श्वभूमी इतिहास $conditions, औषधांची यादी $medications. "
+            "सुमारे $sleep तास झोप, हालचालीची पातळी $activity आणि $diet आहार यांचा कालांतराने ऊर्जा, "
+            "पुनर्प्राप्ती आणि मार्करमधील बदलांवर परिणाम होऊ शकतो. कालक्रमानुसार तुलनेत, $trend_hint एका "
+            "संख्येवर प्रतिक्रिया देण्याऐवजी सातत्याने निरीक्षण करणे हा व्यावहारिक सल्ला आहे: झोप आणि हालचाल "
+            "नियमित ठेवा, वेळेवर पुन्हा चाचणी करा आणि कलाशी जुळणारी नवी लक्षणे लक्षात घ्या.$doctor_note_line "
+            "तुमच्या संपूर्ण इतिहासावर आधारित निर्णयांसाठी हे डॉक्टरांशी चर्चेचे साधन म्हणून वापरा."
+        ),
+        "trend_single": "फक्त एकच अहवाल उपलब्ध आहे, त्यामुळे कलाची दिशा मर्यादित आहे.",
+        "trend_insufficient": "कल विश्लेषणासाठी पुरेसे तुलनीय मार्कर नाहीत.",
+        "trend_snapshot": "कल सारांश: $lines.",
+        "trend_line": "तुमच्या अहवालांमध्ये $name $direction",
+        "trend_out_most": ", आणि बहुतेक काळ संदर्भ मर्यादेबाहेर होते",
+        "trend_out_part": ", आणि काही काळ संदर्भ मर्यादेबाहेर होते",
+        "trend_shift": ", वाचनांमधील अचानक बदलासह",
+        "delta_up": "$name $delta ने वाढले",
+        "delta_down": "$name $delta ने कमी झाले",
+        "delta_flat": "$name स्थिर राहिले",
+        "direction_improving": "सुधारत आहे",
+        "direction_worsening": "बिघडत आहे",
+        "direction_stable": "स्थिर आहे",
+        "direction_rising": "वाढत आहे",
+        "direction_falling": "कमी होत आहे",
+        "disclaimer": "हे केवळ शैक्षणिक सहाय्य आहे, निदान किंवा औषधोपचार नाही.",
+        "caution": (
+            " काही दावे काढलेल्या लॅब मूल्यांशी पडताळता आले नाहीत, त्यामुळे हा सारांश डॉक्टरांसोबत काळजीपूर्वक "
+            "तपासा."
+        ),
+    },
+    "gu": {
+        "none": "કોઈ નહીં",
+        "not_provided": "આપેલ નથી",
+        "none_identified": "કંઈ ઓળખાયું નથી",
+        "not_available": "ઉપલબ્ધ નથી",
+        "symptoms_default": "હાલમાં કોઈ લક્ષણો જણાવ્યા નથી",
+        "conditions_default": "કોઈ મોટી અગાઉની બીમારી જણાવી નથી",
+        "medications_default": "હાલની કોઈ દવાઓ નોંધાયેલી નથી",
+        "mentor_notes": " રિપોર્ટની ટિપ્પણીઓ/નોંધો પણ ધ્યાનમાં લીધી: $notes.",
+        "mentor_no_params": (
+            "તાજેતરના અપલોડમાંથી કોઈ લેબ મૂલ્યો મેળવી શકાયા નથી. કૃપા કરીને વધુ સ્પષ્ટ ફોટો અપલોડ કરો અથવા "
+            "રિપોર્ટનું લખાણ લીટી પ્રમાણે પેસ્ટ કરો.$notes_line"
+        ),
+        "mentor_lifestyle": "ઊંઘ: $sleep કલાક, પ્રવૃત્તિ: $activity, આહાર: $diet.",
+        "mentor_summary": (
+            "તમારો તાજેતરનો રિપોર્ટ તમારી પ્રોફાઇલ અને અગાઉના રેકોર્ડ સાથે તપાસ્યો. આ રિપોર્ટમાં $normal_count "
+            "માર્કર સામાન્ય શ્રેણીમાં છે. શ્રેણી કરતાં વધુ માર્કર: $high. શ્રેણી કરતાં ઓછા માર્કર: $low. તમે "
+            "જણાવેલા લક્ષણો: $symptoms. અગાઉની બીમારીઓ: $conditions. હાલની દવાઓ: $medications. જીવનશૈલી: "
+            "$lifestyle$notes_line આને શૈક્ષણિક માર્ગદર્શન તરીકે લો અને તમારા ડૉક્ટર સાથે પુષ્ટિ કરો."
+        ),
+        "trend_analysis": (
+            "$trend_hint આ વલણ ઉપલબ્ધ રેકોર્ડમાંથી તૈયાર કરાયું છે; OCR ગુણવત્તા અથવા ખૂટતી શ્રેણીઓને કારણે "
+            "મર્યાદિત હોઈ શકે. વધુ વિગતવાર વિશ્લેષણ માટે GROQ_API_KEY સેટ કરો."
+        ),
+        "doctor_note_highlights": "રિપોર્ટ નોંધોના મુખ્ય મુદ્દા: $notes. ",
+        "doctor_summary": (
+            "પ્રોફાઇલ સંદર્ભ સાથે લાંબા ગાળાની સમીક્ષા તૈયાર કરી. હાલના ઊંચા માર્કર: $high. હાલના નીચા માર્કર: "
+            "$low. જણાવેલા લક્ષણો: $symptoms. અગાઉની બીમારીઓ: $conditions. ${note_highlights}કૃપા કરીને ક્લિનિકલ "
+            "ઇતિહાસ અને તપાસ સાથે સરખાવો."
+        ),
+        "narrative_no_params": (
+            "આ અપલોડમાંથી લેબ મૂલ્યો વિશ્વસનીય રીતે વાંચી શકાયા નથી, તેથી હમણાં વિશ્વસનીય અર્થઘટન આપી શકતો નથી. "
+            "કૃપા કરીને સ્પષ્ટ સ્કેન અપલોડ કરો અથવા રિપોર્ટનું લખાણ લીટી પ્રમાણે પેસ્ટ કરો. તમારી પ્રોફાઇલ મુજબ: "
+            "લક્ષણો $symptoms, અગાઉનો ઇતિહાસ $conditions, દવાઓ $medications. આશરે $sleep કલાક ઊંઘ, પ્રવૃત્તિ "
+            "સ્તર $activity, આહાર પ્રકાર $diet. મૂલ્યો વાંચી શકાય ત્યારે આ પરિબળોને તમારા માર્કર સાથે જોડીને "
+            "સંપૂર્ણ અર્થઘટન આપીશ."
+        ),
+        "narrative_stable": "આ વખતે મોટાભાગના માર્કર સ્થિર અથવા અપેક્ષિત શ્રેણીમાં છે.",
+        "narrative_attention": "ધ્યાન આપવાના મુખ્ય મુદ્દા — ઊંચા માર્કર: $high, નીચા માર્કર: $low.",
+        "narrative_notes": " તમારા રિપોર્ટની નોંધો પણ ધ્યાનમાં લીધી: $notes.",
+        "narrative": (
+            "આ રિપોર્ટ તમારા અગાઉના રેકોર્ડ અને વ્યક્તિગત આરોગ્ય પૃષ્ઠભૂમિ સાથે તપાસ્યો છે, તેથી આ માત્ર એક "
+            "વખતનું વાંચન નથી. હાલમાં $normal_count માર્કર સામાન્ય શ્રેણીમાં છે, અને $stability_note તમારા "
+            "રોજિંદા સંદર્ભમાં, હાલના લક્ષણો $symptoms, પૃષ્ઠભૂમિ ઇતિહાસ $conditions, દવાઓની યાદી $medications. "
+            "આશરે $sleep કલાક ઊંઘ, પ્રવૃત્તિ સ્તર $activity અને $diet આહાર સમય જતાં ઊર્જા, સ્વસ્થતા અને માર્કરના "
+            "ફેરફારોને અસર કરી શકે છે. સમયરેખાની સરખામણીમાં, $trend_hint એક આંકડા પર પ્રતિક્રિયા આપવાને બદલે સતત "
+            "નિરીક્ષણ કરવું એ વ્યવહારુ સલાહ છે: ઊંઘ અને પ્રવૃત્તિ નિયમિત રાખો, સમયસર ફરી તપાસ કરાવો અને વલણ સાથે "
+            "મેળ ખાતા નવા લક્ષણો પર ધ્યાન આપો.$doctor_note_line તમારા સંપૂર્ણ ઇતિહાસના આધારે નિર્ણયો માટે આનો "
+            "ઉપયોગ ડૉક્ટર સાથેની ચર્ચામાં સહાયક તરીકે કરો."
+        ),
+        "trend_single": "ફક્ત એક જ રિપોર્ટ ઉપલબ્ધ છે, તેથી વલણની દિશા મર્યાદિત છે.",
+        "trend_insufficient": "વલણ વિશ્લેષણ માટે પૂરતા તુલનાત્મક માર્કર નથી.",
+        "trend_snapshot": "વલણ સારાંશ: $lines.",
+        "trend_line": "તમારા રિપોર્ટમાં $name $direction",
+        "trend_out_most": ", અને મોટાભાગનો સમય સંદર્ભ શ્રેણીની બહાર રહ્યું",
+        "trend_out_part": ", અને થોડો સમય સંદર્ભ શ્રેણીની બહાર રહ્યું",
+        "trend_shift": ", વાંચન વચ્ચેના અચાનક ફેરફાર સહિત",
+        "delta_up": "$name $delta વધ્યું",
+        "delta_down": "$name $delta ઘટ્યું",
+        "delta_flat": "$name સ્થિર રહ્યું",
+        "direction_improving": "સુધરી રહ્યું છે",
+        "direction_worsening": "બગડી રહ્યું છે",
+        "direction_stable": "સ્થિર છે",
+        "direction_rising": "વધી રહ્યું છે",
+        "direction_falling": "ઘટી રહ્યું છે",
+        "disclaimer": "આ માત્ર શૈક્ષણિક સહાય છે, નિદાન કે પ્રિસ્ક્રિપ્શન નથી.",
+        "caution": " કેટલાક દાવા મેળવેલા લેબ મૂલ્યો સાથે ચકાસી શકાયા નથી, તેથી આ સારાંશ ડૉક્ટર સાથે કાળજીપૂર્વક તપાસો.",
+    },
+    "pa": {
+        "none": "ਕੋਈ ਨਹੀਂ",
+        "not_provided": "ਨਹੀਂ ਦਿੱਤਾ ਗਿਆ",
+        "none_identified": "ਕੁਝ ਨਹੀਂ ਮਿਲਿਆ",
+        "not_available": "ਉਪਲਬਧ ਨਹੀਂ",
+        "symptoms_default": "ਇਸ ਸਮੇਂ ਕੋਈ ਲੱਛਣ ਸਾਂਝੇ ਨਹੀਂ ਕੀਤੇ",
+        "conditions_default": "ਕੋਈ ਵੱਡੀ ਪਿਛਲੀ ਬਿਮਾਰੀ ਸਾਂਝੀ ਨਹੀਂ ਕੀਤੀ",
+        "medications_default": "ਮੌਜੂਦਾ ਕੋਈ ਦਵਾਈ ਦਰਜ ਨਹੀਂ",
+        "mentor_notes": " ਰਿਪੋਰਟ ਦੀਆਂ ਟਿੱਪਣੀਆਂ/ਨੋਟ ਵੀ ਵੇਖੇ: $notes.",
+        "mentor_no_params": (
+            "ਤਾਜ਼ਾ ਅਪਲੋਡ ਤੋਂ ਕੋਈ ਲੈਬ ਮੁੱਲ ਨਹੀਂ ਕੱਢੇ ਜਾ ਸਕੇ। ਕਿਰਪਾ ਕਰਕੇ ਸਾਫ਼ ਫੋਟੋ ਅਪਲੋਡ ਕਰੋ ਜਾਂ ਰਿਪੋਰਟ ਦਾ ਪਾਠ "
+            "ਲਾਈਨ-ਦਰ-ਲਾਈਨ ਪੇਸਟ ਕਰੋ।$notes_line"
+        ),
+        "mentor_lifestyle": "ਨੀਂਦ: $sleep ਘੰਟੇ, ਸਰਗਰਮੀ: $activity, ਖੁਰਾਕ: $diet.",
+        "mentor_summary": (
+            "ਤੁਹਾਡੀ ਤਾਜ਼ਾ ਰਿਪੋਰਟ ਤੁਹਾਡੀ ਪ੍ਰੋਫਾਈਲ ਅਤੇ ਪਿਛਲੇ ਰਿਕਾਰਡਾਂ ਨਾਲ ਮਿਲਾ ਕੇ ਵੇਖੀ। ਇਸ ਰਿਪੋਰਟ ਵਿੱਚ "
+            "$normal_count ਮਾਰਕਰ ਆਮ ਸੀਮਾ ਵਿੱਚ ਹਨ। ਸੀਮਾ ਤੋਂ ਵੱਧ ਮਾਰਕਰ: $high. ਸੀਮਾ ਤੋਂ ਘੱਟ ਮਾਰਕਰ: $low. ਤੁਹਾਡੇ "
+            "ਦੱਸੇ ਲੱਛਣ: $symptoms. ਪਿਛਲੀਆਂ ਬਿਮਾਰੀਆਂ: $conditions. ਮੌਜੂਦਾ ਦਵਾਈਆਂ: $medications. ਜੀਵਨਸ਼ੈਲੀ: "
+            "$lifestyle$notes_line ਇਸਨੂੰ ਸਿੱਖਿਆਤਮਕ ਮਾਰਗਦਰਸ਼ਨ ਸਮਝੋ ਅਤੇ ਆਪਣੇ ਡਾਕਟਰ ਨਾਲ ਪੁਸ਼ਟੀ ਕਰੋ।"
+        ),
+        "trend_analysis": (
+            "$trend_hint ਇਹ ਰੁਝਾਨ ਉਪਲਬਧ ਰਿਕਾਰਡਾਂ ਤੋਂ ਤਿਆਰ ਕੀਤਾ ਗਿਆ ਹੈ; OCR ਗੁਣਵੱਤਾ ਜਾਂ ਗੁੰਮ ਸੀਮਾਵਾਂ ਕਾਰਨ ਸੀਮਤ ਹੋ "
+            "ਸਕਦਾ ਹੈ। ਵਧੇਰੇ ਵਿਸਤ੍ਰਿਤ ਵਿਸ਼ਲੇਸ਼ਣ ਲਈ GROQ_API_KEY ਸੈੱਟ ਕਰੋ।"
+        ),
+        "doctor_note_highlights": "ਰਿਪੋਰਟ ਨੋਟਾਂ ਦੇ ਮੁੱਖ ਨੁਕਤੇ: $notes. ",
+        "doctor_summary": (
+            "ਪ੍ਰੋਫਾਈਲ ਸੰਦਰਭ ਨਾਲ ਲੰਬੇ ਸਮੇਂ ਦੀ ਸਮੀਖਿਆ ਤਿਆਰ ਕੀਤੀ। ਮੌਜੂਦਾ ਉੱਚ ਮਾਰਕਰ: $high. ਮੌਜੂਦਾ ਘੱਟ ਮਾਰਕਰ: $low. "
+            "ਦੱਸੇ ਲੱਛਣ: $symptoms. ਪਿਛਲੀਆਂ ਬਿਮਾਰੀਆਂ: $conditions. ${note_highlights}ਕਿਰਪਾ ਕਰਕੇ ਕਲੀਨਿਕਲ ਇਤਿਹਾਸ "
+            "ਅਤੇ ਜਾਂਚ ਨਾਲ ਮਿਲਾਓ।"
+        ),
+        "narrative_no_params": (
+            "ਇਸ ਅਪਲੋਡ ਤੋਂ ਲੈਬ ਮੁੱਲ ਭਰੋਸੇਯੋਗ ਢੰਗ ਨਾਲ ਪੜ੍ਹੇ ਨਹੀਂ ਜਾ ਸਕੇ, ਇਸ ਲਈ ਹੁਣੇ ਭਰੋਸੇਯੋਗ ਵਿਆਖਿਆ ਨਹੀਂ ਦੇ ਸਕਦਾ। "
+            "ਕਿਰਪਾ ਕਰਕੇ ਸਾਫ਼ ਸਕੈਨ ਅਪਲੋਡ ਕਰੋ ਜਾਂ ਰਿਪੋਰਟ ਦਾ ਪਾਠ ਲਾਈਨ-ਦਰ-ਲਾਈਨ ਪੇਸਟ ਕਰੋ। ਤੁਹਾਡੀ ਪ੍ਰੋਫਾਈਲ ਅਨੁਸਾਰ: "
+            "ਲੱਛਣ $symptoms, ਪਿਛਲਾ ਇਤਿਹਾਸ $conditions, ਦਵਾਈਆਂ $medications. ਲਗਭਗ $sleep ਘੰਟੇ ਨੀਂਦ, ਸਰਗਰਮੀ ਪੱਧਰ "
+            "$activity, ਖੁਰਾਕ ਕਿਸਮ $diet. ਮੁੱਲ ਪੜ੍ਹਨਯੋਗ ਹੋਣ 'ਤੇ ਇਨ੍ਹਾਂ ਨੂੰ ਤੁਹਾਡੇ ਮਾਰਕਰਾਂ ਨਾਲ ਜੋੜ ਕੇ ਪੂਰੀ ਵਿਆਖਿਆ "
+            "ਦਿਆਂਗਾ।"
+        ),
+        "narrative_stable": "ਇਸ ਵਾਰ ਜ਼ਿਆਦਾਤਰ ਮਾਰਕਰ ਸਥਿਰ ਜਾਂ ਉਮੀਦ ਕੀਤੀ ਸੀਮਾ ਵਿੱਚ ਹਨ।",
+        "narrative_attention": "ਧਿਆਨ ਦੇਣ ਵਾਲੇ ਮੁੱਖ ਨੁਕਤੇ — ਉੱਚ ਮਾਰਕਰ: $high, ਘੱਟ ਮਾਰਕਰ: $low.",
+        "narrative_notes": " ਤੁਹਾਡੀ ਰਿਪੋਰਟ ਦੇ ਨੋਟ ਵੀ ਧਿਆਨ ਵਿੱਚ ਰੱਖੇ: $notes.",
+        "narrative": (
+            "ਇਹ ਰਿਪੋਰਟ ਤੁਹਾਡੇ ਪਿਛਲੇ ਰਿਕਾਰਡਾਂ ਅਤੇ ਨਿੱਜੀ ਸਿਹਤ ਪਿਛੋਕੜ ਨਾਲ ਮਿਲਾ ਕੇ ਵੇਖੀ ਗਈ ਹੈ, ਇਸ ਲਈ ਇਹ ਸਿਰਫ਼ ਇੱਕ "
+            "ਵਾਰ ਦੀ ਰੀਡਿੰਗ ਨਹੀਂ ਹੈ। ਇਸ ਸਮੇਂ $normal_count ਮਾਰਕਰ ਆਮ ਸੀਮਾ ਵਿੱਚ ਹਨ, ਅਤੇ $stability_note ਤੁਹਾਡੇ "
+            "ਰੋਜ਼ਾਨਾ ਸੰਦਰਭ ਵਿੱਚ, ਮੌਜੂਦਾ ਲੱਛਣ $symptoms, ਪਿਛੋਕੜ ਇਤਿਹਾਸ $conditions, ਦਵਾਈਆਂ ਦੀ ਸੂਚੀ $medications. "
+            "ਲਗਭਗ $sleep ਘੰਟੇ ਨੀਂਦ, ਸਰਗਰਮੀ ਪੱਧਰ $activity ਅਤੇ $diet ਖੁਰਾਕ ਸਮੇਂ ਨਾਲ ਊਰਜਾ, ਸਿਹਤਯਾਬੀ ਅਤੇ ਮਾਰਕਰ "
+            "ਤਬਦੀਲੀਆਂ ਨੂੰ ਪ੍ਰਭਾਵਿਤ ਕਰ ਸਕਦੇ ਹਨ। ਸਮਾਂ-ਰੇਖਾ ਤੁਲਨਾ ਵਿੱਚ, $trend_hint ਇੱਕ ਅੰਕ 'ਤੇ ਪ੍ਰਤੀਕਿਰਿਆ ਦੀ ਬਜਾਏ "
+            "ਲਗਾਤਾਰ ਨਿਗਰਾਨੀ ਕਰਨਾ ਹੀ ਵਿਹਾਰਕ ਸਲਾਹ ਹੈ: ਨੀਂਦ ਅਤੇ ਸਰਗਰਮੀ ਨਿਯਮਤ ਰੱਖੋ, ਸਮੇਂ ਸਿਰ ਦੁਬਾਰਾ ਜਾਂਚ ਕਰਵਾਓ ਅਤੇ "
+            "ਰੁਝਾਨ ਨਾਲ ਮੇਲ ਖਾਂਦੇ ਨਵੇਂ ਲੱਛਣਾਂ 'ਤੇ ਧਿਆਨ ਦਿਓ।$doctor_note_line ਆਪਣੇ ਪੂਰੇ ਇਤਿਹਾਸ ਦੇ ਆਧਾਰ 'ਤੇ "
+            "ਫ਼ੈਸਲਿਆਂ ਲਈ ਇਸਨੂੰ ਡਾਕਟਰ ਨਾਲ ਗੱਲਬਾਤ ਵਿੱਚ ਸਹਾਇਕ ਵਜੋਂ ਵਰਤੋ।"
+        ),
+        "trend_single": "ਸਿਰਫ਼ ਇੱਕ ਰਿਪੋਰਟ ਉਪਲਬਧ ਹੈ, ਇਸ ਲਈ ਰੁਝਾਨ ਦੀ ਦਿਸ਼ਾ ਸੀਮਤ ਹੈ।",
+        "trend_insufficient": "ਰੁਝਾਨ ਵਿਸ਼ਲੇਸ਼ਣ ਲਈ ਕਾਫ਼ੀ ਤੁਲਨਾਯੋਗ ਮਾਰਕਰ ਨਹੀਂ ਹਨ।",
+        "trend_snapshot": "ਰੁਝਾਨ ਸਾਰ: $lines.",
+        "trend_line": "ਤੁਹਾਡੀਆਂ ਰਿਪੋਰਟਾਂ ਵਿੱਚ $name $direction",
+        "trend_out_most": ", ਅਤੇ ਜ਼ਿਆਦਾਤਰ ਸਮਾਂ ਹਵਾਲਾ ਸੀਮਾ ਤੋਂ ਬਾਹਰ ਰਿਹਾ",
+        "trend_out_part": ", ਅਤੇ ਕੁਝ ਸਮਾਂ ਹਵਾਲਾ ਸੀਮਾ ਤੋਂ ਬਾਹਰ ਰਿਹਾ",
+        "trend_shift": ", ਰੀਡਿੰਗਾਂ ਵਿਚਕਾਰ ਅਚਾਨਕ ਤਬਦੀਲੀ ਸਮੇਤ",
+        "delta_up": "$name $delta ਵਧਿਆ",
+        "delta_down": "$name $delta ਘਟਿਆ",
+        "delta_flat": "$name ਸਥਿਰ ਰਿਹਾ",
+        "direction_improving": "ਸੁਧਰ ਰਿਹਾ ਹੈ",
+        "direction_worsening": "ਵਿਗੜ ਰਿਹਾ ਹੈ",
+        "direction_stable": "ਸਥਿਰ ਹੈ",
+        "direction_rising": "ਵਧ ਰਿਹਾ ਹੈ",
+        "direction_falling": "ਘਟ ਰਿਹਾ ਹੈ",
+        "disclaimer": "ਇਹ ਸਿਰਫ਼ ਸਿੱਖਿਆਤਮਕ ਸਹਾਇਤਾ ਹੈ, ਨਿਦਾਨ ਜਾਂ ਨੁਸਖ਼ਾ ਨਹੀਂ।",
+        "caution": (
+            " ਕੁਝ ਦਾਅਵਿਆਂ ਦੀ ਕੱਢੇ ਗਏ ਲੈਬ ਮੁੱਲਾਂ ਨਾਲ ਪੁਸ਼ਟੀ ਨਹੀਂ ਹੋ ਸਕੀ, ਇਸ ਲਈ ਇਸ ਸਾਰ ਦੀ ਡਾਕਟਰ ਨਾਲ ਧਿਆਨ ਨਾਲ "
+            "ਸਮੀਖਿਆ ਕਰੋ।"
+        ),
+    },
+    "ur": {
+        "none": "کوئی نہیں",
+        "not_provided": "فراہم نہیں کیا گیا",
+        "none_identified": "کچھ شناخت نہیں ہوا",
+        "not_available": "دستیاب نہیں",
+        "symptoms_default": "فی الحال کوئی علامات نہیں بتائی گئیں",
+        "conditions_default": "کوئی بڑی سابقہ بیماری نہیں بتائی گئی",
+        "medications_default": "موجودہ کوئی دوا درج نہیں",
+        "mentor_notes": " رپورٹ کے تبصرے/نوٹس بھی دیکھے: $notes.",
+        "mentor_no_params": (
+            "تازہ اپ لوڈ سے کوئی لیب اقدار حاصل نہیں ہو سکیں۔ براہ کرم زیادہ واضح تصویر اپ لوڈ کریں یا رپورٹ کا "
+            "متن سطر بہ سطر پیسٹ کریں۔$notes_line"
+        ),
+        "mentor_lifestyle": "نیند: $sleep گھنٹے، سرگرمی: $activity، غذا: $diet.",
+        "mentor_summary": (
+            "آپ کی تازہ رپورٹ کو آپ کے پروفائل اور سابقہ ریکارڈ کے ساتھ دیکھا۔ اس رپورٹ میں $normal_count مارکر "
+            "معمول کی حد میں ہیں۔ حد سے زیادہ مارکر: $high. حد سے کم مارکر: $low. آپ کی بتائی گئی علامات: "
+            "$symptoms. سابقہ بیماریاں: $conditions. موجودہ ادویات: $medications. طرز زندگی: "
+            "$lifestyle$notes_line اسے تعلیمی رہنمائی سمجھیں اور اپنے معالج سے تصدیق کریں۔"
+        ),
+        "trend_analysis": (
+            "$trend_hint یہ رجحان دستیاب ریکارڈ سے تیار کیا گیا ہے؛ OCR کے معیار یا غائب حدود کی وجہ سے محدود ہو "
+            "سکتا ہے۔ مزید تفصیلی تجزیے کے لیے GROQ_API_KEY سیٹ کریں۔"
+        ),
+        "doctor_note_highlights": "رپورٹ نوٹس کے اہم نکات: $notes. ",
+        "doctor_summary": (
+            "پروفائل کے تناظر کے ساتھ طویل مدتی جائزہ تیار کیا گیا۔ موجودہ بلند مارکر: $high. موجودہ کم مارکر: "
+            "$low. بتائی گئی علامات: $symptoms. سابقہ بیماریاں: $conditions. ${note_highlights}براہ کرم طبی "
+            "تاریخ اور معائنے سے موازنہ کریں۔"
+        ),
+        "narrative_no_params": (
+            "اس اپ لوڈ سے لیب اقدار قابل اعتماد طریقے سے نہیں پڑھی جا سکیں، اس لیے ابھی قابل بھروسا تشریح نہیں "
+            "دے سکتا۔ براہ کرم واضح اسکین اپ لوڈ کریں یا رپورٹ کا متن سطر بہ سطر پیسٹ کریں۔ آپ کے پروفائل کے "
+            "مطابق: علامات $symptoms، سابقہ تاریخ $conditions، ادویات $medications. تقریباً $sleep گھنٹے نیند، "
+            "سرگرمی کی سطح $activity، غذا کی قسم $diet. اقدار پڑھنے کے قابل ہونے پر انہیں آپ کے مارکرز سے جوڑ کر "
+            "مکمل تشریح دوں گا۔"
+        ),
+        "narrative_stable": "اس بار زیادہ تر مارکر مستحکم یا متوقع حد میں ہیں۔",
+        "narrative_attention": "توجہ طلب اہم نکات — بلند مارکر: $high، کم مارکر: $low.",
+        "narrative_notes": " آپ کی رپورٹ کے نوٹس بھی مدنظر رکھے: $notes.",
+        "narrative": (
+            "یہ رپورٹ آپ کے سابقہ ریکارڈ اور ذاتی صحت کے پس منظر کے ساتھ دیکھی گئی ہے، اس لیے یہ صرف ایک بار کی "
+            "ریڈنگ نہیں ہے۔ اس وقت $normal_count مارکر معمول کی حد میں ہیں، اور $stability_note آپ کے روزمرہ "
+            "تناظر میں، موجودہ علامات $symptoms، پس منظر کی تاریخ $conditions، ادویات کی فہرست $medications. "
+            "تقریباً $sleep گھنٹے نیند، سرگرمی کی سطح $activity اور $diet غذا وقت کے ساتھ توانائی، صحت یابی اور "
+            "مارکر کی تبدیلیوں پر اثر ڈال سکتی ہے۔ وقت کے موازنے میں، $trend_hint کسی ایک عدد پر ردعمل کے بجائے "
+            "مسلسل نگرانی ہی عملی مشورہ ہے: نیند اور سرگرمی باقاعدہ رکھیں، وقت پر دوبارہ ٹیسٹ کروائیں اور رجحان "
+            "سے مطابقت رکھنے والی نئی علامات پر نظر رکھیں۔$doctor_note_line اپنی مکمل تاریخ کی بنیاد پر فیصلوں "
+            "کے لیے اسے معالج سے گفتگو میں معاون کے طور پر استعمال کریں۔"
+        ),
+        "trend_single": "صرف ایک رپورٹ دستیاب ہے، اس لیے رجحان کی سمت محدود ہے۔",
+        "trend_insufficient": "رجحان کے تجزیے کے لیے کافی قابل موازنہ مارکر نہیں ہیں۔",
+        "trend_snapshot": "رجحان کا خلاصہ: $lines.",
+        "trend_line": "آپ کی رپورٹوں میں $name $direction",
+        "trend_out_most": "، اور زیادہ تر وقت حوالہ حد سے باہر رہا",
+        "trend_out_part": "، اور کچھ وقت حوالہ حد سے باہر رہا",
+        "trend_shift": "، ریڈنگز کے درمیان اچانک تبدیلی سمیت",
+        "delta_up": "$name میں $delta اضافہ ہوا",
+        "delta_down": "$name میں $delta کمی ہوئی",
+        "delta_flat": "$name مستحکم رہا",
+        "direction_improving": "بہتر ہو رہا ہے",
+        "direction_worsening": "بگڑ رہا ہے",
+        "direction_stable": "مستحکم ہے",
+        "direction_rising": "بڑھ رہا ہے",
+        "direction_falling": "کم ہو رہا ہے",
+        "disclaimer": "یہ صرف تعلیمی معاونت ہے، تشخیص یا نسخہ نہیں۔",
+        "caution": (
+            " کچھ دعووں کی حاصل شدہ لیب اقدار سے تصدیق نہیں ہو سکی، اس لیے اس خلاصے کا معالج کے ساتھ احتیاط سے "
+            "جائزہ لیں۔"
+        ),
+    },
+    "es": {
+        "none": "ninguno",
+        "not_provided": "no indicado",
+        "none_identified": "ninguno identificado",
+        "not_available": "ND",
+        "symptoms_default": "no se han indicado síntomas actualmente",
+        "conditions_default": "no se han indicado enfermedades previas importantes",
+        "medications_default": "no hay medicamentos actuales registrados",
+        "mentor_notes": " También noté comentarios/notas en el informe: $notes.",
+        "mentor_no_params": (
+            "No se pudieron extraer valores de laboratorio de la última carga. Sube una foto más nítida o pega "
+            "el texto del informe línea por línea.$notes_line"
+        ),
+        "mentor_lifestyle": "Sueño: ${sleep} h, Actividad: $activity, Dieta: $diet.",
+        "mentor_summary": (
+            "Revisé tu informe más reciente junto con tu perfil y tus registros anteriores. En este informe, "
+            "$normal_count marcadores están en el rango normal. Marcadores por encima del rango: $high. "
+            "Marcadores por debajo del rango: $low. Síntomas indicados: $symptoms. Enfermedades previas: "
+            "$conditions. Medicamentos actuales: $medications. Estilo de vida: $lifestyle$notes_line Tómalo como "
+            "orientación educativa y confírmalo con tu médico."
+        ),
+        "trend_analysis": (
+            "$trend_hint Esta vista de tendencias se genera a partir de los registros disponibles y puede estar "
+            "limitada por la calidad del OCR o por rangos ausentes. Para un análisis más completo, configura "
+            "GROQ_API_KEY."
+        ),
+        "doctor_note_highlights": "Aspectos destacados de las notas del informe: $notes. ",
+        "doctor_summary": (
+            "Revisión longitudinal preparada con el contexto del perfil. Marcadores altos actuales: $high. "
+            "Marcadores bajos actuales: $low. Síntomas referidos: $symptoms. Enfermedades previas: $conditions. "
+            "${note_highlights}Correlacionar con la historia clínica y la exploración."
+        ),
+        "narrative_no_params": (
+            "No pude leer de forma fiable los valores de laboratorio de esta carga, así que todavía no puedo "
+            "darte una interpretación confiable. Sube un escaneo más nítido o pega el texto del informe línea "
+            "por línea y reconstruiré tu evolución. Según tu perfil, sigo teniendo en cuenta tu contexto: "
+            "síntomas $symptoms, antecedentes $conditions y medicamentos $medications. Tu rutina refleja un "
+            "sueño de unas $sleep horas, nivel de actividad $activity y dieta $diet. Cuando los valores sean "
+            "legibles, relacionaré estos factores con tus marcadores y te daré una interpretación completa."
+        ),
+        "narrative_stable": "La mayoría de los marcadores parecen estables o dentro del rango esperado en este ciclo.",
+        "narrative_attention": (
+            "Los puntos principales que requieren atención son los marcadores altos: $high, y los marcadores "
+            "bajos: $low."
+        ),
+        "narrative_notes": " También tuve en cuenta las notas de tu informe: $notes.",
+        "narrative": (
+            "Revisé este informe en el contexto de tus registros anteriores y tu historial de salud personal, "
+            "así que no es solo una lectura aislada. Actualmente tienes $normal_count marcadores en rango "
+            "normal, y $stability_note En tu contexto diario, tus síntomas actuales son $symptoms, tus "
+            "antecedentes son $conditions y tu lista de medicamentos muestra $medications. Tu rutina refleja un "
+            "sueño de unas $sleep horas, un nivel de actividad $activity y una dieta $diet, lo que puede influir "
+            "de forma notable en la energía, la recuperación y la evolución de los marcadores con el tiempo. En "
+            "la comparación a lo largo del tiempo, $trend_hint La conclusión práctica es seguir vigilando la "
+            "constancia en lugar de reaccionar ante un único número: mantén el sueño y la actividad regulares, "
+            "repite los análisis de control según lo previsto y presta atención a síntomas nuevos que coincidan "
+            "con cambios de tendencia.$doctor_note_line Úsalo como apoyo estructurado para hablar con tu médico, "
+            "de modo que las decisiones se basen en todo tu historial y no en un único informe."
+        ),
+        "trend_single": "Solo hay un informe disponible, por lo que la dirección de la tendencia es limitada.",
+        "trend_insufficient": "No hay suficientes parámetros comparables para analizar tendencias.",
+        "trend_snapshot": "Resumen de tendencias: $lines.",
+        "trend_line": "$name está $direction a lo largo de tus informes",
+        "trend_out_most": " y ha estado fuera de su rango de referencia la mayor parte de ese tiempo",
+        "trend_out_part": " y estuvo fuera de su rango de referencia parte de ese tiempo",
+        "trend_shift": ", incluido un cambio brusco entre lecturas",
+        "delta_up": "$name aumentó $delta",
+        "delta_down": "$name disminuyó $delta",
+        "delta_flat": "$name se mantuvo estable",
+        "direction_improving": "mejorando",
+        "direction_worsening": "empeorando",
+        "direction_stable": "estable",
+        "direction_rising": "subiendo",
+        "direction_falling": "bajando",
+        "disclaimer": "Esto es solo apoyo educativo, no un diagnóstico ni una prescripción.",
+        "caution": (
+            " Algunas afirmaciones generadas no pudieron verificarse con los valores de laboratorio extraídos, "
+            "por lo que este resumen debe revisarse con cuidado junto a un médico."
+        ),
+    },
+    "fr": {
+        "none": "aucun",
+        "not_provided": "non renseigné",
+        "none_identified": "aucun identifié",
+        "not_available": "ND",
+        "symptoms_default": "aucun symptôme signalé actuellement",
+        "conditions_default": "aucun antécédent majeur signalé",
+        "medications_default": "aucun médicament actuel indiqué",
+        "mentor_notes": " J'ai aussi relevé des commentaires/notes dans le rapport : $notes.",
+        "mentor_no_params": (
+            "Aucune valeur de laboratoire n'a pu être extraite du dernier envoi. Veuillez envoyer une photo plus "
+            "nette ou coller le texte du rapport ligne par ligne.$notes_line"
+        ),
+        "mentor_lifestyle": "Sommeil : ${sleep} h, Activité : $activity, Alimentation : $diet.",
+        "mentor_summary": (
+            "J'ai examiné votre dernier rapport avec votre profil et vos dossiers précédents. Dans ce rapport, "
+            "$normal_count marqueurs sont dans la plage normale. Marqueurs au-dessus de la plage : $high. "
+            "Marqueurs en dessous de la plage : $low. Symptômes signalés : $symptoms. Antécédents : $conditions. "
+            "Médicaments actuels : $medications. Mode de vie : $lifestyle$notes_line Considérez ceci comme une "
+            "information éducative et confirmez avec votre médecin."
+        ),
+        "trend_analysis": (
+            "$trend_hint Cette vue des tendances est générée à partir des dossiers disponibles et peut être "
+            "limitée par la qualité de l'OCR ou des plages manquantes. Pour une analyse plus riche, configurez "
+            "GROQ_API_KEY."
+        ),
+        "doctor_note_highlights": "Points saillants des notes du rapport : $notes. ",
+        "doctor_summary": (
+            "Revue longitudinale préparée avec le contexte du profil. Marqueurs élevés actuels : $high. "
+            "Marqueurs bas actuels : $low. Symptômes rapportés : $symptoms. Antécédents : $conditions. "
+            "${note_highlights}À corréler avec l'histoire clinique et l'examen."
+        ),
+        "narrative_no_params": (
+            "Je n'ai pas pu lire de façon fiable les valeurs de laboratoire de cet envoi, je ne peux donc pas "
+            "encore proposer d'interprétation fiable. Envoyez un scan plus net ou collez le texte du rapport "
+            "ligne par ligne, et je reconstruirai l'évolution de vos résultats. D'après votre profil, je tiens "
+            "toujours compte de votre contexte : symptômes $symptoms, antécédents $conditions et médicaments "
+            "$medications. Votre routine reflète environ $sleep heures de sommeil, un niveau d'activité "
+            "$activity et une alimentation $diet. Dès que les valeurs seront lisibles, je relierai ces facteurs "
+            "à vos marqueurs pour une interprétation complète."
+        ),
+        "narrative_stable": "La plupart des marqueurs semblent stables ou dans la plage attendue pour ce cycle.",
+        "narrative_attention": "Les principaux points à surveiller sont les marqueurs élevés : $high, et les marqueurs bas : $low.",
+        "narrative_notes": " J'ai aussi pris en compte les notes de votre rapport : $notes.",
+        "narrative": (
+            "J'ai examiné ce rapport à la lumière de vos dossiers précédents et de votre historique de santé, il "
+            "ne s'agit donc pas d'une lecture isolée. Vous avez actuellement $normal_count marqueurs dans la "
+            "plage normale, et $stability_note Dans votre contexte quotidien, vos symptômes actuels sont "
+            "$symptoms, vos antécédents sont $conditions et votre liste de médicaments indique $medications. "
+            "Votre routine reflète environ $sleep heures de sommeil, un niveau d'activité $activity et une "
+            "alimentation $diet, ce qui peut influencer l'énergie, la récupération et l'évolution des marqueurs "
+            "au fil du temps. En comparant dans le temps, $trend_hint Le conseil pratique est de surveiller la "
+            "régularité plutôt que de réagir à un chiffre isolé : gardez un sommeil et une activité réguliers, "
+            "refaites les analyses de suivi comme prévu et soyez attentif aux nouveaux symptômes qui coïncident "
+            "avec les changements de tendance.$doctor_note_line Utilisez ceci comme support de discussion avec "
+            "votre médecin afin que les décisions reposent sur tout votre historique et non sur un seul rapport."
+        ),
+        "trend_single": "Un seul rapport est disponible, la direction de la tendance est donc limitée.",
+        "trend_insufficient": "Pas assez de paramètres comparables pour analyser les tendances.",
+        "trend_snapshot": "Aperçu des tendances : $lines.",
+        "trend_line": "$name est $direction d'un rapport à l'autre",
+        "trend_out_most": " et a été hors de sa plage de référence la plupart du temps",
+        "trend_out_part": " et a été hors de sa plage de référence une partie du temps",
+        "trend_shift": ", avec un changement brusque entre deux mesures",
+        "delta_up": "$name a augmenté de $delta",
+        "delta_down": "$name a diminué de $delta",
+        "delta_flat": "$name est resté stable",
+        "direction_improving": "en amélioration",
+        "direction_worsening": "en dégradation",
+        "direction_stable": "stable",
+        "direction_rising": "en hausse",
+        "direction_falling": "en baisse",
+        "disclaimer": "Ceci est un soutien éducatif uniquement, pas un diagnostic ni une prescription.",
+        "caution": (
+            " Certaines affirmations générées n'ont pas pu être vérifiées à partir des valeurs de laboratoire "
+            "extraites ; ce résumé doit donc être revu attentivement avec un médecin."
+        ),
+    },
+    "de": {
+        "none": "keine",
+        "not_provided": "nicht angegeben",
+        "none_identified": "keine festgestellt",
+        "not_available": "k. A.",
+        "symptoms_default": "derzeit keine Symptome angegeben",
+        "conditions_default": "keine wesentlichen Vorerkrankungen angegeben",
+        "medications_default": "keine aktuellen Medikamente aufgeführt",
+        "mentor_notes": " Mir sind auch Kommentare/Notizen im Bericht aufgefallen: $notes.",
+        "mentor_no_params": (
+            "Aus dem letzten Upload konnten keine Laborwerte gelesen werden. Bitte laden Sie ein schärferes Foto "
+            "hoch oder fügen Sie den Berichtstext zeilenweise ein.$notes_line"
+        ),
+        "mentor_lifestyle": "Schlaf: ${sleep} h, Aktivität: $activity, Ernährung: $diet.",
+        "mentor_summary": (
+            "Ich habe Ihren neuesten Bericht zusammen mit Ihrem Profil und früheren Befunden geprüft. In diesem "
+            "Bericht liegen $normal_count Marker im Normalbereich. Marker über dem Bereich: $high. Marker unter "
+            "dem Bereich: $low. Ihre angegebenen Symptome: $symptoms. Vorerkrankungen: $conditions. Aktuelle "
+            "Medikamente: $medications. Lebensstil: $lifestyle$notes_line Bitte verstehen Sie dies als "
+            "Information und klären Sie es mit Ihrer Ärztin oder Ihrem Arzt ab."
+        ),
+        "trend_analysis": (
+            "$trend_hint Diese Verlaufsansicht basiert auf den vorhandenen Befunden und kann durch OCR-Qualität "
+            "oder fehlende Referenzbereiche eingeschränkt sein. Für eine ausführlichere Auswertung GROQ_API_KEY "
+            "setzen."
+        ),
+        "doctor_note_highlights": "Wichtige Punkte aus den Berichtsnotizen: $notes. ",
+        "doctor_summary": (
+            "Längsschnittübersicht mit Profilkontext erstellt. Aktuell erhöhte Marker: $high. Aktuell "
+            "erniedrigte Marker: $low. Berichtete Symptome: $symptoms. Vorerkrankungen: $conditions. "
+            "${note_highlights}Bitte mit Anamnese und klinischer Untersuchung abgleichen."
+        ),
+        "narrative_no_params": (
+            "Ich konnte die Laborwerte aus diesem Upload nicht zuverlässig lesen und kann daher noch keine "
+            "verlässliche Einordnung geben. Bitte laden Sie einen schärferen Scan hoch oder fügen Sie den "
+            "Berichtstext zeilenweise ein, dann erstelle ich Ihren Verlauf neu. Aus Ihrem Profil berücksichtige "
+            "ich weiterhin Ihren Kontext: Symptome $symptoms, Vorgeschichte $conditions und Medikamente "
+            "$medications. Ihr Alltag umfasst etwa $sleep Stunden Schlaf, Aktivitätsniveau $activity und "
+            "Ernährungsweise $diet. Sobald die Werte lesbar sind, verbinde ich diese Faktoren mit Ihren Markern "
+            "zu einer vollständigen Einordnung."
+        ),
+        "narrative_stable": "Die meisten Marker wirken in diesem Zyklus stabil oder liegen im erwarteten Bereich.",
+        "narrative_attention": "Die wichtigsten Punkte sind erhöhte Marker: $high, und erniedrigte Marker: $low.",
+        "narrative_notes": " Ich habe auch Ihre Berichtsnotizen berücksichtigt: $notes.",
+        "narrative": (
+            "Ich habe diesen Bericht im Zusammenhang mit Ihren früheren Befunden und Ihrer persönlichen "
+            "Gesundheitsgeschichte betrachtet, es ist also keine einmalige Momentaufnahme. Derzeit liegen "
+            "$normal_count Marker im Normalbereich, und $stability_note In Ihrem Alltag sind Ihre aktuellen "
+            "Symptome $symptoms, Ihre Vorgeschichte $conditions und Ihre Medikamentenliste zeigt $medications. "
+            "Ihr Alltag umfasst etwa $sleep Stunden Schlaf, Aktivitätsniveau $activity und eine $diet Ernährung, "
+            "was Energie, Erholung und die Entwicklung der Marker über die Zeit deutlich beeinflussen kann. Im "
+            "zeitlichen Vergleich gilt: $trend_hint Praktisch heißt das, die Beständigkeit weiter zu beobachten, "
+            "statt auf einen einzelnen Wert zu reagieren: Schlaf und Aktivität regelmäßig halten, "
+            "Kontrolluntersuchungen wie geplant wiederholen und auf neue Symptome achten, die zu "
+            "Verlaufsänderungen passen.$doctor_note_line Nutzen Sie dies als strukturierte Gesprächsgrundlage "
+            "mit Ihrer Ärztin oder Ihrem Arzt, damit Entscheidungen auf Ihrer gesamten Vorgeschichte beruhen und "
+            "nicht auf einem einzelnen Bericht."
+        ),
+        "trend_single": "Es liegt nur ein Bericht vor, daher ist die Verlaufsrichtung begrenzt aussagekräftig.",
+        "trend_insufficient": "Nicht genügend vergleichbare Parameter für eine Verlaufsanalyse.",
+        "trend_snapshot": "Verlaufsübersicht: $lines.",
+        "trend_line": "$name ist über Ihre Berichte hinweg $direction",
+        "trend_out_most": " und lag die meiste Zeit außerhalb des Referenzbereichs",
+        "trend_out_part": " und lag zeitweise außerhalb des Referenzbereichs",
+        "trend_shift": ", einschließlich eines plötzlichen Sprungs zwischen Messungen",
+        "delta_up": "$name ist um $delta gestiegen",
+        "delta_down": "$name ist um $delta gesunken",
+        "delta_flat": "$name blieb stabil",
+        "direction_improving": "sich verbessernd",
+        "direction_worsening": "sich verschlechternd",
+        "direction_stable": "stabil",
+        "direction_rising": "steigend",
+        "direction_falling": "fallend",
+        "disclaimer": "Dies dient nur der Information, nicht als Diagnose oder Verschreibung.",
+        "caution": (
+            " Einige generierte Aussagen konnten nicht anhand der ausgelesenen Laborwerte überprüft werden; "
+            "diese Zusammenfassung sollte daher sorgfältig mit einer Ärztin oder einem Arzt besprochen werden."
+        ),
+    },
+}
+
+
+class Catalog:
+    """Compiled templates for one language."""
+
+    def __init__(self, language: str, templates: dict[str, Template]):
+        self.language = language
+        self._templates = templates
+
+    def text(self, key: str, **values) -> str:
+        return self._templates[key].substitute(values)
+
+
+CATALOGS = {
+    code: Catalog(code, {key: Template(source) for key, source in messages.items()})
+    for code, messages in _CATALOG_SOURCES.items()
+}
+SUPPORTED_LANGUAGES = tuple(CATALOGS)
+
+
+def resolve_language(preference: str | None) -> str:
+    """Catalog code for a profile preference such as "hi-IN", "ta" or "Telugu"."""
+    value = (preference or "").strip().lower().replace("_", "-")
+    if not value:
+        return DEFAULT_LANGUAGE
+    if value in LANGUAGE_ALIASES:
+        return LANGUAGE_ALIASES[value]
+    base = value.split("-")[0]
+    return base if base in CATALOGS else DEFAULT_LANGUAGE
+
+
+def get_catalog(preference: str | None) -> Catalog:
+    return CATALOGS[resolve_language(preference)]
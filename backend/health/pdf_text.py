@@ -0,0 +1,74 @@
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+
+
+# Pages with less embedded text than this are treated as scanned images.
+MIN_TEXT_LAYER_CHARS = 20
+
+
+class PdfExtractionUnavailable(Exception):
+    pass
+
+
+def extract_pdf_pages(path: str) -> list[str]:
+    """Return the embedded text layer of each page, in page order.
+
+    Large documents are split into contiguous page ranges parsed in a process
+    pool; small ones are parsed inline where pool start-up would dominate.
+    """
+    try:
+        from pypdf import PdfReader
+    except ImportError as exc:
+        raise PdfExtractionUnavailable("PDF text extraction requires pypdf.") from exc
+
+    page_count = len(PdfReader(path).pages)
+    workers = max(1, min(int(getattr(settings, "PDF_TEXT_WORKERS", 4)), os.cpu_count() or 1, page_count))
+    if workers == 1 or page_count < int(getattr(settings, "PDF_PARALLEL_MIN_PAGES", 8)):
+        return _extract_page_range(path, 0, page_count)
+
+    step = -(-page_count // workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    # Spawned workers only import this module and pypdf, never the Django app,
+    # and are safe to start from threaded request handlers.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(ranges), mp_context=context) as pool:
+        chunks = pool.map(_extract_page_range, [path] * len(ranges), *zip(*ranges))
+        return [text for chunk in chunks for text in chunk]
+
+
+def has_text_layer(page_text: str) -> bool:
+    return len((page_text or "").strip()) >= MIN_TEXT_LAYER_CHARS
+
+
+def render_page_png(path: str, page_index: int, scale: float = 2.0) -> bytes | None:
+    """Rasterize one page for the vision OCR path; None if no renderer is installed."""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        return None
+
+    document = pdfium.PdfDocument(path)
+    try:
+        image = document[page_index].render(scale=scale).to_pil()
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+    finally:
+        document.close()
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> list[str]:
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    pages = []
+    for index in range(start, stop):
+        try:
+            pages.append(reader.pages[index].extract_text() or "")
+        except Exception:
+            pages.append("")
+    return pages
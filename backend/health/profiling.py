@@ -0,0 +1,194 @@
+"""On-demand request profiling: cProfile, ORM queries, provider calls and peak memory.
+
+Nothing here runs unless ``RequestProfilingMiddleware`` starts a profile for the
+current request; ``provider_call`` is a context-variable lookup otherwise.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.db import connections
+
+
+TOKEN_SALT = "health.profiling"
+SLOWEST_QUERIES = 5
+TOP_FUNCTIONS = 25
+
+_active: ContextVar["RequestProfile | None"] = ContextVar("request_profile", default=None)
+
+# Overlapping profiles share one tracemalloc session, stopped when the last one ends.
+_memory_lock = threading.Lock()
+_memory_tracers = 0
+_memory_owned = False
+
+
+def issue_token() -> str:
+    """A signed value for the ``X-Profile-Token`` header, valid for ``PROFILE_TOKEN_MAX_AGE``."""
+    return signing.dumps("profile", salt=TOKEN_SALT)
+
+
+def token_is_valid(token: str) -> bool:
+    max_age = int(getattr(settings, "PROFILE_TOKEN_MAX_AGE", 3600))
+    try:
+        return signing.loads(token, salt=TOKEN_SALT, max_age=max_age) == "profile"
+    except signing.BadSignature:
+        return False
+
+
+@contextmanager
+def provider_call(name: str):
+    """Attribute the wall time of the block to provider ``name`` in the active profile."""
+    profile = _active.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.record_provider(name, time.perf_counter() - started)
+
+
+class RequestProfile:
+    def __init__(self, request):
+        self.id = uuid.uuid4().hex[:12]
+        self.method = request.method
+        self.path = request.get_full_path()
+        self.user_id = getattr(getattr(request, "user", None), "id", None)
+        self.queries: list[tuple[str, float]] = []
+        self.providers: dict[str, dict] = {}
+        self.profiler = cProfile.Profile()
+        self.total_seconds = 0.0
+        self.peak_bytes: int | None = None
+
+    @contextmanager
+    def capture(self):
+        token = _active.set(self)
+        trace_memory = bool(getattr(settings, "PROFILE_TRACE_MEMORY", False))
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self._time_query))
+            if trace_memory:
+                stack.enter_context(_memory_trace())
+            started = time.perf_counter()
+            self.profiler.enable()
+            try:
+                yield self
+            finally:
+                self.profiler.disable()
+                self.total_seconds = time.perf_counter() - started
+                if trace_memory:
+                    self.peak_bytes = tracemalloc.get_traced_memory()[1]
+                _active.reset(token)
+
+    def _time_query(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - started))
+
+    def record_provider(self, name: str, seconds: float) -> None:
+        entry = self.providers.setdefault(name, {"calls": 0, "ms": 0.0})
+        entry["calls"] += 1
+        entry["ms"] = round(entry["ms"] + seconds * 1000, 1)
+
+    def summary(self, status_code: int | None = None) -> dict:
+        query_seconds = sum(duration for _, duration in self.queries)
+        slowest = sorted(self.queries, key=lambda item: item[1], reverse=True)[:SLOWEST_QUERIES]
+        stats_text = io.StringIO()
+        pstats.Stats(self.profiler, stream=stats_text).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "user_id": self.user_id,
+            "status": status_code,
+            "total_ms": round(self.total_seconds * 1000, 1),
+            "queries": {
+                "count": len(self.queries),
+                "ms": round(query_seconds * 1000, 1),
+                "slowest": [{"sql": sql, "ms": round(duration * 1000, 2)} for sql, duration in slowest],
+            },
+            "providers": self.providers,
+            "peak_memory_kib": None if self.peak_bytes is None else round(self.peak_bytes / 1024, 1),
+            # tracemalloc sees every thread, so under a threaded server the peak includes other requests.
+            "peak_memory_scope": "off" if self.peak_bytes is None else "process",
+            "top_functions": stats_text.getvalue(),
+        }
+
+    def server_timing(self) -> str:
+        parts = [
+            f"total;dur={self.total_seconds * 1000:.1f}",
+            f'db;dur={sum(d for _, d in self.queries) * 1000:.1f};desc="{len(self.queries)} queries"',
+        ]
+        parts += [f"{name};dur={entry['ms']:.1f}" for name, entry in sorted(self.providers.items())]
+        return ", ".join(parts)
+
+    def store(self, status_code: int | None = None) -> Path:
+        """Write ``<id>.json`` and the ``pstats``-format ``<id>.prof`` under ``PROFILE_DIR``.
+
+        Returns the ``.prof`` path; open it with ``python -m pstats`` or snakeviz.
+        """
+        directory = profile_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / f"{self.id}.json", "w", encoding="utf-8") as handle:
+            json.dump(self.summary(status_code), handle, indent=2)
+        path = directory / f"{self.id}.prof"
+        self.profiler.dump_stats(path)
+        _prune(directory, keep=self.id)
+        return path
+
+
+def _prune(directory: Path, keep: str) -> None:
+    """Delete all but the newest ``PROFILE_KEEP`` profiles; ``keep`` is never deleted."""
+    limit = max(1, int(getattr(settings, "PROFILE_KEEP", 100)))
+    summaries = []
+    for path in directory.glob("*.json"):
+        try:
+            summaries.append((path.stat().st_mtime_ns, path))
+        except FileNotFoundError:
+            continue
+    summaries.sort(reverse=True)
+    for _, path in summaries[limit:]:
+        if path.stem == keep:
+            continue
+        for stale in (path, path.with_suffix(".prof")):
+            # Another worker may be pruning the same directory.
+            stale.unlink(missing_ok=True)
+
+
+@contextmanager
+def _memory_trace():
+    global _memory_tracers, _memory_owned
+    with _memory_lock:
+        if not _memory_tracers:
+            # Leave tracing alone when it was already on, e.g. under ``python -X tracemalloc``.
+            _memory_owned = not tracemalloc.is_tracing()
+            if _memory_owned:
+                tracemalloc.start()
+            else:
+                tracemalloc.reset_peak()
+        _memory_tracers += 1
+    try:
+        yield
+    finally:
+        with _memory_lock:
+            _memory_tracers -= 1
+            if not _memory_tracers and _memory_owned:
+                tracemalloc.stop()
+
+
+def profile_dir() -> Path:
+    return Path(getattr(settings, "PROFILE_DIR", "") or Path(settings.BASE_DIR) / "profiles")
@@ -0,0 +1,272 @@
+"""Offline stand-in for the Groq, Gemini, Google Translate and TTS endpoints.
+
+Point ``GROQ_BASE_URL``, ``GEMINI_BASE_URL``, ``TRANSLATE_BASE_URL`` and
+``TTS_BASE_URL`` at a running stub to exercise the full HTTP path without
+network access, with injected latency, server errors and 429s.
+"""
+
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+OCR_PARAMETERS = [
+    {"name": "Hemoglobin", "value": 12.4, "unit": "g/dL", "ref_min": 12, "ref_max": 16},
+    {"name": "WBC", "value": 7200, "unit": "cells/uL", "ref_min": 4000, "ref_max": 11000},
+    {"name": "Platelets", "value": 240, "unit": "10^3/uL", "ref_min": 150, "ref_max": 400},
+]
+ANALYSIS_REPLY = {
+    "comprehensive_narrative": "Your markers are broadly within range across recent reports.",
+    "mentor_summary": "Markers are broadly within range.",
+    "trend_analysis": "Values are stable across your reports.",
+    "doctor_summary": "No marked deviations in the latest panel.",
+    "doctor_suggestions_considered": [],
+}
+MODELS = (
+    "llama-3.1-8b-instant",
+    "llama-3.3-70b-versatile",
+    "llama-3.2-11b-vision-preview",
+    "gemini-2.0-flash",
+    "gemini-2.0-flash-lite",
+)
+# One silent MPEG-1 Layer III frame (128 kbps, 44.1 kHz); enough for players to accept the body.
+_MP3_FRAME = b"\xff\xfb\x90\x64" + bytes(413)
+
+
+class StubBehavior:
+    """Latency, failure and 429 knobs shared by all request threads."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        spread_ms: float = 0.0,
+        distribution: str = "fixed",
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        stream_chunk_ms: float = 20.0,
+        seed: int | None = None,
+    ):
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution {distribution!r}.")
+        self.latency_ms = max(0.0, latency_ms)
+        self.spread_ms = max(0.0, spread_ms)
+        self.distribution = distribution
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.stream_chunk_ms = max(0.0, stream_chunk_ms)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def latency(self) -> float:
+        """One latency sample in seconds."""
+        mean, spread = self.latency_ms, self.spread_ms
+        with self._lock:
+            if self.distribution == "uniform":
+                sample = self._rng.uniform(mean - spread, mean + spread)
+            elif self.distribution == "normal":
+                sample = self._rng.gauss(mean, spread)
+            elif self.distribution == "lognormal" and mean > 0:
+                # Parameterised so the samples have the requested mean and standard deviation.
+                sigma = math.sqrt(math.log(1 + (spread / mean) ** 2))
+                sample = self._rng.lognormvariate(math.log(mean) - sigma * sigma / 2, sigma)
+            else:
+                sample = mean
+        return max(0.0, sample) / 1000.0
+
+    def outcome(self) -> int:
+        """HTTP status to inject for the next request: 429, 500 or 200."""
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500
+        return 200
+
+
+class ProviderStubHandler(BaseHTTPRequestHandler):
+    server_version = "ProviderStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def behavior(self) -> StubBehavior:
+        return self.server.behavior
+
+    def log_message(self, format, *args):
+        if getattr(self.server, "verbose", False):
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/health":
+            return self._send_json(200, {"status": "ok"})
+        if url.path.endswith("/models"):
+            return self._send_json(200, {"object": "list", "data": [{"id": model, "object": "model"} for model in MODELS]})
+        if url.path.endswith("/translate_a/single"):
+            return self._with_faults(lambda: self._translate(parse_qs(url.query)))
+        return self._send_json(404, {"error": {"message": f"No stub for GET {url.path}"}})
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._send_json(400, {"error": {"message": "Request body is not JSON."}})
+        if path.endswith("/chat/completions"):
+            return self._with_faults(lambda: self._chat(payload))
+        if path.endswith("/tts"):
+            return self._with_faults(lambda: self._tts(payload))
+        return self._send_json(404, {"error": {"message": f"No stub for POST {path}"}})
+
+    def _with_faults(self, respond) -> None:
+        time.sleep(self.behavior.latency())
+        status = self.behavior.outcome()
+        if status == 429:
+            return self._send_json(
+                429,
+                {"error": {"message": "Rate limit reached (stub).", "type": "rate_limit_exceeded"}},
+                headers={"Retry-After": f"{self.behavior.retry_after:g}"},
+            )
+        if status == 500:
+            return self._send_json(500, {"error": {"message": "Injected server error (stub)."}})
+        respond()
+
+    def _chat(self, payload: dict) -> None:
+        messages = payload.get("messages") or []
+        content = messages[-1].get("content") if messages else ""
+        if isinstance(content, list):
+            text = json.dumps({"parameters": OCR_PARAMETERS, "doctor_suggestions": []})
+        elif (payload.get("response_format") or {}).get("type") == "json_object":
+            text = json.dumps(ANALYSIS_REPLY)
+        else:
+            text = "OK"
+        prompt_tokens = max(1, len(json.dumps(messages)) // 4)
+        completion_tokens = max(1, len(text) // 4)
+        completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+        model = payload.get("model") or "stub-model"
+
+        if payload.get("stream"):
+            return self._stream_chat(completion_id, model, text, prompt_tokens, completion_tokens)
+        self._send_json(
+            200,
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            },
+        )
+
+    def _stream_chat(self, completion_id: str, model: str, text: str, prompt_tokens: int, completion_tokens: int):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        pieces = [text[index : index + 16] for index in range(0, len(text), 16)] or [""]
+        for position, piece in enumerate(pieces):
+            last = position == len(pieces) - 1
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": "stop" if last else None}],
+            }
+            if last:
+                chunk["x_groq"] = {
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    }
+                }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            if not last:
+                time.sleep(self.behavior.stream_chunk_ms / 1000.0)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _translate(self, query: dict) -> None:
+        text = (query.get("q") or [""])[0]
+        source = (query.get("sl") or ["auto"])[0]
+        target = (query.get("tl") or ["en"])[0]
+        self._send_json(200, [[[f"[{target}] {text}", text, None, None]], None, source])
+
+    def _tts(self, payload: dict) -> None:
+        text = str(payload.get("text") or "")
+        if not text:
+            return self._send_json(400, {"error": "text is required"})
+        # Roughly one frame per word, like a real clip growing with the text.
+        body = b"ID3\x04\x00\x00\x00\x00\x00\x00" + _MP3_FRAME * max(1, len(text.split()))
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload, headers: dict | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ProviderStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], behavior: StubBehavior, verbose: bool = False):
+        super().__init__(address, ProviderStubHandler)
+        self.behavior = behavior
+        self.verbose = verbose
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def provider_settings(self) -> dict:
+        """Settings that point this project's provider calls at the stub."""
+        return {
+            "GROQ_BASE_URL": f"{self.base_url}/openai/v1",
+            "GEMINI_BASE_URL": f"{self.base_url}/v1beta/openai",
+            "TRANSLATE_BASE_URL": self.base_url,
+            "TTS_BASE_URL": self.base_url,
+        }
+
+
+@contextmanager
+def running_stub(behavior: StubBehavior | None = None):
+    """Run a stub on an ephemeral localhost port for the duration of the block."""
+    server = ProviderStubServer(("127.0.0.1", 0), behavior or StubBehavior())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
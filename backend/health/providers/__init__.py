@@ -0,0 +1,41 @@
+"""Named OCR, LLM, translation and TTS backends, imported on first use.
+
+``settings.HEALTH_PROVIDERS`` maps each kind to ``{name: "dotted.path"}``. Nothing
+behind a path is imported until something asks for that provider, so workers
+and management commands only load the SDKs they actually call.
+
+Per kind, the path names:
+
+- ``ocr``: ``callable(path) -> str`` reading text from an image file.
+- ``llm``: an object with ``chat_completion(payload, timeout) -> dict`` taking and
+  returning OpenAI-style chat completion JSON.
+- ``translation``: ``callable(text, source, target) -> str``.
+- ``tts``: ``callable(text, voice) -> bytes`` returning MP3 audio.
+"""
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class ProviderNotConfigured(LookupError):
+    pass
+
+
+def provider_names(kind: str) -> list[str]:
+    return list(_registry().get(kind, {}))
+
+
+def get_provider(kind: str, name: str):
+    """Import and return the ``name`` backend for ``kind``.
+
+    Not memoized: after the first import this is a ``sys.modules`` lookup, and
+    tests can patch the target function in its own module.
+    """
+    path = _registry().get(kind, {}).get((name or "").strip().lower())
+    if not path:
+        raise ProviderNotConfigured(f"No {kind} provider named {name!r} in HEALTH_PROVIDERS.")
+    return import_string(path)
+
+
+def _registry() -> dict:
+    return getattr(settings, "HEALTH_PROVIDERS", {}) or {}
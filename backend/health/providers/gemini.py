@@ -0,0 +1,49 @@
+"""Gemini through its OpenAI-compatible endpoint, so payloads match the Groq provider."""
+
+import os
+
+import requests
+from django.conf import settings
+
+from ..profiling import provider_call
+
+
+DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai"
+
+
+def api_key() -> str:
+    return getattr(settings, "GEMINI_API_KEY", "") or os.getenv("GEMINI_API_KEY", "")
+
+
+def base_url() -> str:
+    return (getattr(settings, "GEMINI_BASE_URL", "") or DEFAULT_BASE_URL).rstrip("/")
+
+
+class GeminiProvider:
+    name = "gemini"
+
+    def is_configured(self) -> bool:
+        return bool(api_key())
+
+    def chat_request(self) -> tuple[str, dict]:
+        """URL and headers for a raw chat completion call, bypassing quota and retries."""
+        return base_url() + "/chat/completions", {
+            "Authorization": f"Bearer {api_key()}",
+            "Content-Type": "application/json",
+        }
+
+    def chat_completion(self, payload: dict, timeout: int) -> dict:
+        with provider_call("gemini"):
+            url, headers = self.chat_request()
+            response = requests.post(url, headers=headers, json=payload, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def list_models(self) -> list[str]:
+        response = requests.get(base_url() + "/models", headers={"Authorization": f"Bearer {api_key()}"}, timeout=10)
+        response.raise_for_status()
+        # Listed as "models/gemini-2.0-flash" but requested as "gemini-2.0-flash".
+        return [item["id"].removeprefix("models/") for item in response.json().get("data", []) if item.get("id")]
+
+
+provider = GeminiProvider()
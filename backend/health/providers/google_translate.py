@@ -0,0 +1,26 @@
+import requests
+from django.conf import settings
+
+from ..profiling import provider_call
+
+
+DEFAULT_BASE_URL = "https://translate.googleapis.com"
+
+
+def translate(text: str, source: str, target: str) -> str:
+    base_url = getattr(settings, "TRANSLATE_BASE_URL", "") or DEFAULT_BASE_URL
+    with provider_call("translate"):
+        response = requests.get(
+            base_url.rstrip("/") + "/translate_a/single",
+            params={
+                "client": "gtx",
+                "sl": source,
+                "tl": target,
+                "dt": "t",
+                "q": text,
+            },
+            timeout=12,
+        )
+    response.raise_for_status()
+    data = response.json()
+    return "".join(chunk[0] for chunk in data[0] if chunk and chunk[0])
@@ -0,0 +1,75 @@
+import os
+import time
+
+import requests
+from django.conf import settings
+
+from ..profiling import provider_call
+from ..rate_limit import RateLimitExceeded, acquire, estimate_chat_tokens, settle
+
+
+DEFAULT_BASE_URL = "https://api.groq.com/openai/v1"
+
+
+def api_key() -> str:
+    return getattr(settings, "GROQ_API_KEY", "") or os.getenv("GROQ_API_KEY", "")
+
+
+def base_url() -> str:
+    return (getattr(settings, "GROQ_BASE_URL", "") or DEFAULT_BASE_URL).rstrip("/")
+
+
+def chat_completions_url() -> str:
+    return base_url() + "/chat/completions"
+
+
+class GroqProvider:
+    name = "groq"
+
+    def is_configured(self) -> bool:
+        return bool(api_key())
+
+    def chat_request(self) -> tuple[str, dict]:
+        """URL and headers for a raw chat completion call, bypassing quota and retries."""
+        return chat_completions_url(), {
+            "Authorization": f"Bearer {api_key()}",
+            "Content-Type": "application/json",
+        }
+
+    def chat_completion(self, payload: dict, timeout: int) -> dict:
+        # Every Groq call draws from the shared cross-worker quota first; without room
+        # the call fails here so the router can fall back instead of earning a 429.
+        # A 429 that still slips through (other clients on the same key) is retried
+        # once after the provider's Retry-After hint, on the budget already taken.
+        estimated_tokens = estimate_chat_tokens(payload)
+        max_wait = float(getattr(settings, "GROQ_RATE_LIMIT_MAX_WAIT", 0) or 0)
+        if not acquire("groq", estimated_tokens, max_wait=max_wait):
+            raise RateLimitExceeded("Groq quota exhausted; request not sent.")
+        for attempt in range(2):
+            with provider_call("groq"):
+                url, headers = self.chat_request()
+                response = requests.post(url, headers=headers, json=payload, timeout=timeout)
+            retry_after = _retry_after_seconds(response)
+            if response.status_code != 429 or attempt or retry_after > max_wait:
+                break
+            time.sleep(retry_after)
+
+        response.raise_for_status()
+        data = response.json()
+        settle("groq", estimated_tokens, (data.get("usage") or {}).get("total_tokens"))
+        return data
+
+    def list_models(self) -> list[str]:
+        response = requests.get(base_url() + "/models", headers={"Authorization": f"Bearer {api_key()}"}, timeout=10)
+        response.raise_for_status()
+        return [item["id"] for item in response.json().get("data", []) if item.get("id")]
+
+
+def _retry_after_seconds(response) -> float:
+    try:
+        return float(response.headers.get("Retry-After") or 0) or 1.0
+    except ValueError:
+        return 1.0
+
+
+provider = GroqProvider()
@@ -0,0 +1,32 @@
+import asyncio
+
+from django.conf import settings
+
+from ..profiling import provider_call
+
+
+def edge_tts_synthesize(text: str, voice: str) -> bytes:
+    with provider_call("tts"):
+        return asyncio.run(_stream_edge_tts(text, voice))
+
+
+async def _stream_edge_tts(text: str, voice: str) -> bytes:
+    import edge_tts
+
+    communicator = edge_tts.Communicate(text=text, voice=voice)
+    chunks = []
+    async for item in communicator.stream():
+        if item.get("type") == "audio":
+            chunks.append(item.get("data", b""))
+    return b"".join(chunks)
+
+
+def http_synthesize(text: str, voice: str) -> bytes:
+    """POST ``{"text", "voice"}`` to ``<TTS_BASE_URL>/tts`` and return the audio body."""
+    import requests
+
+    base_url = getattr(settings, "TTS_BASE_URL", "")
+    with provider_call("tts"):
+        response = requests.post(base_url.rstrip("/") + "/tts", json={"text": text, "voice": voice}, timeout=30)
+    response.raise_for_status()
+    return response.content
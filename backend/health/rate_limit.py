@@ -0,0 +1,124 @@
+import json
+import time
+
+from django.conf import settings
+from django.db.models import F
+
+from .models import ProviderRateBucket
+
+
+IMAGE_TOKEN_ESTIMATE = 1500
+DEFAULT_COMPLETION_TOKENS = 1024
+CONTENTION_RETRY_SECONDS = 0.02
+
+
+class RateLimitExceeded(RuntimeError):
+    """The provider's shared quota has no room within the allowed wait."""
+
+
+def acquire(provider: str, estimated_tokens: int = 0, max_wait: float | None = None) -> bool:
+    """Take one request and ``estimated_tokens`` from the provider's shared bucket.
+
+    Waits up to ``max_wait`` seconds (``<PROVIDER>_RATE_LIMIT_MAX_WAIT`` by default)
+    for budget to refill. Returns False when the wait would exceed that, so the
+    caller can decide whether to send anyway or degrade.
+    """
+    requests_per_minute, tokens_per_minute = _limits(provider)
+    if not requests_per_minute and not tokens_per_minute:
+        return True
+
+    if max_wait is None:
+        max_wait = float(getattr(settings, f"{provider.upper()}_RATE_LIMIT_MAX_WAIT", 0) or 0)
+    deadline = time.monotonic() + max(0.0, max_wait)
+    cost = max(0, int(estimated_tokens or 0))
+    if tokens_per_minute:
+        cost = min(cost, tokens_per_minute)
+
+    while True:
+        wait_seconds = _try_acquire(provider, requests_per_minute, tokens_per_minute, cost)
+        if wait_seconds <= 0:
+            return True
+        remaining = deadline - time.monotonic()
+        if wait_seconds > remaining:
+            return False
+        time.sleep(wait_seconds)
+
+
+def settle(provider: str, estimated_tokens: int, actual_tokens: int | None) -> None:
+    """Correct the token bucket once the provider reports real usage."""
+    _, tokens_per_minute = _limits(provider)
+    if not tokens_per_minute or actual_tokens is None:
+        return
+    delta = int(estimated_tokens or 0) - int(actual_tokens)
+    if delta:
+        ProviderRateBucket.objects.filter(provider=provider).update(token_allowance=F("token_allowance") + delta)
+
+
+def estimate_chat_tokens(payload: dict) -> int:
+    """Rough prompt + completion token estimate for an OpenAI-style chat payload."""
+    text_chars = 0
+    images = 0
+    for message in payload.get("messages", []) or []:
+        content = message.get("content")
+        if isinstance(content, str):
+            text_chars += len(content)
+            continue
+        for part in content or []:
+            if not isinstance(part, dict):
+                continue
+            if part.get("type") == "image_url":
+                images += 1
+            else:
+                text_chars += len(json.dumps(part.get("text", "")))
+    completion = int(payload.get("max_tokens") or DEFAULT_COMPLETION_TOKENS)
+    return (text_chars // 4) + (images * IMAGE_TOKEN_ESTIMATE) + completion
+
+
+def _limits(provider: str) -> tuple[int, int]:
+    prefix = provider.upper()
+    return (
+        int(getattr(settings, f"{prefix}_REQUESTS_PER_MINUTE", 0) or 0),
+        int(getattr(settings, f"{prefix}_TOKENS_PER_MINUTE", 0) or 0),
+    )
+
+
+def _try_acquire(provider: str, requests_per_minute: int, tokens_per_minute: int, cost: int) -> float:
+    now = time.time()
+    bucket, _ = ProviderRateBucket.objects.get_or_create(
+        provider=provider,
+        defaults={
+            "request_allowance": requests_per_minute,
+            "token_allowance": tokens_per_minute,
+            "refilled_at": now,
+        },
+    )
+
+    elapsed = max(0.0, now - bucket.refilled_at)
+    request_allowance = _refill(bucket.request_allowance, requests_per_minute, elapsed)
+    token_allowance = _refill(bucket.token_allowance, tokens_per_minute, elapsed)
+
+    request_wait = _wait_for(1, request_allowance, requests_per_minute)
+    token_wait = _wait_for(cost, token_allowance, tokens_per_minute)
+    if request_wait > 0 or token_wait > 0:
+        return max(request_wait, token_wait)
+
+    # Optimistic compare-and-set on refilled_at so concurrent workers never
+    # spend the same allowance twice; a lost race just retries.
+    claimed = ProviderRateBucket.objects.filter(pk=bucket.pk, refilled_at=bucket.refilled_at).update(
+        request_allowance=request_allowance - 1 if requests_per_minute else request_allowance,
+        token_allowance=token_allowance - cost if tokens_per_minute else token_allowance,
+        refilled_at=now,
+    )
+    return 0.0 if claimed else CONTENTION_RETRY_SECONDS
+
+
+def _refill(allowance: float, per_minute: int, elapsed: float) -> float:
+    if not per_minute:
+        return allowance
+    return min(float(per_minute), allowance + elapsed * per_minute / 60.0)
+
+
+def _wait_for(needed: float, allowance: float, per_minute: int) -> float:
+    if not per_minute or allowance >= needed:
+        return 0.0
+    return (needed - allowance) * 60.0 / per_minute
@@ -0,0 +1,102 @@
+import csv
+import json
+from typing import Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import MedicalReport
+
+
+EXPORT_CHUNK_SIZE = 200
+
+CSV_COLUMNS = (
+    "record_type",
+    "report_id",
+    "report_date",
+    "name",
+    "value",
+    "unit",
+    "ref_min",
+    "ref_max",
+    "risk_flag",
+    "text",
+)
+ANALYSIS_FIELDS = ("mentor_summary", "trend_analysis", "doctor_summary")
+
+
+class _Echo:
+    """File-like sink for csv.writer that hands each formatted row back."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_user_reports(user) -> Iterator[MedicalReport]:
+    """All of a user's reports, oldest first, fetched a chunk at a time.
+
+    Parameters are prefetched and the analysis joined per chunk, so memory
+    stays flat and the query count grows with chunks rather than reports.
+    """
+    return (
+        MedicalReport.objects.filter(user=user)
+        .select_related("analysis")
+        .prefetch_related("parameters")
+        .order_by("report_date", "created_at", "id")
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def csv_lines(user) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for report in iter_user_reports(user):
+        report_date = report.report_date.isoformat()
+        yield writer.writerow(("report", report.id, report_date, "", "", "", "", "", "", ""))
+        for param in report.parameters.all():
+            yield writer.writerow(
+                (
+                    "parameter",
+                    report.id,
+                    report_date,
+                    param.name,
+                    param.value,
+                    param.unit,
+                    "" if param.ref_min is None else param.ref_min,
+                    "" if param.ref_max is None else param.ref_max,
+                    param.risk_flag,
+                    "",
+                )
+            )
+        analysis = getattr(report, "analysis", None)
+        if analysis is not None:
+            for field in ANALYSIS_FIELDS:
+                yield writer.writerow(
+                    ("analysis", report.id, report_date, field, "", "", "", "", "", getattr(analysis, field))
+                )
+
+
+def ndjson_lines(user) -> Iterator[str]:
+    for report in iter_user_reports(user):
+        analysis = getattr(report, "analysis", None)
+        record = {
+            "report_id": report.id,
+            "report_date": report.report_date,
+            "created_at": report.created_at,
+            "analysis_completed": report.analysis_completed,
+            "doctor_suggestions": report.doctor_suggestions,
+            "parameters": [
+                {
+                    "name": param.name,
+                    "value": param.value,
+                    "unit": param.unit,
+                    "ref_min": param.ref_min,
+                    "ref_max": param.ref_max,
+                    "risk_flag": param.risk_flag,
+                }
+                for param in report.parameters.all()
+            ],
+            "analysis": (
+                {field: getattr(analysis, field) for field in ANALYSIS_FIELDS} if analysis is not None else None
+            ),
+        }
+        yield json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
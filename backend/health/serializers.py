@@ -0,0 +1,60 @@
+from rest_framework import serializers
+
+from .models import AnalysisResult, LabParameter, MedicalReport
+
+
+class LabParameterSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = LabParameter
+        fields = ["id", "name", "value", "unit", "ref_min", "ref_max", "risk_flag"]
+
+
+class AnalysisResultSerializer(serializers.ModelSerializer):
+    comprehensive_narrative = serializers.SerializerMethodField()
+
+    class Meta:
+        model = AnalysisResult
+        fields = [
+            "mentor_summary",
+            "trend_analysis",
+            "doctor_summary",
+            "comprehensive_narrative",
+            "created_at",
+            "updated_at",
+        ]
+
+    def get_comprehensive_narrative(self, obj):
+        return (obj.raw_response or {}).get("comprehensive_narrative", "") or obj.mentor_summary
+
+
+class MedicalReportListSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = MedicalReport
+        fields = ["id", "report_date", "analysis_completed", "created_at", "updated_at"]
+
+
+class MedicalReportDetailSerializer(serializers.ModelSerializer):
+    parameters = LabParameterSerializer(many=True, read_only=True)
+    analysis = serializers.SerializerMethodField()
+    has_file = serializers.SerializerMethodField()
+
+    class Meta:
+        model = MedicalReport
+        fields = [
+            "id",
+            "report_date",
+            "analysis_completed",
+            "doctor_suggestions",
+            "has_file",
+            "created_at",
+            "updated_at",
+            "parameters",
+            "analysis",
+        ]
+
+    def get_analysis(self, obj):
+        analysis = getattr(obj, "analysis", None)
+        return AnalysisResultSerializer(analysis).data if analysis is not None else None
+
+    def get_has_file(self, obj):
+        return bool(obj.report_file)
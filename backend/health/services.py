@@ -1,54 +1,238 @@
 import base64
+import hashlib
 import json
 import mimetypes
 import os
 import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
 from django.conf import settings
-from django.db import transaction
+from django.db import connections, transaction
+from django.db.models import Count, Max
+from django.utils import timezone
 
 from core.models import UserProfile
-from .guardrails import run_input_guardrails, run_output_guardrails
+from . import llm_router, local_ocr, metrics, narratives, pdf_text, tiling, trends
+from .db_routing import use_primary
+from .guardrails import input_guardrails, output_guardrails, run_input_guardrails, run_output_guardrails
+from .guardrails import safety_language
+from .guardrails.input_guardrails import _check_data_completeness, _check_ocr_confidence
+from .local_ocr import LocalOcrUnavailable, local_ocr_text
 from .models import AnalysisResult, LabParameter, MedicalReport
+from .narratives import DEFAULT_LANGUAGE, Catalog, get_catalog
+from .pdf_text import PdfExtractionUnavailable, extract_pdf_pages, has_text_layer, render_page_png
+from .providers import get_provider
+from .singleflight import fingerprint, single_flight
+from .stage_cache import StageCache, code_version
+from .tiling import merge_tile_rows, split_into_tiles
+from .trends import trend_statistics_from_reports
+
+@use_primary()
+def process_report(report_id: int, use_stage_cache: bool | None = None) -> AnalysisResult:
+    """Run the report pipeline, reusing stage outputs whose inputs and code are unchanged.
+
+    A profile edit, for example, re-runs only the context, LLM and output
+    guardrail stages; OCR and the parameter rewrite are skipped.
+    ``use_stage_cache=False`` re-runs every stage; the default follows
+    ``PIPELINE_STAGE_CACHE``.
+    """
+    report = MedicalReport.objects.select_related("user").get(id=report_id)
+    stages = StageCache(report, enabled=use_stage_cache)
+    file_digest = _report_file_digest(report)
+    extracted_data, doctor_suggestions, ocr_text = stages.run(
+        "ocr",
+        _ocr_stage_inputs(report, file_digest),
+        lambda: extract_report_data(report),
+        code=code_version(
+            extract_report_data,
+            _extract_pdf_report,
+            _ocr_pdf_page,
+            _parse_lines_to_parameters,
+            _parse_reference_range,
+            _extract_report_notes,
+            _ocr_image_tiered,
+            _ocr_image_vision,
+            _ocr_image_bytes,
+            _score_local_ocr,
+            _ocr_image_with_groq,
+            _request_vision_ocr,
+            build_vision_ocr_payload,
+            _normalize_parameters,
+            _normalize_suggestions,
+            local_ocr,
+            pdf_text,
+            tiling,
+        ),
+        # Failed extractions are retried on the next run, e.g. once a provider recovers.
+        keep=lambda output: bool(output[0]),
+    )
+    if ocr_text is not None and ocr_text != report.ocr_text:
+        report.ocr_text = ocr_text
+        report.save(update_fields=["ocr_text", "updated_at"])
+
+    input_guardrail_result = stages.run(
+        "input_guardrails",
+        [extracted_data, report.report_file.name if report.report_file else "", file_digest],
+        lambda: run_input_guardrails(report=report, extracted_data=extracted_data),
+        code=code_version(input_guardrails),
+    )
 
+    # The rewrite's output is the stored rows themselves, so it is skipped when they already match.
+    lab_parameters = _build_lab_parameters(report, extracted_data)
+    if _parameter_rows(report.parameters.order_by("id")) != _parameter_rows(lab_parameters) or (
+        report.doctor_suggestions != doctor_suggestions
+    ):
+        metrics.incr("pipeline.parameters.miss")
+        with transaction.atomic():
+            report.parameters.all().delete()
+            LabParameter.objects.bulk_create(lab_parameters)
+            report.doctor_suggestions = doctor_suggestions
+            report.save(update_fields=["doctor_suggestions", "updated_at"])
+    else:
+        metrics.incr("pipeline.parameters.hit")
+
+    # Provider calls run outside the transaction so a slow or rate-limited LLM
+    # request never holds the database write lock.
+    context = stages.run(
+        "context",
+        _context_stage_inputs(report),
+        lambda: prepare_llm_context(report),
+        code=code_version(prepare_llm_context, _extract_report_notes, trends),
+    )
+    return _analyze_and_store(report, context, input_guardrail_result, use_provider=True, stages=stages)
+
+
+@use_primary()
+def process_report_batch(report_ids: list[int]) -> list[AnalysisResult]:
+    """Process many reports of one user as a single ingest.
+
+    OCR/extraction runs concurrently, parameters are written in one bulk insert,
+    and only the newest report gets the provider-backed longitudinal analysis.
+    Older reports in the batch get the local deterministic analysis of their
+    point in the timeline.
+    """
+    reports = list(
+        MedicalReport.objects.select_related("user")
+        .filter(id__in=report_ids)
+        .order_by("report_date", "created_at", "id")
+    )
+    if not reports:
+        return []
 
-def process_report(report_id: int) -> AnalysisResult:
-    report = MedicalReport.objects.select_related("user").get(id=report_id)
-    extracted_data, doctor_suggestions = run_ocr(report)
-    input_guardrail_result = run_input_guardrails(report=report, extracted_data=extracted_data)
+    workers = max(1, min(len(reports), int(getattr(settings, "BULK_OCR_WORKERS", 4))))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        extractions = list(pool.map(_extract_in_worker, reports))
 
+    guardrail_results = []
     with transaction.atomic():
-        report.parameters.all().delete()
-        for item in extracted_data:
-            LabParameter.objects.create(
-                report=report,
-                name=item["name"],
-                value=item["value"],
-                unit=item.get("unit", ""),
-                ref_min=item.get("ref_min"),
-                ref_max=item.get("ref_max"),
-                risk_flag=classify(item["value"], item.get("ref_min"), item.get("ref_max")),
-            )
-        report.doctor_suggestions = doctor_suggestions
-        report.save(update_fields=["doctor_suggestions"])
-
-        context = prepare_llm_context(report)
-        lab_parameters = list(report.parameters.values("name", "value", "unit", "ref_min", "ref_max", "risk_flag"))
-        if input_guardrail_result.get("safe"):
-            ai_result = generate_analysis(context)
-            result = run_output_guardrails(
-                ai_output=ai_result,
-                parameters=lab_parameters,
-                input_confidence=input_guardrail_result.get("confidence", 0.0),
-            )
-        else:
-            result = _build_input_guardrail_blocked_analysis(context, input_guardrail_result)
+        LabParameter.objects.filter(report__in=reports).delete()
+        # bulk_update skips auto_now, so the modification stamp is set by hand.
+        now = timezone.now()
+        parameter_rows = []
+        for report, (extracted_data, doctor_suggestions, ocr_text) in zip(reports, extractions):
+            if ocr_text is not None:
+                report.ocr_text = ocr_text
+            report.doctor_suggestions = doctor_suggestions
+            report.updated_at = now
+            parameter_rows.extend(_build_lab_parameters(report, extracted_data))
+            guardrail_results.append(run_input_guardrails(report=report, extracted_data=extracted_data))
+        LabParameter.objects.bulk_create(parameter_rows)
+        MedicalReport.objects.bulk_update(reports, ["ocr_text", "doctor_suggestions", "updated_at"])
+
+    latest = reports[-1]
+    context = prepare_llm_context(latest)
+    analyses = []
+    for report, input_guardrail_result in zip(reports, guardrail_results):
+        report_context = _context_until(context, report.id)
+        analyses.append(
+            _analyze_and_store(report, report_context, input_guardrail_result, use_provider=report is latest)
+        )
+    return analyses
+
+
+def _extract_in_worker(report: MedicalReport) -> tuple[list[dict], list[str], str | None]:
+    try:
+        return extract_report_data(report)
+    finally:
+        connections.close_all()
+
+
+def _build_lab_parameters(report: MedicalReport, extracted_data: list[dict]) -> list[LabParameter]:
+    return [
+        LabParameter(
+            report=report,
+            name=item["name"],
+            value=item["value"],
+            unit=item.get("unit", ""),
+            ref_min=item.get("ref_min"),
+            ref_max=item.get("ref_max"),
+            risk_flag=classify(item["value"], item.get("ref_min"), item.get("ref_max")),
+        )
+        for item in extracted_data
+    ]
 
-        result["guardrail_meta"] = {
-            **(result.get("guardrail_meta") or {}),
-            "input_guardrails": input_guardrail_result,
+
+def _context_until(context: dict, report_id: int) -> dict:
+    reports = context.get("reports", []) or []
+    cutoff = next((index for index, item in enumerate(reports) if item.get("report_id") == report_id), None)
+    if cutoff is None or cutoff == len(reports) - 1:
+        return {**context, "current_report_id": report_id}
+    current = reports[cutoff]
+    history = reports[: cutoff + 1]
+    return {
+        **context,
+        "current_report_id": report_id,
+        "reports": history,
+        # Trends of an older report must not see readings taken after it.
+        "trend_statistics": trend_statistics_from_reports(history),
+        "current_report_doctor_suggestions": current.get("doctor_notes_or_comments", []),
+    }
+
+
+def _analyze_and_store(
+    report: MedicalReport,
+    context: dict,
+    input_guardrail_result: dict,
+    use_provider: bool,
+    stages: StageCache | None = None,
+) -> AnalysisResult:
+    lab_parameters = [
+        {
+            "name": p.name,
+            "value": p.value,
+            "unit": p.unit,
+            "ref_min": p.ref_min,
+            "ref_max": p.ref_max,
+            "risk_flag": p.risk_flag,
+        }
+        for p in report.parameters.all()
+    ]
+    if input_guardrail_result.get("safe"):
+        ai_result = generate_analysis(context, stages) if use_provider else fallback_analysis(context)
+        guardrail_inputs = {
+            "ai_output": ai_result,
+            "parameters": lab_parameters,
+            "input_confidence": input_guardrail_result.get("confidence", 0.0),
         }
+        if stages is None:
+            result = run_output_guardrails(**guardrail_inputs)
+        else:
+            result = stages.run(
+                "output_guardrails",
+                guardrail_inputs,
+                lambda: run_output_guardrails(**guardrail_inputs),
+                code=code_version(output_guardrails, safety_language, narratives),
+            )
+    else:
+        result = _build_input_guardrail_blocked_analysis(context, input_guardrail_result)
+
+    result["guardrail_meta"] = {
+        **(result.get("guardrail_meta") or {}),
+        "input_guardrails": input_guardrail_result,
+    }
+    with transaction.atomic():
         analysis, _ = AnalysisResult.objects.update_or_create(
             report=report,
             defaults={
@@ -62,6 +246,7 @@ def process_report(report_id: int) -> AnalysisResult:
         )
 
         report.analysis_completed = True
+        # updated_at tracks content writes only; the analysis row carries its own timestamp.
         report.save(update_fields=["analysis_completed"])
 
     return analysis
@@ -124,17 +309,57 @@ def prepare_llm_context(report: MedicalReport) -> dict:
             },
         },
         "reports": reports_data,
+        "trend_statistics": trend_statistics_from_reports(reports_data),
         "current_report_doctor_suggestions": report.doctor_suggestions
         or _extract_report_notes((report.ocr_text or "").strip()),
     }
 
 
-def generate_analysis(context: dict) -> dict:
-    api_key = getattr(settings, "GROQ_API_KEY", "") or os.getenv("GROQ_API_KEY", "")
-    if not api_key:
+def generate_analysis(context: dict, stages: StageCache | None = None) -> dict:
+    routes = llm_router.configured_routes()
+    if not routes:
         return fallback_analysis(context)
 
-    model = getattr(settings, "GROQ_MODEL", "llama-3.1-8b-instant")
+    # Double submits and parallel reprocessing of the same report build identical
+    # contexts; coalesce them onto one provider call.
+    chain = ",".join(f"{provider}:{model}" for provider, model in routes)
+    key = fingerprint("analysis", chain, json.dumps(context, sort_keys=True, default=str))
+    if stages is None:
+        analysis = single_flight(key, lambda: _request_analysis(context), cacheable=_analysis_succeeded)
+    else:
+        # The payload carries the prompt, so a prompt edit is an input change too.
+        analysis = stages.run(
+            "llm",
+            [chain, build_analysis_payload(context)],
+            lambda: single_flight(key, lambda: _request_analysis(context), cacheable=_analysis_succeeded),
+            code=code_version(_request_analysis, _parse_json_response, _ensure_analysis_shape, narratives),
+            keep=_analysis_succeeded,
+        )
+    if analysis is None:
+        # Marked so a re-upload of the same report retries the provider.
+        return {**fallback_analysis(context), "provider_failed": True}
+    return analysis
+
+
+def _analysis_succeeded(analysis: dict | None) -> bool:
+    return analysis is not None
+
+
+def _request_analysis(context: dict) -> dict | None:
+    """The provider's analysis, or ``None`` when every route failed or the reply was not JSON."""
+    try:
+        data, _ = llm_router.chat_completion(build_analysis_payload(context), timeout=40)
+        content = data["choices"][0]["message"]["content"]
+        parsed = _parse_json_response(content)
+        if parsed is None:
+            return None
+        return _ensure_analysis_shape(parsed, context)
+    except Exception:
+        return None
+
+
+def build_analysis_payload(context: dict) -> dict:
+    """The chat completion request for an analysis, without ``model``."""
     prompt = f"""
 You are a safety-first family-doctor style health report explainer.
 
@@ -171,33 +396,23 @@ DATA:
 {json.dumps(context, indent=2)}
 """
 
-    try:
-        response = requests.post(
-            "https://api.groq.com/openai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "temperature": 0.2,
-                "response_format": {"type": "json_object"},
-                "messages": [
-                    {"role": "system", "content": "You are a medical education assistant."},
-                    {"role": "user", "content": prompt},
-                ],
-            },
-            timeout=40,
-        )
-        response.raise_for_status()
-        data = response.json()
-        content = data["choices"][0]["message"]["content"]
-        parsed = _parse_json_response(content)
-        if parsed is None:
-            return fallback_analysis(context)
-        return _ensure_analysis_shape(parsed, context)
-    except Exception:
-        return fallback_analysis(context)
+    return {
+        "temperature": 0.2,
+        "response_format": {"type": "json_object"},
+        "messages": [
+            {"role": "system", "content": "You are a medical education assistant."},
+            {"role": "user", "content": prompt},
+        ],
+    }
+
+
+def _groq_api_key() -> str:
+    # Checked here rather than through the provider so the offline path never imports it.
+    return getattr(settings, "GROQ_API_KEY", "") or os.getenv("GROQ_API_KEY", "")
+
+
+def _groq_chat(payload: dict, timeout: int) -> dict:
+    return get_provider("llm", "groq").chat_completion(payload, timeout=timeout)
 
 
 def _parse_json_response(content: str) -> dict | None:
@@ -223,7 +438,10 @@ def _parse_json_response(content: str) -> dict | None:
     return None
 
 
-def fallback_analysis(context: dict) -> dict:
+def fallback_analysis(context: dict, language: str | None = None) -> dict:
+    """Rule-based analysis rendered from the catalog for the user's language."""
+    user_context = context.get("user_context", {}) or {}
+    catalog = get_catalog(language or user_context.get("language_preference"))
     reports = context.get("reports", [])
     latest_report = reports[-1] if reports else {"parameters": []}
     latest_params = latest_report.get("parameters", [])
@@ -231,68 +449,114 @@ def fallback_analysis(context: dict) -> dict:
     low = [p["name"] for p in latest_report.get("parameters", []) if p.get("risk_flag") == "low"]
     normal_count = len([p for p in latest_report.get("parameters", []) if p.get("risk_flag") == "normal"])
 
-    trend_hint = _build_trend_hint(context)
-    user_context = context.get("user_context", {}) or {}
+    trend_hint = _build_trend_hint(context, catalog)
     doctor_notes = latest_report.get("doctor_notes_or_comments", []) or []
-    notes_line = (
-        " I also noticed report comments/notes: "
-        + "; ".join(doctor_notes[:3])
-        + "."
-        if doctor_notes
-        else ""
-    )
+    notes_line = catalog.text("mentor_notes", notes="; ".join(doctor_notes[:3])) if doctor_notes else ""
+    not_provided = catalog.text("not_provided")
     if not latest_params:
-        mentor_summary = (
-            "No lab parameters could be extracted from the latest upload. "
-            "Please upload a clearer photo or paste report text in structured lines."
-            f"{notes_line}"
-        )
+        mentor_summary = catalog.text("mentor_no_params", notes_line=notes_line)
     else:
-        symptoms = user_context.get("current_symptoms") or "not provided"
-        conditions = user_context.get("past_medical_conditions") or "not provided"
-        medications = user_context.get("medications") or "not provided"
+        not_available = catalog.text("not_available")
         lifestyle = user_context.get("lifestyle") or {}
-        lifestyle_line = (
-            f"Sleep: {lifestyle.get('sleep_hours') or 'NA'}h, "
-            f"Activity: {lifestyle.get('activity_level') or 'NA'}, "
-            f"Diet: {lifestyle.get('diet_type') or 'NA'}."
+        lifestyle_line = catalog.text(
+            "mentor_lifestyle",
+            sleep=lifestyle.get("sleep_hours") or not_available,
+            activity=lifestyle.get("activity_level") or not_available,
+            diet=lifestyle.get("diet_type") or not_available,
         )
-        mentor_summary = (
-            "I reviewed your latest report together with your profile and previous records. "
-            f"In this report, {normal_count} markers are in the normal range. "
-            f"Markers running higher than range: {', '.join(high) if high else 'none identified'}. "
-            f"Markers below range: {', '.join(low) if low else 'none identified'}. "
-            f"Your shared symptoms: {symptoms}. Past conditions: {conditions}. Current medicines: {medications}. "
-            f"Lifestyle context: {lifestyle_line}{notes_line} "
-            "Please treat this as educational guidance and confirm with your clinician."
+        none_identified = catalog.text("none_identified")
+        mentor_summary = catalog.text(
+            "mentor_summary",
+            normal_count=normal_count,
+            high=", ".join(high) if high else none_identified,
+            low=", ".join(low) if low else none_identified,
+            symptoms=user_context.get("current_symptoms") or not_provided,
+            conditions=user_context.get("past_medical_conditions") or not_provided,
+            medications=user_context.get("medications") or not_provided,
+            lifestyle=lifestyle_line,
+            notes_line=notes_line,
         )
 
+    none = catalog.text("none")
     return {
-        "comprehensive_narrative": _build_comprehensive_fallback_narrative(context),
+        "comprehensive_narrative": _build_comprehensive_fallback_narrative(context, catalog),
         "mentor_summary": mentor_summary,
-        "trend_analysis": (
-            f"{trend_hint} "
-            "This trend view is generated from available records and may be limited by OCR quality or missing ranges. "
-            "For richer narrative insight, set GROQ_API_KEY."
-        ),
-        "doctor_summary": (
-            "Longitudinal review prepared with profile context. "
-            f"Current high markers: {', '.join(high) if high else 'none'}. "
-            f"Current low markers: {', '.join(low) if low else 'none'}. "
-            f"Reported symptoms: {user_context.get('current_symptoms') or 'not provided'}. "
-            f"Past conditions: {user_context.get('past_medical_conditions') or 'not provided'}. "
-            + (
-                f"Report note highlights: {'; '.join(doctor_notes[:3])}. "
-                if doctor_notes
-                else ""
-            )
-            + "Please correlate with clinical history and examination."
+        "trend_analysis": catalog.text("trend_analysis", trend_hint=trend_hint),
+        "doctor_summary": catalog.text(
+            "doctor_summary",
+            high=", ".join(high) if high else none,
+            low=", ".join(low) if low else none,
+            symptoms=user_context.get("current_symptoms") or not_provided,
+            conditions=user_context.get("past_medical_conditions") or not_provided,
+            note_highlights=(
+                catalog.text("doctor_note_highlights", notes="; ".join(doctor_notes[:3])) if doctor_notes else ""
+            ),
         ),
         "doctor_suggestions_considered": doctor_notes[:6],
+        "language": catalog.language,
     }
 
 
-def run_ocr(report: MedicalReport) -> tuple[list[dict], list[str]]:
+def _ocr_stage_inputs(report: MedicalReport, file_digest: str) -> list:
+    # Stored text wins over the file in extract_report_data, so the file only matters without it.
+    text = (report.ocr_text or "").strip()
+    if text:
+        return ["text", text]
+    return [
+        "file",
+        report.report_file.name if report.report_file else "",
+        file_digest,
+        bool(_groq_api_key()),
+        getattr(settings, "GROQ_VISION_MODEL", ""),
+        getattr(settings, "OCR_LOCAL_ENGINE", ""),
+        getattr(settings, "OCR_LOCAL_MIN_CONFIDENCE", None),
+        getattr(settings, "OCR_TILES", None),
+        getattr(settings, "PDF_MAX_VISION_PAGES", None),
+    ]
+
+
+def _report_file_digest(report: MedicalReport) -> str:
+    if not report.report_file:
+        return ""
+    if report.content_hash:
+        return report.content_hash
+    digest = hashlib.sha256()
+    try:
+        with open(report.report_file.path, "rb") as handle:
+            for block in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(block)
+    except (OSError, ValueError):
+        return ""
+    return digest.hexdigest()
+
+
+def _context_stage_inputs(report: MedicalReport) -> list:
+    """Cheap stand-ins for everything prepare_llm_context reads.
+
+    Every OCR, suggestion or parameter rewrite bumps the report's updated_at
+    and a parameter rewrite also allocates new ids, so these aggregates change
+    whenever the context would.
+    """
+    profile_stamp = UserProfile.objects.filter(user=report.user).values_list("updated_at", flat=True).first()
+    reports = MedicalReport.objects.filter(user=report.user).aggregate(
+        count=Count("id"), last_id=Max("id"), stamp=Max("updated_at")
+    )
+    parameters = LabParameter.objects.filter(report__user=report.user).aggregate(
+        count=Count("id"), last_id=Max("id")
+    )
+    return [report.id, profile_stamp, reports, parameters]
+
+
+def _parameter_rows(parameters) -> list[tuple]:
+    return [(p.name, p.value, p.unit, p.ref_min, p.ref_max, p.risk_flag) for p in parameters]
+
+
+def extract_report_data(report: MedicalReport) -> tuple[list[dict], list[str], str | None]:
+    """Parse a report without touching the database.
+
+    Returns (parameters, doctor suggestions, ocr_text to store or None to keep
+    the current value), so it is safe to call from worker threads.
+    """
     # MVP parser:
     # 1) Use pasted/report text if provided
     # 2) Parse uploaded .txt file if available
@@ -301,44 +565,93 @@ def run_ocr(report: MedicalReport) -> tuple[list[dict], list[str]]:
         parsed = _parse_lines_to_parameters(manual_text)
         suggestions = _extract_report_notes(manual_text)
         if parsed:
-            return parsed, suggestions
-        report.ocr_text = (
+            return parsed, suggestions, None
+        return (
+            [],
+            suggestions,
             "Provided text could not be parsed. "
-            "Use one line per parameter like: Hemoglobin 11.2 g/dL 12-16"
+            "Use one line per parameter like: Hemoglobin 11.2 g/dL 12-16",
         )
-        report.save(update_fields=["ocr_text"])
-        return [], suggestions
 
     if report.report_file and report.report_file.name.lower().endswith(".txt"):
         try:
             with open(report.report_file.path, "r", encoding="utf-8", errors="ignore") as file_obj:
                 file_text = file_obj.read()
-            if not report.ocr_text:
-                report.ocr_text = file_text[:10000]
-                report.save(update_fields=["ocr_text"])
             parsed = _parse_lines_to_parameters(file_text)
             suggestions = _extract_report_notes(file_text)
             if parsed:
-                return parsed, suggestions
+                return parsed, suggestions, file_text[:10000]
         except OSError:
             pass
 
+    if report.report_file and report.report_file.name.lower().endswith(".pdf"):
+        return _extract_pdf_report(report.report_file.path)
+
     if report.report_file and _is_image_file(report.report_file.path):
-        parsed, suggestions, debug_message = _ocr_image_with_groq(report.report_file.path)
+        parsed, suggestions, debug_message = _ocr_image_tiered(report.report_file.path)
         if parsed:
-            if not report.ocr_text:
-                report.ocr_text = "\n".join(
-                    [f"{p['name']} {p['value']} {p.get('unit', '')}".strip() for p in parsed]
-                )
-                report.save(update_fields=["ocr_text"])
-            return parsed, suggestions
-        report.ocr_text = debug_message[:10000]
-        report.save(update_fields=["ocr_text"])
-        return [], suggestions
+            ocr_text = "\n".join([f"{p['name']} {p['value']} {p.get('unit', '')}".strip() for p in parsed])
+            return parsed, suggestions, ocr_text
+        return [], suggestions, debug_message[:10000]
+
+    return [], [], "No parseable text found from upload. Try a clearer image or paste report text."
 
-    report.ocr_text = "No parseable text found from upload. Try a clearer image or paste report text."
-    report.save(update_fields=["ocr_text"])
-    return [], []
+
+def _extract_pdf_report(file_path: str) -> tuple[list[dict], list[str], str]:
+    # Lab PDFs almost always carry a text layer; only scanned pages without one
+    # are rasterized and sent to the vision model.
+    try:
+        pages = extract_pdf_pages(file_path)
+    except PdfExtractionUnavailable as exc:
+        return [], [], f"PDF could not be read: {exc}"
+    except Exception:
+        return [], [], "PDF could not be read. Try exporting it again or paste report text."
+
+    text = "\n".join(page for page in pages if has_text_layer(page))
+    parsed = _parse_lines_to_parameters(text) if text else []
+    suggestions = _extract_report_notes(text)
+
+    scanned_pages = [index for index, page in enumerate(pages) if not has_text_layer(page)]
+    scanned_pages = scanned_pages[: int(getattr(settings, "PDF_MAX_VISION_PAGES", 5))]
+    debug_messages = []
+    if scanned_pages:
+        with ThreadPoolExecutor(max_workers=len(scanned_pages)) as pool:
+            pages_ocr = pool.map(lambda index: _ocr_pdf_page_in_worker(file_path, index), scanned_pages)
+            for rows, notes, message in pages_ocr:
+                parsed.extend(rows)
+                suggestions.extend(note for note in notes if note not in suggestions)
+                debug_messages.append(message)
+
+    if text:
+        ocr_text = text[:10000]
+    elif parsed:
+        ocr_text = "\n".join([f"{p['name']} {p['value']} {p.get('unit', '')}".strip() for p in parsed])
+    else:
+        ocr_text = ("No text layer found in PDF. " + " | ".join(debug_messages))[:10000]
+    return parsed, suggestions[:6], ocr_text
+
+
+def _ocr_pdf_page_in_worker(file_path: str, page_index: int) -> tuple[list[dict], list[str], str]:
+    try:
+        return _ocr_pdf_page(file_path, page_index)
+    finally:
+        connections.close_all()
+
+
+def _ocr_pdf_page(file_path: str, page_index: int) -> tuple[list[dict], list[str], str]:
+    try:
+        image_bytes = render_page_png(file_path, page_index)
+    except Exception:
+        image_bytes = None
+    if not image_bytes:
+        return [], [], f"Page {page_index + 1}: could not be rasterized."
+
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
+        tmp.write(image_bytes)
+    try:
+        return _ocr_image_tiered(tmp.name)
+    finally:
+        os.unlink(tmp.name)
 
 
 def _parse_lines_to_parameters(text: str) -> list[dict]:
@@ -359,12 +672,7 @@ def _parse_lines_to_parameters(text: str) -> list[dict]:
         value = _to_float(match.group("value"))
         if value is None:
             continue
-        ref_min = ref_max = None
-        ref = match.group("ref") or ""
-        ref_nums = re.findall(r"[-+]?\d*\.?\d+", ref)
-        if len(ref_nums) >= 2:
-            ref_min = _to_float(ref_nums[0])
-            ref_max = _to_float(ref_nums[1])
+        ref_min, ref_max = _parse_reference_range(match.group("ref") or "")
         parsed_row = {
             "name": match.group("name").strip(),
             "value": value,
@@ -405,6 +713,14 @@ def _parse_lines_to_parameters(text: str) -> list[dict]:
     return rows
 
 
+def _parse_reference_range(ref: str) -> tuple[float | None, float | None]:
+    # Split on the range separator so "12-16" is 12..16, not 12..-16.
+    match = re.match(r"([-+]?\d*\.?\d+)\s*(?:-|to)\s*([-+]?\d*\.?\d+)", ref.strip())
+    if not match:
+        return None, None
+    return _to_float(match.group(1)), _to_float(match.group(2))
+
+
 def _to_float(value) -> float | None:
     if value is None:
         return None
@@ -419,9 +735,104 @@ def _is_image_file(path: str) -> bool:
     return bool(mime_type and mime_type.startswith("image/"))
 
 
+def _ocr_image_tiered(file_path: str) -> tuple[list[dict], list[str], str]:
+    # Tier 1: local engine, scored with the same checks the input guardrails use.
+    # Tier 2: remote vision model, only when the local read is below threshold.
+    engine = getattr(settings, "OCR_LOCAL_ENGINE", "")
+    local_rows, local_suggestions, local_message = [], [], ""
+    if engine:
+        started = time.perf_counter()
+        try:
+            text = local_ocr_text(engine, file_path)
+        except LocalOcrUnavailable as exc:
+            metrics.incr("ocr.local.unavailable")
+            local_message = f"Local OCR skipped: {exc}"
+        except Exception as exc:
+            metrics.incr("ocr.local.error")
+            local_message = f"Local OCR failed: {exc}"
+        else:
+            metrics.observe("ocr.local", time.perf_counter() - started)
+            local_rows = _parse_lines_to_parameters(text)
+            local_suggestions = _extract_report_notes(text)
+            score = _score_local_ocr(local_rows)
+            if score >= float(getattr(settings, "OCR_LOCAL_MIN_CONFIDENCE", 0.6)):
+                metrics.incr("ocr.local.accepted")
+                return local_rows, local_suggestions, f"OCR succeeded locally with {engine} (score {score})."
+            local_message = f"Local OCR below threshold (score {score})."
+        metrics.incr("ocr.local.escalated")
+
+    started = time.perf_counter()
+    rows, suggestions, message = _ocr_image_vision(file_path)
+    metrics.observe("ocr.vision", time.perf_counter() - started)
+    metrics.incr("ocr.vision.succeeded" if rows else "ocr.vision.failed")
+    if not rows and local_rows:
+        # A partial local read beats nothing when the vision model is unavailable.
+        return local_rows, local_suggestions, f"{local_message} {message} Using local OCR result."
+    return rows, suggestions, f"{local_message} {message}".strip()
+
+
+def _ocr_image_vision(file_path: str) -> tuple[list[dict], list[str], str]:
+    tile_count = int(getattr(settings, "OCR_TILES", 1) or 1)
+    if tile_count <= 1 or not _is_tall_image(file_path):
+        return _ocr_image_with_groq(file_path)
+
+    overlap = float(getattr(settings, "OCR_TILE_OVERLAP", 0.12))
+    try:
+        tiles = split_into_tiles(file_path, tile_count, overlap)
+    except Exception:
+        return _ocr_image_with_groq(file_path)
+
+    # Tiles are OCR'd concurrently, so latency is that of the slowest band.
+    with ThreadPoolExecutor(max_workers=len(tiles)) as pool:
+        results = list(pool.map(_ocr_tile_in_worker, tiles))
+
+    rows = merge_tile_rows([tile_rows for tile_rows, _, _ in results], overlap)
+    suggestions = []
+    for _, tile_suggestions, _ in results:
+        suggestions.extend(note for note in tile_suggestions if note not in suggestions)
+    failed = [message for tile_rows, _, message in results if not tile_rows]
+    if not rows:
+        return [], suggestions[:6], "Tiled OCR failed. " + " | ".join(failed[:4])
+    return rows, suggestions[:6], f"OCR succeeded across {len(tiles)} tiles ({len(failed)} empty)."
+
+
+def _ocr_tile_in_worker(image_bytes: bytes) -> tuple[list[dict], list[str], str]:
+    try:
+        return _ocr_image_bytes(image_bytes)
+    finally:
+        connections.close_all()
+
+
+def _ocr_image_bytes(image_bytes: bytes) -> tuple[list[dict], list[str], str]:
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
+        tmp.write(image_bytes)
+    try:
+        return _ocr_image_with_groq(tmp.name)
+    finally:
+        os.unlink(tmp.name)
+
+
+def _is_tall_image(file_path: str) -> bool:
+    try:
+        from PIL import Image
+
+        with Image.open(file_path) as image:
+            width, height = image.size
+    except Exception:
+        return False
+    return bool(width) and height / width >= float(getattr(settings, "OCR_TILE_MIN_ASPECT", 1.2))
+
+
+def _score_local_ocr(rows: list[dict]) -> float:
+    completeness = _check_data_completeness(rows)
+    confidence = _check_ocr_confidence(rows)
+    if not (completeness["safe"] and confidence["safe"]):
+        return 0.0
+    return round((completeness["confidence"] + confidence["confidence"]) / 2, 2)
+
+
 def _ocr_image_with_groq(file_path: str) -> tuple[list[dict], list[str], str]:
-    api_key = getattr(settings, "GROQ_API_KEY", "") or os.getenv("GROQ_API_KEY", "")
-    if not api_key:
+    if not _groq_api_key():
         return [], [], "OCR failed: GROQ_API_KEY not set."
 
     try:
@@ -430,41 +841,23 @@ def _ocr_image_with_groq(file_path: str) -> tuple[list[dict], list[str], str]:
         return [], [], "OCR failed: uploaded file could not be read."
 
     configured = getattr(settings, "GROQ_VISION_MODEL", "llama-3.2-11b-vision-preview")
+    key = fingerprint("ocr", configured, data_url)
+    # Failed OCR is not published to other callers, so they retry instead of reusing it.
+    rows, suggestions, message = single_flight(
+        key, lambda: _request_vision_ocr(data_url, configured), cacheable=lambda result: bool(result[0])
+    )
+    return rows, suggestions, message
+
+
+def _request_vision_ocr(data_url: str, configured: str) -> tuple[list[dict], list[str], str]:
     model_candidates = [m.strip() for m in configured.split(",") if m.strip()]
     model_candidates.extend(["llama-3.2-11b-vision-preview", "meta-llama/llama-4-scout-17b-16e-instruct"])
     tried = []
 
-    prompt = (
-        "Extract lab parameters from this medical report image and return strict JSON only.\n"
-        'Format: {"parameters":[{"name":"Hemoglobin","value":11.2,"unit":"g/dL","ref_min":12,"ref_max":16}],"doctor_suggestions":["free-text doctor comments/suggestions/notes"]}\n'
-        "Rules: include only rows with numeric values in parameters, use null for missing ref_min/ref_max, and collect non-tabular doctor notes in doctor_suggestions."
-    )
-
     for model in dict.fromkeys(model_candidates):
         try:
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": model,
-                    "temperature": 0,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": [
-                                {"type": "text", "text": prompt},
-                                {"type": "image_url", "image_url": {"url": data_url}},
-                            ],
-                        }
-                    ],
-                },
-                timeout=50,
-            )
-            response.raise_for_status()
-            content = response.json()["choices"][0]["message"]["content"]
+            data = _groq_chat({**build_vision_ocr_payload(data_url), "model": model}, timeout=50)
+            content = data["choices"][0]["message"]["content"]
             payload = _parse_json_response(content)
             if not payload:
                 rows = _parse_lines_to_parameters(content)
@@ -487,6 +880,27 @@ def _ocr_image_with_groq(file_path: str) -> tuple[list[dict], list[str], str]:
     return [], [], "OCR failed after trying models. " + " | ".join(tried[:4])
 
 
+def build_vision_ocr_payload(data_url: str) -> dict:
+    """The chat completion request that reads lab parameters from an image, without ``model``."""
+    prompt = (
+        "Extract lab parameters from this medical report image and return strict JSON only.\n"
+        'Format: {"parameters":[{"name":"Hemoglobin","value":11.2,"unit":"g/dL","ref_min":12,"ref_max":16}],"doctor_suggestions":["free-text doctor comments/suggestions/notes"]}\n'
+        "Rules: include only rows with numeric values in parameters, use null for missing ref_min/ref_max, and collect non-tabular doctor notes in doctor_suggestions."
+    )
+    return {
+        "temperature": 0,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {"type": "image_url", "image_url": {"url": data_url}},
+                ],
+            }
+        ],
+    }
+
+
 def _file_to_data_url(file_path: str) -> str:
     mime_type, _ = mimetypes.guess_type(file_path)
     mime_type = mime_type or "image/jpeg"
@@ -527,10 +941,15 @@ def _normalize_suggestions(items) -> list[str]:
     return cleaned[:6]
 
 
-def _build_trend_hint(context: dict) -> str:
+def _build_trend_hint(context: dict, catalog: Catalog) -> str:
     reports = context.get("reports", [])
     if len(reports) < 2:
-        return "Only one report is available, so trend direction is limited."
+        return catalog.text("trend_single")
+
+    current_names = [p.get("name") for p in reports[-1].get("parameters", [])]
+    trend_statistics = context.get("trend_statistics") or {}
+    if trend_statistics and current_names:
+        return _describe_trend_statistics(trend_statistics, current_names, catalog)
 
     previous = reports[-2].get("parameters", [])
     current = reports[-1].get("parameters", [])
@@ -545,14 +964,36 @@ def _build_trend_hint(context: dict) -> str:
                 continue
             delta = cur_value - prev_value
             if delta > 0:
-                deltas.append(f"{name} increased by {delta:.2f}")
+                deltas.append(catalog.text("delta_up", name=name, delta=f"{delta:.2f}"))
             elif delta < 0:
-                deltas.append(f"{name} decreased by {abs(delta):.2f}")
+                deltas.append(catalog.text("delta_down", name=name, delta=f"{abs(delta):.2f}"))
             else:
-                deltas.append(f"{name} stayed stable")
+                deltas.append(catalog.text("delta_flat", name=name))
     if not deltas:
-        return "Not enough comparable parameters for trend analysis."
-    return "Trend snapshot: " + "; ".join(deltas[:5]) + "."
+        return catalog.text("trend_insufficient")
+    return catalog.text("trend_snapshot", lines="; ".join(deltas[:5]))
+
+
+def _describe_trend_statistics(trend_statistics: dict, names: list[str], catalog: Catalog) -> str:
+    lines = []
+    for name in names:
+        stats = trend_statistics.get(name)
+        if not stats or stats.get("points", 0) < 2:
+            continue
+        # Numbers are left out on purpose: claim validation only accepts values
+        # that appear in the extracted parameters.
+        line = catalog.text("trend_line", name=name, direction=catalog.text(f"direction_{stats['direction']}"))
+        out_of_range = stats.get("time_out_of_range")
+        if out_of_range is not None and out_of_range >= 0.5:
+            line += catalog.text("trend_out_most")
+        elif out_of_range:
+            line += catalog.text("trend_out_part")
+        if stats.get("change_points"):
+            line += catalog.text("trend_shift")
+        lines.append(line)
+    if not lines:
+        return catalog.text("trend_insufficient")
+    return catalog.text("trend_snapshot", lines="; ".join(lines[:5]))
 
 
 def _extract_report_notes(text: str) -> list[str]:
@@ -597,7 +1038,8 @@ def _extract_report_notes(text: str) -> list[str]:
 
 
 def _ensure_analysis_shape(parsed: dict, context: dict) -> dict:
-    fallback = fallback_analysis(context)
+    # Provider output is English, so gaps are filled from the English catalog.
+    fallback = fallback_analysis(context, language=DEFAULT_LANGUAGE)
     comprehensive = _coerce_to_text(parsed.get("comprehensive_narrative"))
     mentor = _coerce_to_text(parsed.get("mentor_summary"))
     return {
@@ -630,7 +1072,7 @@ def _coerce_to_text(value) -> str:
     return str(value).strip()
 
 
-def _build_comprehensive_fallback_narrative(context: dict) -> str:
+def _build_comprehensive_fallback_narrative(context: dict, catalog: Catalog) -> str:
     reports = context.get("reports", []) or []
     latest_report = reports[-1] if reports else {"parameters": []}
     latest_params = latest_report.get("parameters", []) or []
@@ -639,51 +1081,43 @@ def _build_comprehensive_fallback_narrative(context: dict) -> str:
     high = [p.get("name") for p in latest_params if p.get("risk_flag") == "high"]
     low = [p.get("name") for p in latest_params if p.get("risk_flag") == "low"]
     normal_count = len([p for p in latest_params if p.get("risk_flag") == "normal"])
-    trend_hint = _build_trend_hint(context)
+    trend_hint = _build_trend_hint(context, catalog)
     doctor_notes = latest_report.get("doctor_notes_or_comments", []) or []
 
-    symptoms = user_context.get("current_symptoms") or "no symptoms shared currently"
-    conditions = user_context.get("past_medical_conditions") or "no major past conditions shared"
-    medications = user_context.get("medications") or "no current medicines listed"
+    not_available = catalog.text("not_available")
     lifestyle = user_context.get("lifestyle") or {}
-    sleep = lifestyle.get("sleep_hours") or "NA"
-    activity = lifestyle.get("activity_level") or "NA"
-    diet = lifestyle.get("diet_type") or "NA"
+    profile = {
+        "symptoms": user_context.get("current_symptoms") or catalog.text("symptoms_default"),
+        "conditions": user_context.get("past_medical_conditions") or catalog.text("conditions_default"),
+        "medications": user_context.get("medications") or catalog.text("medications_default"),
+        "sleep": lifestyle.get("sleep_hours") or not_available,
+        "activity": lifestyle.get("activity_level") or not_available,
+        "diet": lifestyle.get("diet_type") or not_available,
+    }
 
     if not latest_params:
-        return (
-            "I could not reliably read lab values from this upload, so I cannot give a trustworthy interpretation yet. "
-            "Please upload a clearer scan or paste the report text line by line, and I will re-build your trend story. "
-            f"From your profile, I still consider your context important: symptoms are {symptoms}, past history is {conditions}, "
-            f"and medications are {medications}. Lifestyle currently reflects sleep around {sleep} hours, activity level {activity}, and diet type {diet}. "
-            "Once the values are readable, I will connect these factors with your marker patterns and give you a complete interpretation."
-        )
+        return catalog.text("narrative_no_params", **profile)
 
+    none = catalog.text("none")
     stability_note = (
-        "Most markers appear stable or within expected range in this cycle."
+        catalog.text("narrative_stable")
         if not high and not low
-        else (
-            f"The main points needing attention are higher markers: {', '.join(high) if high else 'none'}, "
-            f"and lower markers: {', '.join(low) if low else 'none'}."
+        else catalog.text(
+            "narrative_attention",
+            high=", ".join(high) if high else none,
+            low=", ".join(low) if low else none,
         )
     )
     doctor_note_line = (
-        f" I also factored in your report notes: {'; '.join(doctor_notes[:3])}."
-        if doctor_notes
-        else ""
+        catalog.text("narrative_notes", notes="; ".join(doctor_notes[:3])) if doctor_notes else ""
     )
-
-    return (
-        "I reviewed this report in the context of your previous records and your personal health background, so this is not just a one-time reading. "
-        f"You currently have {normal_count} markers in normal range, and {stability_note} "
-        f"When I map this to your day-to-day context, your current symptoms are {symptoms}, your background history is {conditions}, "
-        f"and your medicine list shows {medications}. Your routine currently reflects sleep around {sleep} hours, activity level {activity}, and a {diet} diet, "
-        "which can meaningfully influence energy, recovery, and longer-term marker movement over time. "
-        f"Across timeline comparison, {trend_hint} "
-        "The practical takeaway is to continue monitoring consistency rather than reacting to one isolated number: keep sleep and activity regular, repeat follow-up testing on schedule, "
-        "and watch for any new symptoms that match trend shifts rather than isolated fluctuations."
-        f"{doctor_note_line} "
-        "Use this as a structured discussion aid with your clinician so decisions are based on your full history, not a single report snapshot."
+    return catalog.text(
+        "narrative",
+        normal_count=normal_count,
+        stability_note=stability_note,
+        trend_hint=trend_hint,
+        doctor_note_line=doctor_note_line,
+        **profile,
     )
 
 
@@ -698,7 +1132,7 @@ def classify(value: float, ref_min: float | None, ref_max: float | None) -> str:
 
 
 def _build_input_guardrail_blocked_analysis(context: dict, input_guardrail_result: dict) -> dict:
-    fallback = fallback_analysis(context)
+    fallback = fallback_analysis(context, language=DEFAULT_LANGUAGE)
     reason = input_guardrail_result.get("reason") or "Input quality checks did not pass."
     safe_text = (
         "We could not generate a full AI interpretation because guardrails detected insufficient input quality. "
@@ -0,0 +1,132 @@
+import hashlib
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import ProviderCallLease
+
+
+POLL_INTERVAL_SECONDS = 0.25
+
+_inflight: dict[str, "_Call"] = {}
+_inflight_lock = threading.Lock()
+_last_sweep = 0.0
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+def fingerprint(*parts) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        digest.update(part)
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def single_flight(key: str, fn: Callable[[], Any], cacheable: Callable[[Any], bool] | None = None) -> Any:
+    """Run ``fn`` once for all concurrent callers sharing ``key``.
+
+    Threads in this process wait on the leader's event; other processes find
+    the leader's lease row and poll it until the JSON result is published.
+    ``fn`` must return something JSON-serializable. A result for which
+    ``cacheable(result)`` is false, such as a provider failure, is only
+    shared with callers already waiting in this process; the lease is
+    released unpublished, so later callers retry.
+    """
+    with _inflight_lock:
+        call = _inflight.get(key)
+        leader = call is None
+        if leader:
+            call = _inflight[key] = _Call()
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        if getattr(settings, "SINGLE_FLIGHT_CROSS_PROCESS", True):
+            call.result = _run_with_lease(key, fn, cacheable)
+        else:
+            call.result = fn()
+    except BaseException as exc:
+        call.error = exc
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        call.done.set()
+    return call.result
+
+
+def _run_with_lease(key: str, fn: Callable[[], Any], cacheable: Callable[[Any], bool] | None) -> Any:
+    lease_seconds = float(getattr(settings, "SINGLE_FLIGHT_LEASE_SECONDS", 180))
+    result_ttl = float(getattr(settings, "SINGLE_FLIGHT_RESULT_TTL", 0))
+    _sweep_expired()
+
+    waiting = False
+    while True:
+        now = timezone.now()
+        if _claim(key, now + timedelta(seconds=lease_seconds)):
+            break
+        lease = ProviderCallLease.objects.filter(key=key).first()
+        if lease is None:
+            continue
+        if lease.status == "done" and (waiting or lease.expires_at > now):
+            # Callers that waited on the leader always collect its result; later callers
+            # only reuse it within SINGLE_FLIGHT_RESULT_TTL.
+            return lease.result
+        if lease.status == "done" or lease.expires_at <= now:
+            # A stale result, or a leader that died or overran its lease; whoever deletes it first takes over.
+            ProviderCallLease.objects.filter(pk=lease.pk, status=lease.status, expires_at=lease.expires_at).delete()
+            continue
+        waiting = True
+        time.sleep(POLL_INTERVAL_SECONDS)
+
+    try:
+        result = fn()
+    except BaseException:
+        ProviderCallLease.objects.filter(key=key, status="running").delete()
+        raise
+    if cacheable is not None and not cacheable(result):
+        ProviderCallLease.objects.filter(key=key, status="running").delete()
+        return result
+    ProviderCallLease.objects.filter(key=key).update(
+        status="done",
+        result=result,
+        expires_at=timezone.now() + timedelta(seconds=result_ttl),
+    )
+    return result
+
+
+def _sweep_expired() -> None:
+    """Delete long-expired leases, at most once per SINGLE_FLIGHT_SWEEP_SECONDS per process."""
+    global _last_sweep
+    interval = float(getattr(settings, "SINGLE_FLIGHT_SWEEP_SECONDS", 300))
+    with _inflight_lock:
+        if time.monotonic() - _last_sweep < interval:
+            return
+        _last_sweep = time.monotonic()
+    ProviderCallLease.objects.filter(expires_at__lt=timezone.now() - timedelta(minutes=10)).delete()
+
+
+def _claim(key: str, expires_at) -> bool:
+    try:
+        with transaction.atomic():
+            ProviderCallLease.objects.create(key=key, status="running", expires_at=expires_at)
+    except IntegrityError:
+        return False
+    return True
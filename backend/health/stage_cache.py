@@ -0,0 +1,60 @@
+"""Per-report memoization of report pipeline stages.
+
+Each stage's output is stored with a fingerprint of its inputs and of the
+source code that implements it. A later run of the same report reuses the
+output when both are unchanged. Editing a stage's code changes its code
+version, so that stage runs again. Outputs a stage marks as failures, such
+as provider errors and empty extractions, are not stored and are retried.
+"""
+
+import functools
+import inspect
+import json
+
+from django.conf import settings
+
+from . import metrics
+from .models import MedicalReport, PipelineStageResult
+from .singleflight import fingerprint
+
+
+@functools.cache
+def code_version(*parts) -> str:
+    """Hash of the source of the given functions and modules."""
+    sources = []
+    for part in parts:
+        try:
+            sources.append(inspect.getsource(part))
+        except (OSError, TypeError):
+            # No source (e.g. a test double); fall back to the dotted name.
+            name = getattr(part, "__qualname__", type(part).__qualname__)
+            sources.append(f"{getattr(part, '__module__', '')}.{name}")
+    return fingerprint(*sources)
+
+
+class StageCache:
+    def __init__(self, report: MedicalReport, enabled: bool | None = None):
+        self.report = report
+        self.enabled = bool(getattr(settings, "PIPELINE_STAGE_CACHE", True)) if enabled is None else enabled
+        self.rows = {row.stage: row for row in report.stage_results.all()} if self.enabled else {}
+
+    def run(self, stage: str, inputs, compute, code: str, keep=None):
+        """Return the stored output of ``stage`` for ``inputs``, or ``compute()`` it and store it.
+
+        ``keep(output)`` can refuse to store an output, for example a provider failure.
+        """
+        if not self.enabled:
+            return compute()
+        key = fingerprint(stage, code, json.dumps(inputs, sort_keys=True, default=str))
+        row = self.rows.get(stage)
+        if row is not None and row.fingerprint == key:
+            metrics.incr(f"pipeline.{stage}.hit")
+            return row.output
+
+        metrics.incr(f"pipeline.{stage}.miss")
+        output = compute()
+        if keep is None or keep(output):
+            self.rows[stage], _ = PipelineStageResult.objects.update_or_create(
+                report=self.report, stage=stage, defaults={"fingerprint": key, "output": output}
+            )
+        return output
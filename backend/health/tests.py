@@ -1,11 +1,96 @@
+import hashlib
+import io
+import json
+import math
+import os
+import pstats
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from datetime import date, timedelta
+from string import Template
+
+import requests
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.contrib.sessions.models import Session
+from django.core.management import CommandError, call_command
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import Client, TestCase
+from django.db import router
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from unittest.mock import Mock, patch
 
-from .models import AnalysisResult, MedicalReport
-from .services import process_report
+from core.models import UserProfile
+
+from . import llm_router, metrics
+from .cohorts import cohort_statistics
+from .management.commands.benchmark_hotpaths import allowed_slowdown
+from .db_routing import use_primary, use_replica
+from .forms import BulkReportUploadForm
+from .middleware import PRIMARY_STICKY_COOKIE, ReadReplicaMiddleware
+from .models import AnalysisResult, ChunkedUpload, LabParameter, MedicalReport, ProviderCallLease, ProviderRateBucket
+from .narratives import _CATALOG_SOURCES, get_catalog, resolve_language
+from .rate_limit import RateLimitExceeded, acquire, settle
+from .services import (
+    _parse_lines_to_parameters,
+    fallback_analysis,
+    generate_analysis,
+    prepare_llm_context,
+    process_report,
+    process_report_batch,
+)
+from .pdf_text import extract_pdf_pages
+from .profiling import issue_token
+from .providers import ProviderNotConfigured, get_provider
+from .provider_stub import ANALYSIS_REPLY, StubBehavior, running_stub
+from .singleflight import single_flight
+from .tiling import merge_tile_rows, split_into_tiles
+from .uploads import UploadOffsetMismatch, _reserve_report_name, partial_path, sweep_abandoned_uploads, write_chunk
+from .trends import compute_trend_statistics
+
+
+def use_temporary_media_root(test_case) -> str:
+    """Point MEDIA_ROOT at a fresh directory for one test and remove it afterwards."""
+    root = tempfile.mkdtemp()
+    test_case.addCleanup(shutil.rmtree, root, ignore_errors=True)
+    override = override_settings(MEDIA_ROOT=root)
+    override.enable()
+    test_case.addCleanup(override.disable)
+    return root
+
+
+def _build_pdf(pages: list[list[str]]) -> bytes:
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for lines in pages:
+        stream = "BT /F1 11 Tf 14 TL 40 800 Td " + " ".join(
+            "(" + line.replace("(", "[").replace(")", "]") + ") '" for line in lines
+        ) + " ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>"
+
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref_at = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return body
 
 
 class HealthFlowTests(TestCase):
@@ -56,6 +141,12 @@ class HealthFlowTests(TestCase):
         self.assertTrue(report.parameters.exists())
         self.assertTrue(report.doctor_suggestions)
 
+    def test_hyphenated_reference_range_is_read_as_low_to_high(self):
+        rows = _parse_lines_to_parameters(
+            "Hemoglobin 12.8 g/dL 12-16\nPotassium 4.1 mmol/L 3.5 to 5.1\nTemperature -1.5 C -2--1"
+        )
+        self.assertEqual([(row["ref_min"], row["ref_max"]) for row in rows], [(12.0, 16.0), (3.5, 5.1), (-2.0, -1.0)])
+
     def test_image_upload_still_analyzes_with_fallback(self):
         self.client.login(username="u1", password="pass12345")
         response = self.client.post(
@@ -90,7 +181,7 @@ class HealthFlowTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Graphical Trend Analysis")
 
-    @patch("health.views.requests.get")
+    @patch("health.providers.google_translate.requests.get")
     def test_translate_endpoint_returns_translated_text(self, mock_get):
         self.client.login(username="u1", password="pass12345")
         mock_response = Mock()
@@ -106,7 +197,7 @@ class HealthFlowTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json().get("translated_text"), "Hola")
 
-    @patch("health.views.asyncio.run")
+    @patch("health.providers.speech.asyncio.run")
     def test_tts_endpoint_returns_audio(self, mock_asyncio_run):
         self.client.login(username="u1", password="pass12345")
         def _fake_run(coroutine):
@@ -162,3 +253,1561 @@ class HealthFlowTests(TestCase):
         self.assertIn("guardrail_meta", raw)
         self.assertTrue(raw["guardrail_meta"]["input_guardrails"]["safe"])
         self.assertIn(raw["guardrail_meta"].get("confidence"), ["HIGH", "MEDIUM", "LOW"])
+
+
+@override_settings(GROQ_REQUESTS_PER_MINUTE=2, GROQ_TOKENS_PER_MINUTE=1000, GROQ_RATE_LIMIT_MAX_WAIT=0)
+class ProviderRateLimitTests(TestCase):
+    def test_request_budget_is_shared_and_exhausts(self):
+        self.assertTrue(acquire("groq", 100, max_wait=0))
+        self.assertTrue(acquire("groq", 100, max_wait=0))
+        self.assertFalse(acquire("groq", 100, max_wait=0))
+
+    def test_token_budget_blocks_large_requests(self):
+        self.assertTrue(acquire("groq", 900, max_wait=0))
+        self.assertFalse(acquire("groq", 500, max_wait=0))
+
+    def test_settle_refunds_overestimated_tokens(self):
+        acquire("groq", 900, max_wait=0)
+        settle("groq", 900, 200)
+        bucket = ProviderRateBucket.objects.get(provider="groq")
+        self.assertAlmostEqual(bucket.token_allowance, 800, delta=5)
+        self.assertTrue(acquire("groq", 500, max_wait=0))
+
+    @override_settings(GROQ_API_KEY="test-key")
+    @patch("health.providers.groq.requests.post")
+    def test_groq_call_is_not_sent_without_quota(self, mock_post):
+        acquire("groq", 0, max_wait=0)
+        acquire("groq", 0, max_wait=0)
+        with self.assertRaises(RateLimitExceeded):
+            get_provider("llm", "groq").chat_completion({"messages": []}, timeout=5)
+        mock_post.assert_not_called()
+
+    @override_settings(GROQ_API_KEY="test-key", GROQ_RATE_LIMIT_MAX_WAIT=5)
+    @patch("health.providers.groq.time.sleep")
+    @patch("health.providers.groq.requests.post")
+    def test_groq_429_retry_reuses_the_acquired_budget(self, mock_post, _sleep):
+        throttled = Mock(status_code=429, headers={"Retry-After": "1"})
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"choices": [], "usage": {"total_tokens": 10}}
+        mock_post.side_effect = [throttled, ok]
+        get_provider("llm", "groq").chat_completion({"messages": []}, timeout=5)
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertTrue(acquire("groq", 0, max_wait=0))
+        self.assertFalse(acquire("groq", 0, max_wait=0))
+
+
+class SingleFlightTests(TestCase):
+    @override_settings(SINGLE_FLIGHT_CROSS_PROCESS=False)
+    def test_concurrent_callers_share_one_call(self):
+        release = threading.Event()
+        calls = []
+
+        def _slow_call():
+            calls.append(1)
+            release.wait(2)
+            return {"value": 42}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(single_flight("same-key", _slow_call)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"value": 42}] * 4)
+
+    def test_waiter_collects_result_published_by_other_process(self):
+        ProviderCallLease.objects.create(
+            key="shared", status="running", expires_at=timezone.now() + timedelta(seconds=30)
+        )
+
+        def leader_finishes(_seconds):
+            ProviderCallLease.objects.filter(key="shared").update(
+                status="done", result={"value": 7}, expires_at=timezone.now()
+            )
+
+        fn = Mock(return_value={"value": 1})
+        with patch("health.singleflight.time.sleep", side_effect=leader_finishes):
+            self.assertEqual(single_flight("shared", fn), {"value": 7})
+        fn.assert_not_called()
+
+    def test_finished_result_is_not_reused_by_later_callers(self):
+        ProviderCallLease.objects.create(key="shared", status="done", result={"value": 7}, expires_at=timezone.now())
+        self.assertEqual(single_flight("shared", lambda: {"value": 1}), {"value": 1})
+
+    @override_settings(SINGLE_FLIGHT_RESULT_TTL=30)
+    def test_finished_result_is_reused_within_result_ttl(self):
+        ProviderCallLease.objects.create(
+            key="shared", status="done", result={"value": 7}, expires_at=timezone.now() + timedelta(seconds=30)
+        )
+        fn = Mock(return_value={"value": 1})
+        self.assertEqual(single_flight("shared", fn), {"value": 7})
+        fn.assert_not_called()
+
+    def test_expired_lease_is_taken_over(self):
+        ProviderCallLease.objects.create(
+            key="stale", status="running", expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertEqual(single_flight("stale", lambda: {"value": 3}), {"value": 3})
+        self.assertEqual(ProviderCallLease.objects.get(key="stale").status, "done")
+
+    def test_failed_result_is_not_published(self):
+        fn = Mock(side_effect=[None, {"value": 5}])
+
+        def succeeded(result):
+            return result is not None
+
+        self.assertIsNone(single_flight("flaky", fn, cacheable=succeeded))
+        self.assertFalse(ProviderCallLease.objects.filter(key="flaky").exists())
+        self.assertEqual(single_flight("flaky", fn, cacheable=succeeded), {"value": 5})
+        self.assertEqual(fn.call_count, 2)
+
+    def test_expired_leases_are_swept_at_most_once_per_interval(self):
+        old = timezone.now() - timedelta(hours=1)
+        ProviderCallLease.objects.create(key="old-1", status="done", expires_at=old)
+        with patch("health.singleflight._last_sweep", 0.0):
+            single_flight("fresh-1", lambda: {"value": 1})
+            self.assertFalse(ProviderCallLease.objects.filter(key="old-1").exists())
+            ProviderCallLease.objects.create(key="old-2", status="done", expires_at=old)
+            single_flight("fresh-2", lambda: {"value": 2})
+            self.assertTrue(ProviderCallLease.objects.filter(key="old-2").exists())
+
+    @override_settings(GROQ_API_KEY="test-key", SINGLE_FLIGHT_RESULT_TTL=60)
+    @patch("health.services._request_analysis")
+    def test_identical_analysis_contexts_share_result_within_ttl(self, mock_request):
+        mock_request.return_value = {"mentor_summary": "ok"}
+        context = {"current_report_id": 1, "reports": []}
+        generate_analysis(context)
+        generate_analysis(dict(context))
+        self.assertEqual(mock_request.call_count, 1)
+
+    @override_settings(GROQ_API_KEY="test-key")
+    @patch("health.services._request_analysis")
+    def test_analysis_is_requested_again_once_finished(self, mock_request):
+        mock_request.return_value = {"mentor_summary": "ok"}
+        context = {"current_report_id": 1, "reports": []}
+        generate_analysis(context)
+        generate_analysis(dict(context))
+        self.assertEqual(mock_request.call_count, 2)
+
+
+class BulkUploadTests(TestCase):
+    def setUp(self):
+        use_temporary_media_root(self)
+        self.client = Client()
+        self.user = User.objects.create_user(username="bulk", password="pass12345")
+        self.client.login(username="bulk", password="pass12345")
+
+    def _zip(self, members: dict) -> SimpleUploadedFile:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            for name, content in members.items():
+                archive.writestr(name, content)
+        return SimpleUploadedFile("history.zip", buffer.getvalue(), content_type="application/zip")
+
+    @override_settings(GROQ_API_KEY="test-key")
+    @patch("health.services.generate_analysis")
+    def test_zip_upload_creates_reports_with_one_provider_analysis(self, mock_generate):
+        mock_generate.return_value = {"comprehensive_narrative": "Batch narrative."}
+        archive = self._zip(
+            {
+                "cbc_2025-01-10.txt": "Hemoglobin 11.0 g/dL 12-16\nWBC 6000 cells/uL 4000-11000\nPlatelets 200000 /uL 150000-450000",
+                "cbc_later.txt": "Hemoglobin 12.4 g/dL 12-16\nWBC 6500 cells/uL 4000-11000\nPlatelets 210000 /uL 150000-450000",
+                "notes.pdf.bak": "ignored",
+            }
+        )
+        response = self.client.post(
+            reverse("report-bulk-upload"),
+            {
+                "report_files": archive,
+                "report_date": "2025-03-01",
+                "file_dates": "cbc_later.txt: 2025-06-15",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        reports = MedicalReport.objects.filter(user=self.user).order_by("report_date")
+        self.assertEqual([r.report_date for r in reports], [date(2025, 1, 10), date(2025, 6, 15)])
+        self.assertTrue(all(r.analysis_completed for r in reports))
+        self.assertEqual(sum(r.parameters.count() for r in reports), 6)
+        self.assertEqual(mock_generate.call_count, 1)
+        self.assertEqual(mock_generate.call_args[0][0]["current_report_id"], reports.last().id)
+
+    def test_older_batch_reports_only_see_trends_up_to_their_own_date(self):
+        reports = [
+            MedicalReport.objects.create(
+                user=self.user,
+                report_date=day,
+                ocr_text=f"Hemoglobin {value} g/dL 12-16\nWBC 6500 cells/uL 4000-11000\nPlatelets 220000 /uL 150000-450000",
+            )
+            for day, value in (("2025-01-10", 14), ("2025-02-10", 14), ("2025-03-10", 8), ("2025-04-10", 7))
+        ]
+        with patch("health.services.fallback_analysis", wraps=fallback_analysis) as spy:
+            process_report_batch([report.id for report in reports])
+
+        contexts = {call.args[0]["current_report_id"]: call.args[0] for call in spy.call_args_list}
+        stable = contexts[reports[1].id]["trend_statistics"]["Hemoglobin"]
+        self.assertEqual((stable["points"], stable["direction"], stable["time_out_of_range"]), (2, "stable", 0.0))
+        self.assertEqual(contexts[reports[3].id]["trend_statistics"]["Hemoglobin"]["points"], 4)
+
+    def test_multi_file_upload_uses_default_date(self):
+        response = self.client.post(
+            reverse("report-bulk-upload"),
+            {
+                "report_files": [
+                    SimpleUploadedFile("a.txt", b"Hemoglobin 12.1 g/dL 12-16"),
+                    SimpleUploadedFile("b.txt", b"Hemoglobin 12.5 g/dL 12-16"),
+                ],
+                "report_date": "2025-02-02",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            MedicalReport.objects.filter(user=self.user, report_date="2025-02-02", analysis_completed=True).count(),
+            2,
+        )
+
+    def test_unsupported_file_is_rejected(self):
+        response = self.client.post(
+            reverse("report-bulk-upload"),
+            {"report_files": SimpleUploadedFile("a.exe", b"MZ"), "report_date": "2025-02-02"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(MedicalReport.objects.filter(user=self.user).exists())
+
+    def _bulk_form(self, archive: SimpleUploadedFile) -> BulkReportUploadForm:
+        return BulkReportUploadForm(data={"report_date": "2025-02-02"}, files={"report_files": archive})
+
+    @override_settings(BULK_UPLOAD_MAX_FILES=2)
+    @patch("zipfile.ZipFile.read")
+    def test_zip_with_too_many_members_is_rejected_before_extraction(self, mock_read):
+        form = self._bulk_form(self._zip({f"r{index}.txt": "Hemoglobin 12 g/dL" for index in range(3)}))
+        self.assertFalse(form.is_valid())
+        self.assertIn("at most 2 reports", str(form.errors))
+        mock_read.assert_not_called()
+
+    @override_settings(BULK_UPLOAD_MAX_TOTAL_BYTES=1000)
+    @patch("zipfile.ZipFile.read")
+    def test_zip_over_total_extracted_size_is_rejected_before_extraction(self, mock_read):
+        form = self._bulk_form(self._zip({"a.txt": "x" * 600, "b.txt": "y" * 600}))
+        self.assertFalse(form.is_valid())
+        self.assertIn("too large once extracted", str(form.errors))
+        mock_read.assert_not_called()
+
+
+class PdfReportTests(TestCase):
+    def setUp(self):
+        use_temporary_media_root(self)
+        self.client = Client()
+        self.user = User.objects.create_user(username="pdf", password="pass12345")
+        self.client.login(username="pdf", password="pass12345")
+
+    @patch("health.services._ocr_image_with_groq")
+    def test_pdf_text_layer_is_parsed_without_vision(self, mock_vision):
+        pdf = _build_pdf(
+            [["Hemoglobin 12.8 g/dL 12-16", "WBC 6500 cells/uL 4000-11000", "Platelets 220000 /uL 150000-450000"]]
+        )
+        response = self.client.post(
+            reverse("report-upload"),
+            {"report_date": "2026-03-01", "report_file": SimpleUploadedFile("lab.pdf", pdf, content_type="application/pdf")},
+        )
+        self.assertEqual(response.status_code, 302)
+        report = MedicalReport.objects.filter(user=self.user).latest("id")
+        self.assertEqual(report.parameters.count(), 3)
+        self.assertIn("Hemoglobin", report.ocr_text)
+        mock_vision.assert_not_called()
+
+    @patch("health.services._ocr_image_with_groq")
+    def test_pdf_page_without_text_layer_goes_to_vision(self, mock_vision):
+        mock_vision.return_value = (
+            [{"name": "Ferritin", "value": 40.0, "unit": "ng/mL", "ref_min": 20.0, "ref_max": 250.0}],
+            [],
+            "OCR succeeded.",
+        )
+        pdf = _build_pdf([["Hemoglobin 12.8 g/dL 12-16"], []])
+        report = MedicalReport.objects.create(
+            user=self.user,
+            report_date="2026-03-02",
+            report_file=SimpleUploadedFile("mixed.pdf", pdf, content_type="application/pdf"),
+        )
+        process_report(report.id)
+        names = set(report.parameters.values_list("name", flat=True))
+        self.assertEqual(names, {"Hemoglobin", "Ferritin"})
+        self.assertEqual(mock_vision.call_count, 1)
+
+    @override_settings(PDF_PARALLEL_MIN_PAGES=2, PDF_TEXT_WORKERS=2)
+    def test_page_parallel_extraction_keeps_page_order(self):
+        pdf = _build_pdf([[f"Marker{index} {index}.5 mg/dL 1-9"] for index in range(3)])
+        report = MedicalReport.objects.create(
+            user=self.user,
+            report_date="2026-03-03",
+            report_file=SimpleUploadedFile("pages.pdf", pdf, content_type="application/pdf"),
+        )
+        pages = extract_pdf_pages(report.report_file.path)
+        self.assertEqual(len(pages), 3)
+        for index, page in enumerate(pages):
+            self.assertIn(f"Marker{index}", page)
+
+
+@override_settings(OCR_LOCAL_ENGINE="tesseract", OCR_LOCAL_MIN_CONFIDENCE=0.6)
+class TieredOcrTests(TestCase):
+    def setUp(self):
+        use_temporary_media_root(self)
+        cache.clear()
+        self.user = User.objects.create_user(username="ocr", password="pass12345")
+
+    def _image_report(self):
+        return MedicalReport.objects.create(
+            user=self.user,
+            report_date="2026-03-05",
+            report_file=SimpleUploadedFile("scan.png", b"fake-png", content_type="image/png"),
+        )
+
+    @patch("health.services._ocr_image_with_groq")
+    @patch("health.services.local_ocr_text")
+    def test_clean_local_read_never_calls_vision(self, mock_local, mock_vision):
+        mock_local.return_value = (
+            "Hemoglobin 12.8 g/dL 12-16\nWBC 6500 cells/uL 4000-11000\nPlatelets 220000 /uL 150000-450000"
+        )
+        report = self._image_report()
+        process_report(report.id)
+        self.assertEqual(report.parameters.count(), 3)
+        mock_vision.assert_not_called()
+        self.assertEqual(metrics.snapshot("ocr.")["ocr.local.accepted"], 1)
+
+    @patch("health.services._ocr_image_with_groq")
+    @patch("health.services.local_ocr_text")
+    def test_low_confidence_local_read_escalates_to_vision(self, mock_local, mock_vision):
+        mock_local.return_value = "blurry 12"
+        mock_vision.return_value = (
+            [{"name": "Hemoglobin", "value": 12.8, "unit": "g/dL", "ref_min": 12.0, "ref_max": 16.0}],
+            [],
+            "OCR succeeded with test-model.",
+        )
+        report = self._image_report()
+        process_report(report.id)
+        mock_vision.assert_called_once()
+        self.assertEqual(list(report.parameters.values_list("name", flat=True)), ["Hemoglobin"])
+        snapshot = metrics.snapshot("ocr.")
+        self.assertEqual(snapshot["ocr.local.escalated"], 1)
+        self.assertEqual(snapshot["ocr.vision.count"], 1)
+
+    def test_metrics_endpoint_is_staff_only(self):
+        client = Client()
+        client.login(username="ocr", password="pass12345")
+        self.assertEqual(client.get(reverse("health-metrics")).status_code, 302)
+        self.user.is_staff = True
+        self.user.save()
+        self.assertEqual(client.get(reverse("health-metrics")).status_code, 200)
+
+
+@override_settings(OCR_LOCAL_ENGINE="", OCR_TILES=3, OCR_TILE_OVERLAP=0.1)
+class TiledOcrTests(TestCase):
+    def setUp(self):
+        use_temporary_media_root(self)
+        self.user = User.objects.create_user(username="tiles", password="pass12345")
+
+    def _tall_png(self) -> bytes:
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (400, 1200), "white").save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def test_tiles_overlap_and_cover_the_image(self):
+        report = MedicalReport.objects.create(
+            user=self.user,
+            report_date="2026-03-06",
+            report_file=SimpleUploadedFile("tall.png", self._tall_png(), content_type="image/png"),
+        )
+        from PIL import Image
+
+        heights = [Image.open(io.BytesIO(tile)).size[1] for tile in split_into_tiles(report.report_file.path, 3, 0.1)]
+        self.assertEqual(len(heights), 3)
+        self.assertGreater(sum(heights), 1200)
+
+    def test_overlap_duplicates_are_merged_by_name_and_value(self):
+        merged = merge_tile_rows(
+            [
+                [{"name": "Hemoglobin", "value": 12.8}, {"name": "WBC", "value": 6500}],
+                [{"name": "wbc", "value": 6500.0}, {"name": "Platelets", "value": 220000}],
+            ],
+            overlap=0.12,
+        )
+        self.assertEqual([row["name"] for row in merged], ["Hemoglobin", "WBC", "Platelets"])
+
+    def test_repeats_outside_the_overlap_band_are_kept(self):
+        panel = [{"name": f"Marker {index}", "value": index} for index in range(8)]
+        glucose = {"name": "Glucose", "value": 96}
+        merged = merge_tile_rows(
+            [
+                [glucose, *panel],
+                [*panel[6:], {"name": "Sodium", "value": 140}],
+                [dict(glucose), {"name": "Potassium", "value": 4}],
+            ],
+            overlap=0.12,
+        )
+        names = [row["name"] for row in merged]
+        self.assertEqual(names.count("Glucose"), 2)
+        self.assertEqual(names.count("Marker 6"), 1)
+        self.assertEqual(names.count("Marker 7"), 1)
+
+    @patch("health.services._ocr_image_with_groq")
+    def test_tall_image_is_ocred_per_tile(self, mock_vision):
+        def _tile_result(path):
+            return (
+                [
+                    {"name": "Hemoglobin", "value": 12.8, "unit": "g/dL", "ref_min": 12.0, "ref_max": 16.0},
+                    {"name": f"Marker {path[-8:]}", "value": 1.0, "unit": "", "ref_min": None, "ref_max": None},
+                ],
+                [],
+                "ok",
+            )
+
+        mock_vision.side_effect = _tile_result
+        report = MedicalReport.objects.create(
+            user=self.user,
+            report_date="2026-03-06",
+            report_file=SimpleUploadedFile("tall.png", self._tall_png(), content_type="image/png"),
+        )
+        process_report(report.id)
+        self.assertEqual(mock_vision.call_count, 3)
+        self.assertEqual(report.parameters.filter(name="Hemoglobin").count(), 1)
+        self.assertEqual(report.parameters.count(), 4)
+
+
+@override_settings(CHUNKED_UPLOAD_MAX_CHUNK_BYTES=32)
+class ChunkedUploadTests(TestCase):
+    CONTENT = (
+        b"Hemoglobin 12.8 g/dL 12-16\n"
+        b"WBC 6500 cells/uL 4000-11000\n"
+        b"Platelets 220000 /uL 150000-450000\n"
+    )
+
+    def setUp(self):
+        self.media_root = use_temporary_media_root(self)
+        self.client = Client()
+        self.user = User.objects.create_user(username="chunks", password="pass12345")
+        self.client.login(username="chunks", password="pass12345")
+
+    def _start(self) -> dict:
+        response = self.client.post(
+            reverse("chunked-upload-start"),
+            data={"filename": "cbc.txt", "size": len(self.CONTENT), "report_date": "2026-03-07"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        return response.json()
+
+    def _put(self, upload_id: str, offset: int, chunk: bytes):
+        return self.client.put(
+            reverse("chunked-upload", args=[upload_id]),
+            data=chunk,
+            content_type="application/octet-stream",
+            headers={"Upload-Offset": str(offset)},
+        )
+
+    def test_chunks_assemble_into_processed_report_with_hash(self):
+        upload_id = self._start()["upload_id"]
+        offset = 0
+        while offset < len(self.CONTENT):
+            chunk = self.CONTENT[offset : offset + 32]
+            response = self._put(upload_id, offset, chunk)
+            self.assertEqual(response.status_code, 200)
+            offset = response.json()["offset"]
+
+        state = response.json()
+        self.assertEqual(state["status"], "complete")
+        self.assertEqual(state["content_hash"], hashlib.sha256(self.CONTENT).hexdigest())
+        report = MedicalReport.objects.get(id=state["report_id"], user=self.user)
+        self.assertTrue(report.analysis_completed)
+        self.assertEqual(report.parameters.count(), 3)
+
+    @patch("health.uploads._hashers", {})
+    def test_resume_reports_offset_and_rejects_gaps(self):
+        upload_id = self._start()["upload_id"]
+        self._put(upload_id, 0, self.CONTENT[:32])
+
+        status = self.client.get(reverse("chunked-upload", args=[upload_id])).json()
+        self.assertEqual(status["offset"], 32)
+        self.assertEqual(self._put(upload_id, 64, self.CONTENT[64:96]).status_code, 409)
+
+        # Simulate the resume landing on a fresh worker without the in-memory hasher.
+        from health import uploads
+
+        uploads._hashers.clear()
+        offset = 32
+        while offset < len(self.CONTENT):
+            offset = self._put(upload_id, offset, self.CONTENT[offset : offset + 32]).json()["offset"]
+        upload = ChunkedUpload.objects.get(upload_id=upload_id)
+        self.assertEqual(upload.content_hash, hashlib.sha256(self.CONTENT).hexdigest())
+
+    def test_stale_put_at_a_claimed_offset_never_rewrites_the_partial_file(self):
+        upload = ChunkedUpload.objects.get(upload_id=self._start()["upload_id"])
+        stale = ChunkedUpload.objects.get(pk=upload.pk)
+        write_chunk(upload, 0, io.BytesIO(self.CONTENT[:32]), 32)
+
+        with self.assertRaises(UploadOffsetMismatch) as raised:
+            write_chunk(stale, 0, io.BytesIO(b"x" * 32), 32)
+        self.assertEqual(raised.exception.expected, 32)
+        with open(partial_path(upload), "rb") as handle:
+            self.assertEqual(handle.read(), self.CONTENT[:32])
+
+    def test_short_body_commits_only_what_arrived(self):
+        upload = ChunkedUpload.objects.get(upload_id=self._start()["upload_id"])
+        upload = write_chunk(upload, 0, io.BytesIO(self.CONTENT[:10]), 32)
+        self.assertEqual(upload.received_bytes, 10)
+        self.assertIsNone(upload.writer_lease_until)
+
+    def test_failed_write_leaves_the_committed_offset(self):
+        upload = ChunkedUpload.objects.get(upload_id=self._start()["upload_id"])
+        broken = Mock()
+        broken.read.side_effect = [self.CONTENT[:16], OSError("client went away")]
+        with self.assertRaises(OSError):
+            write_chunk(upload, 0, broken, 32)
+        upload.refresh_from_db()
+        self.assertEqual(upload.received_bytes, 0)
+        self.assertIsNone(upload.writer_lease_until)
+
+    def test_killed_writer_holds_the_upload_until_its_lease_expires(self):
+        upload_id = self._start()["upload_id"]
+        upload = ChunkedUpload.objects.get(upload_id=upload_id)
+        # A writer died mid-chunk: garbage on disk, its lease still set, no committed bytes.
+        with open(partial_path(upload), "wb") as handle:
+            handle.write(b"\x00" * 64)
+        upload.writer_lease_until = timezone.now() + timedelta(seconds=60)
+        upload.save()
+        self.assertEqual(self._put(upload_id, 0, self.CONTENT[:32]).status_code, 409)
+        self.assertEqual(self.client.get(reverse("chunked-upload", args=[upload_id])).json()["offset"], 0)
+
+        ChunkedUpload.objects.filter(pk=upload.pk).update(writer_lease_until=timezone.now() - timedelta(seconds=1))
+        offset = 0
+        while offset < len(self.CONTENT):
+            state = self._put(upload_id, offset, self.CONTENT[offset : offset + 32]).json()
+            offset = state["offset"]
+        self.assertEqual(state["status"], "complete")
+        self.assertEqual(state["content_hash"], hashlib.sha256(self.CONTENT).hexdigest())
+
+    def test_abandoned_uploads_and_orphaned_parts_are_swept(self):
+        upload = ChunkedUpload.objects.get(upload_id=self._start()["upload_id"])
+        write_chunk(upload, 0, io.BytesIO(self.CONTENT[:32]), 32)
+        ChunkedUpload.objects.filter(pk=upload.pk).update(updated_at=timezone.now() - timedelta(days=2))
+        orphan = os.path.join(os.path.dirname(partial_path(upload)), "orphan.part")
+        with open(orphan, "wb") as handle:
+            handle.write(b"x")
+        os.utime(orphan, (0, 0))
+        fresh = ChunkedUpload.objects.get(upload_id=self._start()["upload_id"])
+
+        with patch("health.uploads._last_sweep", 0.0):
+            self.assertEqual(sweep_abandoned_uploads(), 1)
+        self.assertFalse(ChunkedUpload.objects.filter(pk=upload.pk).exists())
+        self.assertFalse(os.path.exists(partial_path(upload)))
+        self.assertFalse(os.path.exists(orphan))
+        self.assertTrue(ChunkedUpload.objects.filter(pk=fresh.pk).exists())
+
+    def test_reserved_report_names_are_unique(self):
+        first = _reserve_report_name("image.jpg")
+        second = _reserve_report_name("image.jpg")
+        self.assertNotEqual(first, second)
+        self.assertTrue(os.path.exists(os.path.join(self.media_root, first)))
+
+    def test_other_users_cannot_touch_upload(self):
+        upload_id = self._start()["upload_id"]
+        User.objects.create_user(username="intruder", password="pass12345")
+        other = Client()
+        other.login(username="intruder", password="pass12345")
+        self.assertEqual(other.get(reverse("chunked-upload", args=[upload_id])).status_code, 404)
+
+
+class ContentHashDedupTests(TestCase):
+    TEXT = "Hemoglobin 12.8 g/dL 12-16\nWBC 6500 cells/uL 4000-11000\nPlatelets 220000 /uL 150000-450000"
+
+    def setUp(self):
+        use_temporary_media_root(self)
+        self.client = Client()
+        self.user = User.objects.create_user(username="dedup", password="pass12345")
+        self.client.login(username="dedup", password="pass12345")
+
+    @patch("health.views.process_report")
+    def test_reuploaded_text_short_circuits_to_existing_report(self, mock_process):
+        self.client.post(reverse("report-upload"), {"report_date": "2026-03-08", "ocr_text": self.TEXT})
+        first = MedicalReport.objects.get(user=self.user)
+        self.assertTrue(first.content_hash)
+        MedicalReport.objects.filter(pk=first.pk).update(analysis_completed=True)
+
+        response = self.client.post(
+            reverse("report-upload"),
+            {"report_date": "2026-03-09", "ocr_text": "  " + self.TEXT.replace("\n", "\n\n  ") + "\n"},
+        )
+        self.assertRedirects(response, reverse("report-detail", args=[first.id]), fetch_redirect_response=False)
+        self.assertEqual(MedicalReport.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(mock_process.call_count, 1)
+
+    def test_other_report_date_does_not_defeat_dedup(self):
+        self.client.post(reverse("report-upload"), {"report_date": "2026-03-08", "ocr_text": self.TEXT})
+        self.client.post(reverse("report-upload"), {"report_date": "2026-05-01", "ocr_text": self.TEXT})
+        report = MedicalReport.objects.get(user=self.user)
+        self.assertEqual(report.report_date, date(2026, 3, 8))
+
+    @override_settings(GROQ_API_KEY="test-key", LLM_ROUTES="groq:test-model")
+    @patch("health.services._request_analysis")
+    def test_reupload_retries_analysis_after_provider_failure(self, mock_request):
+        mock_request.return_value = None
+        self.client.post(reverse("report-upload"), {"report_date": "2026-03-08", "ocr_text": self.TEXT})
+        report = MedicalReport.objects.get(user=self.user)
+        self.assertTrue(report.analysis.raw_response["provider_failed"])
+
+        mock_request.return_value = {"mentor_summary": "Provider analysis."}
+        response = self.client.post(reverse("report-upload"), {"report_date": "2026-03-08", "ocr_text": self.TEXT})
+        self.assertRedirects(response, reverse("report-detail", args=[report.id]), fetch_redirect_response=False)
+        self.assertEqual(mock_request.call_count, 2)
+        report.analysis.refresh_from_db()
+        self.assertNotIn("provider_failed", report.analysis.raw_response)
+        self.assertEqual(MedicalReport.objects.filter(user=self.user).count(), 1)
+
+    def test_same_file_is_not_stored_twice(self):
+        for _ in range(2):
+            self.client.post(
+                reverse("report-upload"),
+                {"report_date": "2026-03-08", "report_file": SimpleUploadedFile("cbc.txt", self.TEXT.encode())},
+            )
+        self.assertEqual(MedicalReport.objects.filter(user=self.user).count(), 1)
+
+    def test_bulk_upload_skips_known_and_repeated_files(self):
+        self.client.post(
+            reverse("report-upload"),
+            {"report_date": "2026-03-08", "report_file": SimpleUploadedFile("cbc.txt", self.TEXT.encode())},
+        )
+        response = self.client.post(
+            reverse("report-bulk-upload"),
+            {
+                "report_files": [
+                    SimpleUploadedFile("again.txt", self.TEXT.encode()),
+                    SimpleUploadedFile("new.txt", b"Hemoglobin 13.1 g/dL 12-16"),
+                    SimpleUploadedFile("new_copy.txt", b"Hemoglobin 13.1 g/dL 12-16"),
+                ],
+                "report_date": "2026-04-01",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(MedicalReport.objects.filter(user=self.user).count(), 2)
+
+    def test_chunked_upload_of_known_file_links_existing_report(self):
+        self.client.post(
+            reverse("report-upload"),
+            {"report_date": "2026-03-08", "report_file": SimpleUploadedFile("cbc.txt", self.TEXT.encode())},
+        )
+        existing = MedicalReport.objects.get(user=self.user)
+        start = self.client.post(
+            reverse("chunked-upload-start"),
+            data={"filename": "cbc.txt", "size": len(self.TEXT), "report_date": "2026-03-10"},
+            content_type="application/json",
+        ).json()
+        state = self.client.put(
+            reverse("chunked-upload", args=[start["upload_id"]]),
+            data=self.TEXT.encode(),
+            content_type="application/octet-stream",
+            headers={"Upload-Offset": "0"},
+        ).json()
+        self.assertTrue(state["duplicate"])
+        self.assertEqual(state["report_id"], existing.id)
+        self.assertEqual(MedicalReport.objects.filter(user=self.user).count(), 1)
+
+    def test_same_content_from_other_user_is_not_shared(self):
+        self.client.post(reverse("report-upload"), {"report_date": "2026-03-08", "ocr_text": self.TEXT})
+        User.objects.create_user(username="other", password="pass12345")
+        other = Client()
+        other.login(username="other", password="pass12345")
+        other.post(reverse("report-upload"), {"report_date": "2026-03-08", "ocr_text": self.TEXT})
+        self.assertEqual(MedicalReport.objects.filter(content_hash__isnull=False).count(), 2)
+
+
+class TrendEngineTests(TestCase):
+    def test_statistics_for_all_parameters_at_once(self):
+        start = date(2025, 1, 1)
+        rows = [("Hemoglobin", start + timedelta(days=30 * i), 10.0 + i, 12.0, 16.0) for i in range(4)]
+        rows += [("WBC", start + timedelta(days=30 * i), 7000.0, 4000.0, 11000.0) for i in range(3)]
+        rows += [("Glucose", start + timedelta(days=10 * i), v, None, None) for i, v in enumerate([90, 91, 90, 91, 150])]
+        stats = compute_trend_statistics(rows)
+
+        hemoglobin = stats["Hemoglobin"]
+        self.assertEqual(hemoglobin["points"], 4)
+        self.assertAlmostEqual(hemoglobin["slope_per_30_days"], 1.0, places=3)
+        self.assertAlmostEqual(hemoglobin["rolling_mean"], 12.0)
+        self.assertAlmostEqual(hemoglobin["percent_change"], 30.0)
+        self.assertAlmostEqual(hemoglobin["time_out_of_range"], 2 / 3, places=3)
+        self.assertEqual(hemoglobin["direction"], "improving")
+
+        self.assertEqual(stats["WBC"]["direction"], "stable")
+        self.assertEqual(stats["WBC"]["time_out_of_range"], 0.0)
+        self.assertEqual(stats["Glucose"]["change_points"], 1)
+        self.assertEqual(stats["Glucose"]["last_change_point_date"], "2025-02-10")
+        self.assertIsNone(stats["Glucose"]["time_out_of_range"])
+
+    def test_trends_feed_llm_context_and_fallback_narrative(self):
+        user = User.objects.create_user(username="trend", password="pass12345")
+        for day, value in (("2025-01-01", 10.5), ("2025-02-01", 11.2), ("2025-03-01", 11.9)):
+            report = MedicalReport.objects.create(
+                user=user,
+                report_date=day,
+                ocr_text=f"Hemoglobin {value} g/dL 12-16\nWBC 6500 cells/uL 4000-11000\nPlatelets 220000 /uL 150000-450000",
+            )
+            process_report(report.id)
+
+        self.assertEqual(prepare_llm_context(report)["trend_statistics"]["Hemoglobin"]["direction"], "improving")
+        analysis = AnalysisResult.objects.get(report=report)
+        self.assertIn("Hemoglobin is improving", analysis.trend_analysis)
+
+    def test_benchmark_command_covers_long_histories(self):
+        out = io.StringIO()
+        call_command("benchmark_trends", points=10000, repeat=1, stdout=out)
+        self.assertIn("10000 points", out.getvalue())
+
+
+class CohortStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        profiles = [("urban", 34, "Vegetarian", [5.2, 5.4]), ("rural", 61, "mixed", [6.8, 7.4]), ("urban", 52, "", [5.9])]
+        for index, (location, age, diet, values) in enumerate(profiles):
+            user = User.objects.create_user(username=f"cohort{index}", password="pass12345")
+            user.userprofile.location_type = location
+            user.userprofile.age = age
+            user.userprofile.diet_type = diet
+            user.userprofile.save()
+            for month, value in enumerate(values, start=1):
+                report = MedicalReport.objects.create(user=user, report_date=f"2025-0{month}-01")
+                LabParameter.objects.create(report=report, name="HbA1c", value=value, unit="%")
+
+    def test_each_user_counts_once_with_their_latest_reading(self):
+        stats = cohort_statistics("hba1c", bins=10, chunk_size=2)
+        self.assertEqual(stats["users"], 3)
+        overall = stats["units"]["%"]["groups"]["all"]["all"]
+        self.assertEqual(overall["count"], 3)
+        self.assertAlmostEqual(overall["mean"], round((5.4 + 7.4 + 5.9) / 3, 3))
+        self.assertEqual(sum(overall["histogram"]), 3)
+        self.assertTrue(5.4 <= overall["percentiles"]["p50"] <= 7.4)
+
+        groups = stats["units"]["%"]["groups"]
+        self.assertEqual(groups["location_type"]["urban"]["count"], 2)
+        self.assertEqual(groups["location_type"]["rural"]["max"], 7.4)
+        self.assertEqual(set(groups["age_band"]), {"30-44", "45-59", "60+"})
+        self.assertEqual(groups["diet_type"]["unknown"]["count"], 1)
+        self.assertEqual(groups["diet_type"]["vegetarian"]["count"], 1)
+
+    def test_readings_in_other_units_are_kept_apart(self):
+        user = User.objects.get(username="cohort0")
+        report = MedicalReport.objects.create(user=user, report_date="2025-03-01")
+        LabParameter.objects.create(report=report, name="HbA1c", value=48, unit="mmol/mol")
+        report = MedicalReport.objects.create(user=user, report_date="2025-04-01")
+        LabParameter.objects.create(report=report, name="HbA1c", value=5.6, unit=" % ")
+
+        stats = cohort_statistics("HbA1c", refresh=True)
+        self.assertEqual(list(stats["units"]), ["%", "mmol/mol"])
+        self.assertEqual(stats["units"]["%"]["groups"]["all"]["all"]["max"], 7.4)
+        self.assertEqual(stats["units"]["%"]["groups"]["location_type"]["urban"]["max"], 5.9)
+        self.assertEqual(stats["units"]["mmol/mol"]["users"], 1)
+        self.assertEqual(stats["units"]["mmol/mol"]["groups"]["all"]["all"]["mean"], 48)
+
+    def test_results_are_cached_for_the_day(self):
+        cohort_statistics("HbA1c")
+        LabParameter.objects.filter(name="HbA1c").delete()
+        self.assertEqual(cohort_statistics("HbA1c")["users"], 3)
+        self.assertEqual(cohort_statistics("HbA1c", refresh=True)["users"], 0)
+
+    def test_command_and_admin_view(self):
+        out = io.StringIO()
+        call_command("cohort_stats", parameter="HbA1c", stdout=out)
+        self.assertIn("HbA1c: 3 users", out.getvalue())
+        self.assertIn("[%] 3 users", out.getvalue())
+
+        staff = User.objects.create_superuser(username="admin", password="pass12345")
+        self.client.force_login(staff)
+        response = self.client.get(reverse("admin:health_cohort_stats"), {"parameter": "HbA1c"})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "rural")
+
+
+class ParquetExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="export", password="pass12345")
+        self.user.userprofile.location_type = "urban"
+        self.user.userprofile.save()
+        for day in ("2025-01-05", "2025-01-20", "2025-02-03"):
+            report = MedicalReport.objects.create(user=self.user, report_date=day)
+            LabParameter.objects.create(report=report, name="HbA1c", value=5.6, unit="%")
+            LabParameter.objects.create(report=report, name="Glucose", value=96, unit="mg/dL", ref_min=70, ref_max=100)
+
+    def test_partitioned_dictionary_encoded_incremental_export(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        with tempfile.TemporaryDirectory() as root:
+            call_command("export_lab_parameters", output=root, batch_size=2, stdout=io.StringIO())
+            partitions = sorted(name for name in os.listdir(root) if name.startswith("report_month="))
+            self.assertEqual(partitions, ["report_month=2025-01", "report_month=2025-02"])
+            table = pq.read_table(os.path.join(root, "report_month=2025-01"))
+            self.assertEqual(table.num_rows, 4)
+            self.assertTrue(pa.types.is_dictionary(table.schema.field("name").type))
+            self.assertEqual(set(table.column("location_type").to_pylist()), {"urban"})
+
+            report = MedicalReport.objects.create(user=self.user, report_date="2025-02-10")
+            LabParameter.objects.create(report=report, name="HbA1c", value=5.9, unit="%")
+            out = io.StringIO()
+            call_command("export_lab_parameters", output=root, stdout=out)
+            self.assertIn("Exported 3 rows into 1 monthly partitions", out.getvalue())
+            self.assertIn("(1 unchanged, 0 removed)", out.getvalue())
+            self.assertEqual(pq.read_table(os.path.join(root, "report_month=2025-02")).num_rows, 3)
+
+    def test_reprocessed_and_deleted_rows_leave_the_dataset(self):
+        import pyarrow.parquet as pq
+
+        with tempfile.TemporaryDirectory() as root:
+            call_command("export_lab_parameters", output=root, stdout=io.StringIO())
+            january = MedicalReport.objects.filter(report_date="2025-01-05").get()
+            january.parameters.all().delete()
+            LabParameter.objects.create(report=january, name="HbA1c", value=6.1, unit="%")
+            MedicalReport.objects.filter(report_date="2025-02-03").delete()
+            out = io.StringIO()
+            call_command("export_lab_parameters", output=root, stdout=out)
+
+            self.assertIn("(0 unchanged, 1 removed)", out.getvalue())
+            table = pq.read_table(os.path.join(root, "report_month=2025-01"))
+            self.assertEqual(sorted(table.column("value").to_pylist()), [5.6, 6.1, 96.0])
+            self.assertEqual(len(os.listdir(os.path.join(root, "report_month=2025-01"))), 1)
+            self.assertFalse(os.path.exists(os.path.join(root, "report_month=2025-02")))
+
+
+class RecordExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="records", password="pass12345")
+        for day, value in (("2025-01-01", 11.0), ("2025-02-01", 12.5)):
+            report = MedicalReport.objects.create(user=self.user, report_date=day, ocr_text=f"Hemoglobin {value} g/dL 12-16")
+            process_report(report.id)
+        other = User.objects.create_user(username="someone", password="pass12345")
+        MedicalReport.objects.create(user=other, report_date="2025-03-01", ocr_text="Secret 1 mg 0-2")
+        self.client.force_login(self.user)
+
+    def test_csv_export_streams_own_history(self):
+        response = self.client.get(reverse("health-export"), {"format": "csv"})
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        body = b"".join(response.streaming_content).decode()
+        rows = body.splitlines()
+        self.assertTrue(rows[0].startswith("record_type,report_id,report_date"))
+        self.assertEqual(sum(row.startswith("parameter,") for row in rows), 2)
+        self.assertIn("mentor_summary", body)
+        self.assertNotIn("Secret", body)
+
+    def test_ndjson_export_has_one_record_per_report(self):
+        response = self.client.get(reverse("health-export"), {"format": "ndjson"})
+        records = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([record["report_date"] for record in records], ["2025-01-01", "2025-02-01"])
+        self.assertEqual(records[1]["parameters"][0]["value"], 12.5)
+        self.assertIsNotNone(records[1]["analysis"])
+
+    def test_unknown_format_is_rejected(self):
+        self.assertEqual(self.client.get(reverse("health-export"), {"format": "xml"}).status_code, 400)
+
+
+class ReportApiTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="api", password="pass12345")
+        self.report = MedicalReport.objects.create(
+            user=self.user, report_date="2025-01-01", ocr_text="Hemoglobin 11.0 g/dL 12-16"
+        )
+        process_report(self.report.id)
+        self.client.force_login(self.user)
+
+    def test_list_detail_parameters_and_trends(self):
+        listing = self.client.get(reverse("api-report-list"))
+        self.assertEqual([item["id"] for item in listing.json()], [self.report.id])
+
+        detail = self.client.get(reverse("api-report-detail", args=[self.report.id])).json()
+        self.assertEqual(detail["parameters"][0]["name"], "Hemoglobin")
+        self.assertTrue(detail["analysis"]["comprehensive_narrative"])
+
+        parameters = self.client.get(reverse("api-report-parameters", args=[self.report.id])).json()
+        self.assertEqual(parameters[0]["risk_flag"], "low")
+
+        series = self.client.get(reverse("api-trends")).json()["series"]
+        self.assertEqual(series[0]["points"][0]["value"], 11.0)
+
+    def test_conditional_get_returns_304_until_the_report_changes(self):
+        url = reverse("api-report-detail", args=[self.report.id])
+        etag = self.client.get(url)["ETag"]
+        self.assertFalse(etag.startswith("W/"))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        list_etag = self.client.get(reverse("api-report-list"))["ETag"]
+        self.assertEqual(self.client.get(reverse("api-report-list"), HTTP_IF_NONE_MATCH=list_etag).status_code, 304)
+
+        process_report(self.report.id)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self.assertEqual(self.client.get(reverse("api-report-list"), HTTP_IF_NONE_MATCH=list_etag).status_code, 200)
+
+    def test_other_users_reports_are_not_found(self):
+        User.objects.create_user(username="stranger", password="pass12345")
+        self.client.login(username="stranger", password="pass12345")
+        self.assertEqual(self.client.get(reverse("api-report-detail", args=[self.report.id])).status_code, 404)
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse("api-report-list")).status_code, 403)
+
+
+class ReportFragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="fragments", password="pass12345")
+        self.report = MedicalReport.objects.create(
+            user=self.user, report_date="2025-01-01", ocr_text="Hemoglobin 11.0 g/dL 12-16"
+        )
+        process_report(self.report.id)
+        self.client.force_login(self.user)
+        self.url = reverse("report-detail", args=[self.report.id])
+
+    def test_second_view_is_served_from_cached_fragments(self):
+        first = self.client.get(self.url)
+        self.assertContains(first, "Extracted Lab Parameters")
+        self.assertContains(first, "trend-series-data")
+        with patch("health.views.build_trend_series") as build:
+            second = self.client.get(self.url)
+        build.assert_not_called()
+        self.assertContains(second, "trend-series-data")
+        snapshot = metrics.snapshot("report_fragments")
+        self.assertEqual(snapshot["report_fragments.hit"], 3)
+        self.assertEqual(snapshot["report_fragments.hit_ratio"], 0.5)
+
+    def test_reprocess_and_newer_reports_invalidate_fragments(self):
+        self.client.get(self.url)
+        self.report.ocr_text = "Hemoglobin 13.5 g/dL 12-16"
+        self.report.save()
+        process_report(self.report.id)
+        self.assertContains(self.client.get(self.url), "13.5")
+
+        newer = MedicalReport.objects.create(
+            user=self.user, report_date="2025-02-01", ocr_text="Hemoglobin 14.2 g/dL 12-16"
+        )
+        process_report(newer.id)
+        self.assertContains(self.client.get(self.url), "2 data points")
+
+
+class NarrativeCatalogTests(TestCase):
+    def test_catalogs_share_keys_and_placeholders(self):
+        english = _CATALOG_SOURCES["en"]
+        for language, messages in _CATALOG_SOURCES.items():
+            self.assertEqual(set(messages), set(english), language)
+            for key, source in messages.items():
+                self.assertEqual(
+                    set(Template(source).get_identifiers()),
+                    set(Template(english[key]).get_identifiers()),
+                    f"{language}:{key}",
+                )
+
+    def test_resolve_language_accepts_codes_and_names(self):
+        self.assertEqual(resolve_language("hi-IN"), "hi")
+        self.assertEqual(resolve_language("Telugu"), "te")
+        self.assertEqual(resolve_language("pt-BR"), "en")
+        self.assertEqual(resolve_language(""), "en")
+
+    @override_settings(GROQ_API_KEY="")
+    @patch("health.providers.groq.requests.post")
+    def test_fallback_narrative_uses_profile_language_offline(self, post):
+        user = User.objects.create_user(username="hindi", password="pass12345")
+        user.userprofile.language_preference = "hi-IN"
+        user.userprofile.save()
+        report = MedicalReport.objects.create(
+            user=user,
+            report_date="2025-01-01",
+            ocr_text="Hemoglobin 11.0 g/dL 12-16\nWBC 6500 cells/uL 4000-11000\nPlatelets 250 10^3/uL 150-400",
+        )
+        analysis = process_report(report.id)
+
+        post.assert_not_called()
+        self.assertEqual(analysis.raw_response["language"], "hi")
+        self.assertIn("मार्कर", analysis.mentor_summary)
+        self.assertIn(get_catalog("hi").text("disclaimer"), analysis.mentor_summary)
+        self.assertNotIn("educational support only", analysis.mentor_summary)
+
+        self.client.force_login(user)
+        response = self.client.get(reverse("report-detail", args=[report.id]))
+        self.assertContains(response, 'data-lang="hi"')
+
+
+@patch("health.db_routing.replica_alias", return_value="replica")
+@patch("health.middleware.replica_alias", return_value="replica")
+class ReadReplicaRoutingTests(TestCase):
+    def setUp(self):
+        # TestCase wraps every test in a transaction, which pins reads to the primary.
+        patcher = patch("health.db_routing.connections")
+        self.connections = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.connections.__getitem__.return_value.in_atomic_block = False
+
+    def _middleware(self):
+        seen = {}
+
+        def view(request):
+            seen["read"] = router.db_for_read(MedicalReport)
+            if request.method == "POST":
+                seen["write"] = router.db_for_write(MedicalReport)
+            return HttpResponse("ok")
+
+        return ReadReplicaMiddleware(view), seen
+
+    def test_reads_default_to_primary_outside_requests(self, *mocks):
+        self.assertEqual(router.db_for_read(MedicalReport), "default")
+        with use_replica():
+            self.assertEqual(router.db_for_read(MedicalReport), "replica")
+            self.assertEqual(router.db_for_read(Session), "default")
+            with use_primary():
+                self.assertEqual(router.db_for_read(MedicalReport), "default")
+            self.connections.__getitem__.return_value.in_atomic_block = True
+            self.assertEqual(router.db_for_read(MedicalReport), "default")
+
+    def test_reads_after_a_write_stay_on_primary(self, *mocks):
+        with use_replica():
+            self.assertEqual(router.db_for_write(MedicalReport), "default")
+            self.assertEqual(router.db_for_read(MedicalReport), "default")
+        with use_replica():
+            self.assertEqual(router.db_for_read(MedicalReport), "replica")
+
+    def test_unsafe_request_makes_following_reads_sticky(self, *mocks):
+        middleware, seen = self._middleware()
+        middleware(RequestFactory().get("/dashboard/"))
+        self.assertEqual(seen["read"], "replica")
+
+        response = middleware(RequestFactory().post("/reports/upload/"))
+        self.assertEqual(seen["read"], "default")
+        self.assertEqual(seen["write"], "default")
+        self.assertIn(PRIMARY_STICKY_COOKIE, response.cookies)
+
+        request = RequestFactory().get("/dashboard/")
+        request.COOKIES[PRIMARY_STICKY_COOKIE] = response.cookies[PRIMARY_STICKY_COOKIE].value
+        middleware(request)
+        self.assertEqual(seen["read"], "default")
+
+
+class LoadTestCommandTests(TransactionTestCase):
+    def setUp(self):
+        self.media_root = use_temporary_media_root(self)
+
+    def test_in_process_run_reports_every_endpoint(self):
+        with tempfile.TemporaryDirectory() as root:
+            output = os.path.join(root, "loadtest.json")
+            call_command(
+                "loadtest", users=1, iterations=2, provider_latency_ms=0, output=output, stdout=io.StringIO()
+            )
+            with open(output, encoding="utf-8") as handle:
+                report = json.load(handle)
+
+        self.assertEqual(
+            set(report["endpoints"]),
+            {"signup", "dashboard", "upload_text", "report_detail", "upload_image", "translate", "tts"},
+        )
+        self.assertEqual(report["endpoints"]["translate"]["requests"], 2)
+        self.assertEqual(report["totals"]["errors"], 0)
+        self.assertEqual(set(report["totals"]["latency_ms"]), {"p50", "p95", "p99", "mean", "max"})
+        self.assertGreater(report["totals"]["throughput_rps"], 0)
+        self.assertFalse(User.objects.filter(username__startswith="loadtest-").exists())
+        uploaded = [name for _, _, names in os.walk(self.media_root) for name in names]
+        self.assertEqual(uploaded, [])
+
+
+class ReprocessReportsCommandTests(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="bulk", password="pass12345")
+        other = User.objects.create_user(username="other", password="pass12345")
+        text = "Hemoglobin 12.8 g/dL 12-16\nWBC 6500 cells/uL 4000-11000\nPlatelets 220000 /uL 150000-450000"
+        self.reports = [
+            MedicalReport.objects.create(user=self.user, report_date=day, ocr_text=text)
+            for day in ("2026-01-05", "2026-02-05", "2026-03-05")
+        ]
+        MedicalReport.objects.create(user=other, report_date="2026-01-05", ocr_text=text)
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+        self.checkpoint = os.path.join(self.root, "checkpoint.json")
+
+    def _run(self, **options):
+        # One worker: the in-memory test database locks whole tables on concurrent writes.
+        out = io.StringIO()
+        call_command(
+            "reprocess_reports",
+            user=["bulk"],
+            workers=1,
+            checkpoint=self.checkpoint,
+            stdout=out,
+            stderr=io.StringIO(),
+            **options,
+        )
+        return out.getvalue()
+
+    def test_processes_selected_reports_and_removes_checkpoint(self):
+        output = self._run(since="2026-02-01")
+        self.assertIn("Reprocessed 2 reports", output)
+        self.assertIn("reports/min", output)
+        self.assertEqual(
+            set(AnalysisResult.objects.values_list("report_id", flat=True)), {report.id for report in self.reports[1:]}
+        )
+        self.assertEqual(LabParameter.objects.filter(report=self.reports[1]).count(), 3)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_failed_reports_are_kept_for_a_resumed_run(self):
+        failing = self.reports[1].id
+
+        def flaky(report_id, use_stage_cache):
+            if report_id == failing:
+                raise RuntimeError("provider down")
+            return process_report(report_id, use_stage_cache=use_stage_cache)
+
+        with patch("health.management.commands.reprocess_reports.process_report", side_effect=flaky):
+            with self.assertRaisesMessage(CommandError, "1 reports failed"):
+                self._run()
+        with open(self.checkpoint, encoding="utf-8") as handle:
+            checkpoint = json.load(handle)
+        self.assertEqual(sorted(checkpoint["done"]), sorted([self.reports[0].id, self.reports[2].id]))
+        self.assertIn("provider down", checkpoint["failed"][str(failing)])
+
+        with patch("health.management.commands.reprocess_reports.process_report") as resumed:
+            output = self._run()
+        self.assertIn("Resuming: 2 of 3 already processed", output)
+        resumed.assert_called_once_with(failing, use_stage_cache=None)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_all_stages_bypasses_the_stage_cache(self):
+        with patch("health.management.commands.reprocess_reports.process_report") as reprocess:
+            self._run(report=[self.reports[0].id], all_stages=True)
+        reprocess.assert_called_once_with(self.reports[0].id, use_stage_cache=False)
+
+    def test_checkpoint_from_another_selection_is_rejected(self):
+        with open(self.checkpoint, "w", encoding="utf-8") as handle:
+            json.dump({"selection": {"user": ["someone-else"]}, "done": [1]}, handle)
+        with self.assertRaisesMessage(CommandError, "different selection"):
+            self._run()
+        self.assertIn("Reprocessed 3 reports", self._run(restart=True))
+
+
+class ProviderStubTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="stub", password="pass12345")
+        self.client = Client()
+        self.client.login(username="stub", password="pass12345")
+
+    def _stub_settings(self, server):
+        return override_settings(
+            **server.provider_settings(),
+            GROQ_API_KEY="stub-key",
+            GROQ_REQUESTS_PER_MINUTE=0,
+            GROQ_TOKENS_PER_MINUTE=0,
+        )
+
+    def test_analysis_goes_through_configured_groq_base_url(self):
+        with running_stub() as server, self._stub_settings(server):
+            analysis = generate_analysis({"current_report_id": 1, "reports": []})
+        self.assertIn(ANALYSIS_REPLY["mentor_summary"], analysis["mentor_summary"])
+
+    def test_translate_and_tts_views_use_configured_base_urls(self):
+        with running_stub() as server, self._stub_settings(server):
+            translated = self.client.post(
+                reverse("report-translate"),
+                data='{"text":"Hello","source_lang":"en","target_lang":"hi-IN"}',
+                content_type="application/json",
+            )
+            audio = self.client.post(
+                reverse("report-tts"),
+                data='{"text":"Namaskaram","target_lang":"te-IN"}',
+                content_type="application/json",
+            )
+        self.assertEqual(translated.json().get("translated_text"), "[hi] Hello")
+        self.assertEqual(audio.status_code, 200)
+        self.assertEqual(audio["Content-Type"], "audio/mpeg")
+        self.assertTrue(audio.content.startswith(b"ID3"))
+
+    def test_injected_rate_limits_carry_retry_after(self):
+        with running_stub(StubBehavior(rate_limit_rate=1.0, retry_after=2)) as server:
+            response = requests.post(f"{server.base_url}/openai/v1/chat/completions", json={"messages": []}, timeout=5)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["Retry-After"], "2")
+
+    def test_streamed_completion_ends_with_done(self):
+        with running_stub(StubBehavior(stream_chunk_ms=0)) as server:
+            response = requests.post(
+                f"{server.base_url}/openai/v1/chat/completions",
+                json={"messages": [{"role": "user", "content": "ping"}], "stream": True},
+                timeout=5,
+            )
+        events = [line for line in response.text.splitlines() if line.startswith("data: ")]
+        self.assertEqual(events[-1], "data: [DONE]")
+        last_chunk = json.loads(events[-2][len("data: "):])
+        self.assertIn("usage", last_chunk["x_groq"])
+
+    def test_latency_distributions_respect_mean(self):
+        behavior = StubBehavior(latency_ms=100, spread_ms=30, distribution="lognormal", seed=7)
+        samples = [behavior.latency() for _ in range(2000)]
+        self.assertAlmostEqual(sum(samples) / len(samples), 0.1, delta=0.005)
+        with self.assertRaises(ValueError):
+            StubBehavior(distribution="pareto")
+
+
+class HotPathBenchmarkTests(TestCase):
+    def test_baseline_round_trip_and_regression_check(self):
+        with tempfile.TemporaryDirectory() as root:
+            baseline = os.path.join(root, "baselines.json")
+            options = {"filter": "validate_language", "repeat": 1, "baseline": baseline, "stdout": io.StringIO()}
+            call_command("benchmark_hotpaths", update_baseline=True, **options)
+            with open(baseline, encoding="utf-8") as handle:
+                stored = json.load(handle)
+            self.assertEqual(
+                set(stored["cases"]), {"validate_language/narrative=1000", "validate_language/narrative=10000"}
+            )
+
+            # A tenfold faster baseline makes the current code look like a regression.
+            for case in stored["cases"].values():
+                case["ops_per_sec"] *= 10
+            with open(baseline, "w", encoding="utf-8") as handle:
+                json.dump(stored, handle)
+            call_command("benchmark_hotpaths", **options)
+            with self.assertRaisesMessage(CommandError, "regressed"):
+                call_command("benchmark_hotpaths", check=True, **options)
+
+    def test_noisy_cases_get_a_wider_threshold(self):
+        quiet = {"ops_per_sec": 100.0, "spread": 0.01, "peak_kib": 1.0}
+        noisy = {"ops_per_sec": 100.0, "spread": 0.1, "peak_kib": 1.0}
+        self.assertEqual(allowed_slowdown(quiet, quiet, 0.25), 0.25)
+        self.assertAlmostEqual(allowed_slowdown(noisy, quiet, 0.25), 3 * math.hypot(0.1, 0.01))
+
+    def test_noise_widening_is_capped(self):
+        noisy = {"ops_per_sec": 100.0, "spread": 0.15, "peak_kib": 1.0}
+        self.assertEqual(allowed_slowdown(noisy, noisy, 0.25, calibration_spread=0.1), 0.5)
+
+    def test_history_cases_run_against_rolled_back_reports(self):
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as root:
+            baseline = os.path.join(root, "baselines.json")
+            call_command("benchmark_hotpaths", filter="history=5", repeat=1, baseline=baseline, stdout=out)
+        self.assertIn("prepare_context/history=5", out.getvalue())
+        self.assertFalse(User.objects.filter(username__startswith="benchmark-").exists())
+
+
+class ProviderBenchmarkTests(TestCase):
+    def test_stub_run_reports_latency_and_tokens_per_route_and_level(self):
+        with tempfile.TemporaryDirectory() as root:
+            output = os.path.join(root, "providers.json")
+            call_command(
+                "benchmark_providers",
+                stub=True,
+                stub_latency_ms=5,
+                route=["groq:stub-model"],
+                concurrency="1,2",
+                requests=2,
+                output=output,
+                stdout=io.StringIO(),
+            )
+            with open(output, encoding="utf-8") as handle:
+                results = json.load(handle)["results"]
+
+        self.assertEqual(
+            [(row["workload"], row["concurrency"]) for row in results],
+            [("analysis", 1), ("analysis", 2), ("ocr", 1), ("ocr", 2)],
+        )
+        for row in results:
+            self.assertEqual((row["ok"], row["errors"], row["rate_limited"]), (2, 0, 0))
+            self.assertLessEqual(row["ttfb_ms"]["p50"], row["latency_ms"]["p50"])
+            self.assertGreater(row["tokens_per_sec"], 0)
+            self.assertFalse(row["tokens_estimated"])
+
+    def test_rate_limits_are_counted_separately_from_errors(self):
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as root:
+            output = os.path.join(root, "providers.json")
+            call_command(
+                "benchmark_providers",
+                stub=True,
+                stub_rate_limit_rate=1.0,
+                workload=["analysis"],
+                route=["gemini:stub-model"],
+                concurrency="2",
+                requests=2,
+                output=output,
+                stdout=out,
+            )
+            with open(output, encoding="utf-8") as handle:
+                (row,) = json.load(handle)["results"]
+        self.assertEqual((row["rate_limited_rate"], row["error_rate"]), (1.0, 0.0))
+        self.assertIn("429 100%", out.getvalue())
+
+    def test_no_configured_route_is_an_error(self):
+        environ = {name: value for name, value in os.environ.items() if not name.endswith("_API_KEY")}
+        with override_settings(GROQ_API_KEY="", GEMINI_API_KEY=""), patch.dict(os.environ, environ, clear=True):
+            with self.assertRaisesMessage(CommandError, "No configured provider"):
+                call_command("benchmark_providers", workload=["analysis"], stdout=io.StringIO())
+
+
+class RequestProfilingTests(TestCase):
+    def setUp(self):
+        self.profile_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.profile_dir, ignore_errors=True)
+        self.settings_override = override_settings(PROFILE_DIR=self.profile_dir)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        self.user = User.objects.create_user(username="viewer", password="pass12345")
+        self.staff = User.objects.create_user(username="ops", password="pass12345", is_staff=True)
+        report = MedicalReport.objects.create(user=self.staff, report_date="2026-02-01", ocr_text="Hemoglobin 12 g/dL 12-16")
+        self.report_url = reverse("report-detail", args=[report.id])
+
+    def _summary(self, response) -> dict:
+        with open(os.path.join(self.profile_dir, f"{response['X-Profile-Id']}.json"), encoding="utf-8") as handle:
+            return json.load(handle)
+
+    @override_settings(PROFILE_TRACE_MEMORY=True)
+    def test_staff_profile_records_queries_and_server_timing(self):
+        self.client.login(username="ops", password="pass12345")
+        response = self.client.get(self.report_url, {"profile": "1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("db;dur=", response["Server-Timing"])
+        summary = self._summary(response)
+        self.assertGreater(summary["queries"]["count"], 0)
+        self.assertGreater(summary["peak_memory_kib"], 0)
+        self.assertEqual(summary["peak_memory_scope"], "process")
+        self.assertIn("function calls", summary["top_functions"])
+        self.assertTrue(os.path.exists(os.path.join(self.profile_dir, f"{summary['id']}.prof")))
+
+    def test_memory_tracing_is_off_by_default(self):
+        self.client.login(username="ops", password="pass12345")
+        summary = self._summary(self.client.get(self.report_url, {"profile": "1"}))
+        self.assertIsNone(summary["peak_memory_kib"])
+        self.assertEqual(summary["peak_memory_scope"], "off")
+        self.assertGreater(summary["queries"]["count"], 0)
+
+    @override_settings(PROFILE_KEEP=2)
+    def test_only_newest_profiles_are_kept(self):
+        self.client.login(username="ops", password="pass12345")
+        ids = []
+        for age in (30, 20, 0):
+            profile_id = self.client.get(self.report_url, {"profile": "1"})["X-Profile-Id"]
+            ids.append(profile_id)
+            for suffix in (".json", ".prof"):
+                path = os.path.join(self.profile_dir, profile_id + suffix)
+                os.utime(path, (time.time() - age, time.time() - age))
+        self.assertEqual(
+            sorted(os.listdir(self.profile_dir)),
+            sorted(f"{profile_id}{suffix}" for profile_id in ids[1:] for suffix in (".json", ".prof")),
+        )
+
+    def test_download_returns_pstats_file(self):
+        self.client.login(username="ops", password="pass12345")
+        response = self.client.get(self.report_url, {"profile": "download"})
+        self.assertIn("attachment", response["Content-Disposition"])
+        with tempfile.NamedTemporaryFile(suffix=".prof") as handle:
+            handle.write(response.content)
+            handle.flush()
+            self.assertGreater(pstats.Stats(handle.name).total_calls, 0)
+
+    def test_non_staff_and_bad_tokens_are_not_profiled(self):
+        self.client.login(username="viewer", password="pass12345")
+        response = self.client.get(reverse("api-report-list"), {"profile": "1"}, HTTP_X_PROFILE_TOKEN="forged")
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(os.listdir(self.profile_dir), [])
+
+    def test_signed_header_profiles_provider_time(self):
+        self.client.login(username="viewer", password="pass12345")
+        with running_stub() as server, override_settings(**server.provider_settings()):
+            response = self.client.post(
+                reverse("report-translate"),
+                data='{"text":"Hello","source_lang":"en","target_lang":"hi-IN"}',
+                content_type="application/json",
+                HTTP_X_PROFILE_TOKEN=issue_token(),
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._summary(response)["providers"]["translate"]["calls"], 1)
+        self.assertIn("translate;dur=", response["Server-Timing"])
+
+
+def shout_translate(text: str, source: str, target: str) -> str:
+    return f"{text.upper()} ({source}->{target})"
+
+
+class ProviderRegistryTests(TestCase):
+    def test_unknown_provider_is_reported(self):
+        with self.assertRaises(ProviderNotConfigured):
+            get_provider("translation", "babelfish")
+
+    def test_translation_backend_is_chosen_by_name(self):
+        providers = {**settings.HEALTH_PROVIDERS, "translation": {"shout": "health.tests.shout_translate"}}
+        User.objects.create_user(username="reg", password="pass12345")
+        self.client.login(username="reg", password="pass12345")
+        with override_settings(HEALTH_PROVIDERS=providers, TRANSLATION_PROVIDER="shout"):
+            response = self.client.post(
+                reverse("report-translate"),
+                data='{"text":"Hello","source_lang":"en","target_lang":"hi-IN"}',
+                content_type="application/json",
+            )
+        self.assertEqual(response.json()["translated_text"], "HELLO (en->hi)")
+
+    def test_management_startup_skips_provider_sdks(self):
+        out = io.StringIO()
+        call_command("benchmark_imports", target=["manage.py (any command)"], repeat=1, stdout=out)
+        self.assertIn("heavy: -", out.getvalue())
+
+
+@override_settings(
+    GROQ_API_KEY="groq-key",
+    GEMINI_API_KEY="gemini-key",
+    LLM_ROUTES="groq:llama-3.1-8b-instant,gemini:gemini-2.0-flash",
+    LLM_ROUTER_PROBE_SECONDS=60,
+    GROQ_REQUESTS_PER_MINUTE=0,
+    GROQ_TOKENS_PER_MINUTE=0,
+)
+class LlmRouterTests(TestCase):
+    GROQ = ("groq", "llama-3.1-8b-instant")
+    GEMINI = ("gemini", "gemini-2.0-flash")
+
+    def setUp(self):
+        cache.clear()
+        catalog = patch("health.llm_router.model_catalog", return_value=None)
+        catalog.start()
+        self.addCleanup(catalog.stop)
+
+    def test_unsampled_routes_keep_preference_then_fastest_leads(self):
+        self.assertEqual(llm_router.plan(), [self.GROQ, self.GEMINI])
+        llm_router.record(*self.GROQ, 0.9, ok=True)
+        llm_router.record(*self.GEMINI, 0.2, ok=True)
+        self.assertEqual(llm_router.plan(), [self.GEMINI, self.GROQ])
+
+    def test_failing_route_is_demoted_until_probe_window(self):
+        llm_router.record(*self.GROQ, 0.1, ok=True)
+        llm_router.record(*self.GEMINI, 0.5, ok=True)
+        llm_router.record(*self.GROQ, 0.1, ok=False)
+        llm_router.record(*self.GROQ, 0.1, ok=False)
+        self.assertEqual(llm_router.plan(), [self.GEMINI, self.GROQ])
+        with override_settings(LLM_ROUTER_PROBE_SECONDS=0):
+            self.assertEqual(llm_router.plan(), [self.GROQ, self.GEMINI])
+
+    def test_routes_without_api_key_or_catalog_entry_are_skipped(self):
+        with override_settings(GEMINI_API_KEY=""):
+            self.assertEqual(llm_router.configured_routes(), [self.GROQ])
+        with patch("health.llm_router.model_catalog", side_effect=lambda provider: {"gemini-2.0-flash"}):
+            self.assertEqual(llm_router.plan(), [self.GEMINI])
+
+    def test_analysis_falls_back_to_next_provider(self):
+        with running_stub(StubBehavior(error_rate=1.0)) as broken, running_stub() as healthy:
+            with override_settings(
+                GROQ_BASE_URL=broken.provider_settings()["GROQ_BASE_URL"],
+                GEMINI_BASE_URL=healthy.provider_settings()["GEMINI_BASE_URL"],
+            ):
+                analysis = generate_analysis({"current_report_id": 1, "reports": []})
+        self.assertIn(ANALYSIS_REPLY["mentor_summary"], analysis["mentor_summary"])
+        stats = llm_router.route_stats()
+        self.assertEqual(stats["groq:llama-3.1-8b-instant"]["error_rate"], 1.0)
+        self.assertEqual(stats["gemini:gemini-2.0-flash"]["error_rate"], 0.0)
+
+    @override_settings(GROQ_REQUESTS_PER_MINUTE=1, GROQ_RATE_LIMIT_MAX_WAIT=0)
+    def test_local_quota_refusal_is_not_a_route_failure(self):
+        self.assertTrue(acquire("groq", 0, max_wait=0))
+        with running_stub() as server, override_settings(**server.provider_settings()):
+            _, route = llm_router.chat_completion({"messages": [{"role": "user", "content": "hi"}]}, timeout=5)
+        self.assertEqual(route, self.GEMINI)
+        self.assertIsNone(llm_router.route_stats()["groq:llama-3.1-8b-instant"])
+
+
+class ModelCatalogTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_catalog_is_fetched_once_and_cached(self):
+        with running_stub() as server, override_settings(**server.provider_settings(), GEMINI_API_KEY="key"):
+            with patch("health.providers.gemini.requests.get", wraps=requests.get) as get:
+                self.assertIn("gemini-2.0-flash", llm_router.model_catalog("gemini"))
+                llm_router.model_catalog("gemini")
+        self.assertEqual(get.call_count, 1)
+
+
+@override_settings(GROQ_API_KEY="test-key", LLM_ROUTES="groq:test-model")
+class PipelineStageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="stages", password="pass12345")
+        self.report = MedicalReport.objects.create(
+            user=self.user,
+            report_date="2026-03-01",
+            ocr_text="Hemoglobin 12.8 g/dL 12-16\nWBC 6500 cells/uL 4000-11000\nPlatelets 220000 /uL 150000-450000",
+        )
+        catalog = patch("health.llm_router.model_catalog", return_value=None)
+        catalog.start()
+        self.addCleanup(catalog.stop)
+
+    def _stage_counts(self) -> dict:
+        return {name: value for name, value in metrics.snapshot("pipeline.").items() if isinstance(value, int)}
+
+    @patch("health.services._request_analysis")
+    def test_unchanged_report_reuses_every_stage(self, mock_request):
+        mock_request.return_value = {"comprehensive_narrative": "Steady values."}
+        first = process_report(self.report.id)
+        parameter_ids = list(self.report.parameters.values_list("id", flat=True))
+        cache.clear()
+        metrics.reset()
+        second = process_report(self.report.id)
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(second.raw_response, first.raw_response)
+        self.assertEqual(list(self.report.parameters.values_list("id", flat=True)), parameter_ids)
+        counts = self._stage_counts()
+        self.assertFalse([name for name in counts if name.endswith(".miss")])
+        for stage in ("ocr", "input_guardrails", "parameters", "context", "llm", "output_guardrails"):
+            self.assertEqual(counts[f"pipeline.{stage}.hit"], 1)
+
+    @patch("health.services._request_analysis")
+    def test_profile_edit_reruns_only_context_llm_and_output_guardrails(self, mock_request):
+        mock_request.side_effect = [
+            {"comprehensive_narrative": "Before the profile edit."},
+            {"comprehensive_narrative": "After the profile edit."},
+        ]
+        process_report(self.report.id)
+        profile, _ = UserProfile.objects.get_or_create(user=self.user)
+        profile.current_symptoms = "fatigue"
+        profile.save()
+        cache.clear()
+        metrics.reset()
+        analysis = process_report(self.report.id)
+
+        self.assertIn("After the profile edit.", analysis.mentor_summary)
+        counts = self._stage_counts()
+        self.assertEqual(
+            sorted(name for name in counts if name.endswith(".miss")),
+            ["pipeline.context.miss", "pipeline.llm.miss", "pipeline.output_guardrails.miss"],
+        )
+
+    @patch("health.services._request_analysis")
+    def test_history_edit_reruns_the_context(self, mock_request):
+        mock_request.return_value = {"comprehensive_narrative": "Steady values."}
+        older = MedicalReport.objects.create(user=self.user, report_date="2026-01-01", ocr_text="Hemoglobin 11.9 g/dL")
+        process_report(older.id)
+        process_report(self.report.id)
+        older.doctor_suggestions = "Repeat CBC in a month."
+        older.save()
+        cache.clear()
+        metrics.reset()
+        process_report(self.report.id)
+        self.assertEqual(self._stage_counts()["pipeline.context.miss"], 1)
+
+    @patch("health.services._request_analysis", return_value=None)
+    def test_provider_failures_are_not_stored(self, mock_request):
+        process_report(self.report.id)
+        process_report(self.report.id)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertFalse(self.report.stage_results.filter(stage="llm").exists())
+
+    @override_settings(PIPELINE_STAGE_CACHE=False)
+    @patch("health.services._request_analysis", return_value={"comprehensive_narrative": "Fresh."})
+    def test_cache_can_be_disabled(self, mock_request):
+        process_report(self.report.id)
+        process_report(self.report.id)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertFalse(self.report.stage_results.exists())
+
+    @patch("health.services._request_analysis", return_value={"comprehensive_narrative": "Fresh."})
+    def test_cache_can_be_bypassed_per_call(self, mock_request):
+        process_report(self.report.id)
+        process_report(self.report.id, use_stage_cache=False)
+        self.assertEqual(mock_request.call_count, 2)
@@ -0,0 +1,59 @@
+import io
+import math
+import re
+
+
+def split_into_tiles(path: str, tile_count: int, overlap: float) -> list[bytes]:
+    """Cut an image into ``tile_count`` overlapping horizontal bands as PNG bytes.
+
+    Each band is extended by ``overlap`` (fraction of the band height) on both
+    sides so a table row cut by a boundary appears whole in at least one tile.
+    """
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image.load()
+        width, height = image.size
+        band = height / tile_count
+        pad = int(band * max(0.0, overlap))
+        tiles = []
+        for index in range(tile_count):
+            top = max(0, int(index * band) - pad)
+            bottom = min(height, int((index + 1) * band) + pad)
+            buffer = io.BytesIO()
+            image.crop((0, top, width, bottom)).save(buffer, format="PNG")
+            tiles.append(buffer.getvalue())
+    return tiles
+
+
+def merge_tile_rows(tile_rows: list[list[dict]], overlap: float) -> list[dict]:
+    """Concatenate rows in tile order, dropping rows read twice where adjacent tiles overlap.
+
+    Only a tile's leading rows are compared, by name and value, with the
+    previous tile's trailing rows; each window covers the share of a tile that
+    ``split_into_tiles`` shares with its neighbour, plus one row cut at the
+    edge. Repeats elsewhere on the page, such as the same test in two panels,
+    are kept.
+    """
+    shared = 2 * max(0.0, overlap) / (1 + 2 * max(0.0, overlap))
+    merged = []
+    previous_tail: list[tuple] = []
+    for rows in tile_rows:
+        window = math.ceil(len(rows) * shared) + 1
+        keys = [_row_key(row) for row in rows]
+        unmatched = list(previous_tail)
+        for index, (row, key) in enumerate(zip(rows, keys)):
+            if index < window and key in unmatched:
+                unmatched.remove(key)
+                continue
+            merged.append(row)
+        previous_tail = keys[-window:] if rows else []
+    return merged
+
+
+def _row_key(row: dict) -> tuple:
+    return _normalize_name(row.get("name")), round(float(row.get("value") or 0), 4)
+
+
+def _normalize_name(name) -> str:
+    return re.sub(r"[^a-z0-9]", "", str(name or "").lower())
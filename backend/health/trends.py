@@ -0,0 +1,212 @@
+import math
+from datetime import date
+
+from django.utils.text import slugify
+
+from .models import LabParameter
+
+
+ROLLING_WINDOW = 3
+CHANGE_POINT_SIGMA = 2.5
+MIN_POINTS_FOR_CHANGE_POINTS = 4
+STABLE_RELATIVE_SLOPE = 0.02
+
+
+def build_trend_series(user, names: list[str] | None = None) -> list[dict]:
+    """Chart-ready value series per parameter, most at-risk first.
+
+    ``names`` limits the result to those parameters, e.g. the ones on the
+    report being viewed.
+    """
+    rows = LabParameter.objects.filter(report__user=user)
+    if names is not None:
+        rows = rows.filter(name__in=names)
+    rows = rows.order_by("report__report_date", "report__created_at", "id").values_list(
+        "name", "unit", "value", "risk_flag", "report__report_date"
+    )
+
+    series_map = {}
+    for name, unit, value, risk, report_date in rows:
+        item = series_map.setdefault(
+            name,
+            {"name": name, "slug": slugify(name), "unit": unit or "", "points": []},
+        )
+        item["points"].append({"date": str(report_date), "value": float(value), "risk": risk})
+
+    trend_series = []
+    for series in series_map.values():
+        points = series["points"]
+        latest_value = points[-1]["value"]
+        previous_value = points[-2]["value"] if len(points) > 1 else None
+        delta = latest_value - previous_value if previous_value is not None else None
+        if delta is None:
+            direction = "neutral"
+        elif delta > 0:
+            direction = "up"
+        elif delta < 0:
+            direction = "down"
+        else:
+            direction = "flat"
+
+        series["first_date"] = points[0]["date"]
+        series["last_date"] = points[-1]["date"]
+        series["latest_value"] = round(latest_value, 2)
+        series["delta"] = round(delta, 2) if delta is not None else None
+        series["direction"] = direction
+        series["latest_risk"] = points[-1].get("risk", "unknown")
+        series["point_count"] = len(points)
+        trend_series.append(series)
+
+    trend_series.sort(key=lambda x: (x["latest_risk"] != "high", x["latest_risk"] != "low", x["name"]))
+    return trend_series
+
+
+def trend_statistics_from_reports(reports: list[dict]) -> dict[str, dict]:
+    """Same statistics from the per-report dicts built by prepare_llm_context."""
+    rows = []
+    for report in reports:
+        report_date = _to_date(report.get("date"))
+        if report_date is None:
+            continue
+        for param in report.get("parameters", []):
+            rows.append((param["name"], report_date, param["value"], param.get("ref_min"), param.get("ref_max")))
+    return compute_trend_statistics(rows)
+
+
+def compute_trend_statistics(rows: list[tuple]) -> dict[str, dict]:
+    """Vectorized per-parameter statistics over (name, date, value, ref_min, ref_max) rows.
+
+    All parameters are computed at once with grouped reductions
+    (``np.bincount`` over the parameter index), so cost grows with the number
+    of points rather than with points times parameters.
+    """
+    if not rows:
+        return {}
+
+    import numpy as np
+
+    names, dates, values, ref_min, ref_max = zip(*rows)
+    labels, group = np.unique(np.asarray(names, dtype=object), return_inverse=True)
+    x = np.fromiter((d.toordinal() for d in dates), dtype=np.float64, count=len(dates))
+    y = np.asarray(values, dtype=np.float64)
+    low = np.asarray([np.nan if v is None else v for v in ref_min], dtype=np.float64)
+    high = np.asarray([np.nan if v is None else v for v in ref_max], dtype=np.float64)
+
+    order = np.lexsort((x, group))
+    group, x, y, low, high = group[order], x[order], y[order], low[order], high[order]
+    k = len(labels)
+    counts = np.bincount(group, minlength=k)
+    ends = np.cumsum(counts) - 1
+    starts = ends - counts + 1
+
+    # Least-squares slope per group, in value units per day.
+    mean_x = np.bincount(group, x, k) / counts
+    mean_y = np.bincount(group, y, k) / counts
+    dx = x - mean_x[group]
+    dy = y - mean_y[group]
+    sxx = np.bincount(group, dx * dx, k)
+    sxy = np.bincount(group, dx * dy, k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(sxx > 0, sxy / sxx, 0.0)
+
+    first = y[starts]
+    last = y[ends]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_change = np.where(first != 0, (last - first) / np.abs(first) * 100.0, np.nan)
+
+    # Mean of the latest ROLLING_WINDOW readings via prefix sums.
+    prefix = np.concatenate(([0.0], np.cumsum(y)))
+    window_start = np.maximum(ends + 1 - ROLLING_WINDOW, starts)
+    rolling_mean = (prefix[ends + 1] - prefix[window_start]) / (ends + 1 - window_start)
+
+    # Time out of range: each reading holds until the next one of the same parameter.
+    has_range = ~np.isnan(low) & ~np.isnan(high)
+    out_of_range = has_range & ((y < low) | (y > high))
+    duration = np.diff(x, append=x[-1])
+    duration[ends] = 0.0
+    ranged_time = np.bincount(group, duration * has_range, k)
+    out_time = np.bincount(group, duration * out_of_range, k)
+    ranged_points = np.bincount(group, has_range, k)
+    out_points = np.bincount(group, out_of_range, k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out_fraction = np.where(
+            ranged_time > 0,
+            out_time / ranged_time,
+            np.where(ranged_points > 0, out_points / ranged_points, np.nan),
+        )
+
+    # Change points: a step between consecutive readings far outside the spread
+    # of the parameter's other steps (leave-one-out, so the jump itself does
+    # not inflate the yardstick it is measured against).
+    step = np.diff(y, prepend=np.nan)
+    step[starts] = np.nan
+    valid_step = ~np.isnan(step)
+    step_values = np.where(valid_step, step, 0.0)
+    step_count = np.bincount(group, valid_step, k)
+    step_sum = np.bincount(group, step_values, k)
+    step_sq_sum = np.bincount(group, step_values * step_values, k)
+    others = (step_count[group] - 1).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        others_mean = (step_sum[group] - step_values) / others
+        others_var = (step_sq_sum[group] - step_values * step_values) / others - others_mean**2
+    others_std = np.sqrt(np.clip(np.nan_to_num(others_var), 0.0, None))
+    tolerance = np.maximum(others_std, 0.01 * np.abs(mean_y[group]))
+    is_change_point = (
+        valid_step
+        & (counts[group] >= MIN_POINTS_FOR_CHANGE_POINTS)
+        & (np.abs(step_values - np.nan_to_num(others_mean)) > CHANGE_POINT_SIGMA * tolerance)
+    )
+    change_points = np.bincount(group, is_change_point, k)
+    last_change_index = np.full(k, -1)
+    flagged = np.flatnonzero(is_change_point)
+    np.maximum.at(last_change_index, group[flagged], flagged)
+
+    midpoint = (low[ends] + high[ends]) / 2.0
+    width = high[ends] - low[ends]
+    scale = np.where(has_range[ends] & (width > 0), width, np.abs(mean_y))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative_slope = np.where(scale > 0, slope * 30.0 / scale, 0.0)
+    toward_midpoint = np.sign(slope) == np.sign(midpoint - last)
+    direction = np.where(
+        (counts < 2) | (np.abs(relative_slope) < STABLE_RELATIVE_SLOPE),
+        "stable",
+        np.where(
+            has_range[ends],
+            np.where(toward_midpoint, "improving", "worsening"),
+            np.where(slope > 0, "rising", "falling"),
+        ),
+    )
+
+    stats = {}
+    for index, name in enumerate(labels):
+        stats[name] = {
+            "points": int(counts[index]),
+            "first_date": date.fromordinal(int(x[starts[index]])).isoformat(),
+            "last_date": date.fromordinal(int(x[ends[index]])).isoformat(),
+            "latest_value": float(last[index]),
+            "slope_per_30_days": round(float(slope[index] * 30.0), 4),
+            "rolling_mean": round(float(rolling_mean[index]), 4),
+            "percent_change": _optional_round(percent_change[index], 2),
+            "time_out_of_range": _optional_round(out_fraction[index], 3),
+            "change_points": int(change_points[index]),
+            "last_change_point_date": (
+                date.fromordinal(int(x[last_change_index[index]])).isoformat()
+                if last_change_index[index] >= 0
+                else None
+            ),
+            "direction": str(direction[index]) if counts[index] > 1 else "single reading",
+        }
+    return stats
+
+
+def _optional_round(value, digits: int):
+    return None if math.isnan(value) else round(float(value), digits)
+
+
+def _to_date(value) -> date | None:
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
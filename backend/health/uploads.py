@@ -0,0 +1,246 @@
+import hashlib
+import os
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import AnalysisResult, ChunkedUpload, MedicalReport
+
+
+READ_BLOCK_BYTES = 64 * 1024
+
+# Running hashers per upload so each chunk is hashed once, as it is written.
+# A resume that lands on another worker rebuilds its hasher from the partial
+# file on disk, once. Entries idle for CHUNKED_UPLOAD_EXPIRY_HOURS are dropped.
+_hashers: dict[str, tuple[int, "hashlib._Hash", float]] = {}
+_hashers_lock = threading.Lock()
+_last_sweep = 0.0
+
+
+class UploadOffsetMismatch(Exception):
+    def __init__(self, expected: int):
+        super().__init__(f"Expected chunk at offset {expected}.")
+        self.expected = expected
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+def hash_uploaded_file(file_obj) -> str:
+    hasher = hashlib.sha256()
+    for chunk in file_obj.chunks():
+        hasher.update(chunk)
+    file_obj.seek(0)
+    return hasher.hexdigest()
+
+
+def hash_report_text(text: str) -> str:
+    # Whitespace and blank-line differences from copy/paste must not defeat dedup.
+    lines = [" ".join(line.split()) for line in (text or "").splitlines()]
+    normalized = "\n".join(line for line in lines if line).lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def find_duplicate_report(user, content_hash: str) -> MedicalReport | None:
+    """The user's report with this content, preferring one whose analysis finished.
+
+    The report date is user-entered metadata, so the same content under
+    another date is still a duplicate.
+    """
+    if not content_hash:
+        return None
+    return (
+        MedicalReport.objects.filter(user=user, content_hash=content_hash)
+        .order_by("-analysis_completed", "id")
+        .first()
+    )
+
+
+def needs_reanalysis(report: MedicalReport) -> bool:
+    """Whether a re-upload should re-run the pipeline instead of reusing the stored analysis."""
+    if not report.analysis_completed:
+        return True
+    return AnalysisResult.objects.filter(report=report, raw_response__provider_failed=True).exists()
+
+
+def partial_path(upload: ChunkedUpload) -> str:
+    directory = os.path.join(settings.MEDIA_ROOT, "uploads", "partial")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{upload.upload_id}.part")
+
+
+def write_chunk(upload: ChunkedUpload, offset: int, stream, length: int) -> ChunkedUpload:
+    """Stream ``length`` bytes from ``stream`` into the partial file at ``offset``.
+
+    ``received_bytes`` only moves once the bytes are fsynced, so a writer killed
+    mid-chunk leaves the committed offset where it was.
+    """
+    if offset != upload.received_bytes:
+        raise UploadOffsetMismatch(upload.received_bytes)
+    if length > int(getattr(settings, "CHUNKED_UPLOAD_MAX_CHUNK_BYTES", 5 * 1024 * 1024)):
+        raise UploadTooLarge("Chunk is larger than the allowed chunk size.")
+    if offset + length > upload.total_size:
+        raise UploadTooLarge("Chunk runs past the declared file size.")
+
+    # One writer per upload in any process. A writer that dies keeps the lease
+    # only until it expires; the next one then truncates back to the committed offset.
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=int(getattr(settings, "CHUNKED_UPLOAD_WRITER_LEASE_SECONDS", 120)))
+    claimed = (
+        ChunkedUpload.objects.filter(pk=upload.pk, received_bytes=offset, status="uploading")
+        .filter(Q(writer_lease_until__isnull=True) | Q(writer_lease_until__lt=now))
+        .update(writer_lease_until=lease_until, updated_at=now)
+    )
+    if not claimed:
+        upload.refresh_from_db()
+        raise UploadOffsetMismatch(upload.received_bytes)
+
+    key = str(upload.upload_id)
+    path = partial_path(upload)
+    lease = ChunkedUpload.objects.filter(pk=upload.pk, writer_lease_until=lease_until)
+    written = 0
+    try:
+        hasher = _resume_hasher(key, path, offset)
+        with open(path, "r+b" if os.path.exists(path) else "wb") as target:
+            target.seek(offset)
+            target.truncate()
+            while written < length:
+                block = stream.read(min(READ_BLOCK_BYTES, length - written))
+                if not block:
+                    break
+                target.write(block)
+                hasher.update(block)
+                written += len(block)
+            target.flush()
+            os.fsync(target.fileno())
+    except BaseException:
+        lease.update(writer_lease_until=None)
+        raise
+
+    # A short body commits what did arrive; the client resumes from there.
+    if not lease.update(received_bytes=offset + written, writer_lease_until=None, updated_at=timezone.now()):
+        # The lease expired mid-write and another writer took over.
+        upload.refresh_from_db()
+        raise UploadOffsetMismatch(upload.received_bytes)
+    _remember_hasher(key, offset + written, hasher)
+
+    upload.refresh_from_db()
+    if upload.received_bytes == upload.total_size:
+        return _complete(upload)
+    return upload
+
+
+def _remember_hasher(key: str, offset: int, hasher) -> None:
+    now = time.monotonic()
+    max_idle = float(getattr(settings, "CHUNKED_UPLOAD_EXPIRY_HOURS", 24)) * 3600
+    with _hashers_lock:
+        for stale in [name for name, (_, _, used) in _hashers.items() if now - used > max_idle]:
+            del _hashers[stale]
+        _hashers[key] = (offset, hasher, now)
+
+
+def _resume_hasher(key: str, path: str, offset: int):
+    # Taken out of the cache while in use, so a failed write never leaves a hasher
+    # that has seen uncommitted bytes behind.
+    with _hashers_lock:
+        cached = _hashers.pop(key, None)
+    if cached and cached[0] == offset:
+        return cached[1]
+    hasher = hashlib.sha256()
+    remaining = offset
+    if remaining and os.path.exists(path):
+        with open(path, "rb") as source:
+            while remaining > 0:
+                block = source.read(min(READ_BLOCK_BYTES, remaining))
+                if not block:
+                    break
+                hasher.update(block)
+                remaining -= len(block)
+    return hasher
+
+
+def sweep_abandoned_uploads() -> int:
+    """Delete uploads idle for CHUNKED_UPLOAD_EXPIRY_HOURS and orphaned partial files.
+
+    Runs at most once per CHUNKED_UPLOAD_SWEEP_SECONDS per process; returns the
+    number of uploads removed.
+    """
+    global _last_sweep
+    with _hashers_lock:
+        if time.monotonic() - _last_sweep < float(getattr(settings, "CHUNKED_UPLOAD_SWEEP_SECONDS", 3600)):
+            return 0
+        _last_sweep = time.monotonic()
+
+    cutoff = timezone.now() - timedelta(hours=float(getattr(settings, "CHUNKED_UPLOAD_EXPIRY_HOURS", 24)))
+    abandoned = list(ChunkedUpload.objects.filter(status="uploading", updated_at__lt=cutoff))
+    for upload in abandoned:
+        _remove_quietly(partial_path(upload))
+    ChunkedUpload.objects.filter(pk__in=[upload.pk for upload in abandoned]).delete()
+
+    directory = os.path.join(settings.MEDIA_ROOT, "uploads", "partial")
+    active = {
+        str(upload_id)
+        for upload_id in ChunkedUpload.objects.filter(status="uploading").values_list("upload_id", flat=True)
+    }
+    for name in os.listdir(directory) if os.path.isdir(directory) else []:
+        path = os.path.join(directory, name)
+        if name.removesuffix(".part") not in active and os.path.getmtime(path) < cutoff.timestamp():
+            _remove_quietly(path)
+    return len(abandoned)
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _reserve_report_name(filename: str) -> str:
+    """A free name under ``reports/``, claimed by creating an empty file exclusively.
+
+    ``get_available_name`` alone races: two uploads finishing together with the
+    same filename could both be handed the same name.
+    """
+    while True:
+        name = default_storage.get_available_name(os.path.join("reports", os.path.basename(filename)))
+        path = default_storage.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+        except FileExistsError:
+            continue
+        return name
+
+
+def _complete(upload: ChunkedUpload) -> ChunkedUpload:
+    """Turn the assembled upload into a report, or link it to an identical one."""
+    content_hash = _resume_hasher(str(upload.upload_id), partial_path(upload), upload.total_size).hexdigest()
+
+    with transaction.atomic():
+        if not ChunkedUpload.objects.filter(pk=upload.pk, status="uploading").update(status="complete"):
+            upload.refresh_from_db()
+            return upload
+        report = find_duplicate_report(upload.user, content_hash)
+        if report is not None:
+            os.remove(partial_path(upload))
+            upload.duplicate = True
+        else:
+            # The assembled file is moved over the reserved name, never copied or re-read.
+            name = _reserve_report_name(upload.filename)
+            os.replace(partial_path(upload), default_storage.path(name))
+            report = MedicalReport(user=upload.user, report_date=upload.report_date, content_hash=content_hash)
+            report.report_file.name = name
+            report.save()
+        upload.status = "complete"
+        upload.content_hash = content_hash
+        upload.report = report
+        upload.save(update_fields=["status", "content_hash", "report", "updated_at"])
+    return upload
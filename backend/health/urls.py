@@ -1,10 +1,30 @@
 from django.urls import path
 
-from .views import report_detail_view, translate_narrative_view, tts_narrative_view, upload_report_view
+from .api import report_detail_api, report_list_api, report_parameters_api, trend_series_api
+from .views import (
+    bulk_upload_report_view,
+    chunked_upload_start_view,
+    chunked_upload_view,
+    export_records_view,
+    metrics_view,
+    report_detail_view,
+    translate_narrative_view,
+    tts_narrative_view,
+    upload_report_view,
+)
 
 urlpatterns = [
     path("upload/", upload_report_view, name="report-upload"),
+    path("upload/bulk/", bulk_upload_report_view, name="report-bulk-upload"),
+    path("uploads/", chunked_upload_start_view, name="chunked-upload-start"),
+    path("uploads/<uuid:upload_id>/", chunked_upload_view, name="chunked-upload"),
+    path("export/", export_records_view, name="health-export"),
     path("translate/", translate_narrative_view, name="report-translate"),
     path("tts/", tts_narrative_view, name="report-tts"),
+    path("api/reports/", report_list_api, name="api-report-list"),
+    path("api/reports/<int:report_id>/", report_detail_api, name="api-report-detail"),
+    path("api/reports/<int:report_id>/parameters/", report_parameters_api, name="api-report-parameters"),
+    path("api/trends/", trend_series_api, name="api-trends"),
+    path("metrics/", metrics_view, name="health-metrics"),
     path("<int:report_id>/", report_detail_view, name="report-detail"),
 ]
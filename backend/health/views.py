@@ -1,17 +1,41 @@
 import json
-import asyncio
+import hashlib
+import os
+from datetime import date
 
-import requests
+from django.conf import settings
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
-from django.http import Http404, HttpResponse, JsonResponse
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import redirect, render
-from django.utils.text import slugify
-from django.views.decorators.http import require_POST
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.safestring import mark_safe
+from django.views.decorators.http import require_http_methods, require_POST
 
-from .forms import MedicalReportUploadForm
-from .models import MedicalReport
-from .services import process_report
+from . import metrics
+from .db_routing import use_primary
+from .forms import BULK_ALLOWED_EXTENSIONS, BulkReportUploadForm, MedicalReportUploadForm
+from .models import ChunkedUpload, MedicalReport
+from .narratives import DEFAULT_LANGUAGE
+from .providers import get_provider
+from .records import csv_lines, ndjson_lines
+from .services import process_report, process_report_batch
+from .trends import build_trend_series
+from .uploads import (
+    UploadOffsetMismatch,
+    UploadTooLarge,
+    find_duplicate_report,
+    hash_report_text,
+    hash_uploaded_file,
+    needs_reanalysis,
+    sweep_abandoned_uploads,
+    write_chunk,
+)
 
 
 @login_required
@@ -19,6 +43,17 @@ def upload_report_view(request):
     form = MedicalReportUploadForm(request.POST or None, request.FILES or None)
     if request.method == "POST" and form.is_valid():
         report = form.save(commit=False)
+        report.content_hash = (
+            hash_uploaded_file(report.report_file) if report.report_file else hash_report_text(report.ocr_text)
+        )
+        duplicate = find_duplicate_report(request.user, report.content_hash)
+        if duplicate:
+            if needs_reanalysis(duplicate):
+                process_report(duplicate.id)
+                messages.info(request, "This report was already uploaded. Its analysis was run again.")
+            else:
+                messages.info(request, "This report was already uploaded. Showing the existing analysis.")
+            return redirect("report-detail", report_id=duplicate.id)
         report.user = request.user
         report.save()
         process_report(report.id)
@@ -27,85 +62,174 @@ def upload_report_view(request):
     return render(request, "health/upload_report.html", {"form": form})
 
 
+@login_required
+def bulk_upload_report_view(request):
+    form = BulkReportUploadForm(request.POST or None, request.FILES or None)
+    if request.method == "POST" and form.is_valid():
+        reports = []
+        seen_hashes = set()
+        duplicates = []
+        for name, content, report_date in form.cleaned_data["entries"]:
+            content_hash = hash_uploaded_file(content)
+            existing = find_duplicate_report(request.user, content_hash)
+            if existing or content_hash in seen_hashes:
+                duplicates.append(existing)
+                continue
+            seen_hashes.add(content_hash)
+            report = MedicalReport(user=request.user, report_date=report_date, content_hash=content_hash)
+            report.report_file.save(name, content, save=False)
+            reports.append(report)
+        for report_id in {item.id for item in duplicates if item and needs_reanalysis(item)}:
+            process_report(report_id)
+        if not reports:
+            messages.info(request, "All of these reports were already uploaded.")
+            latest_duplicate = next((item for item in duplicates if item), None)
+            if latest_duplicate:
+                return redirect("report-detail", report_id=latest_duplicate.id)
+            return redirect("dashboard")
+        with transaction.atomic():
+            reports = MedicalReport.objects.bulk_create(reports)
+        analyses = process_report_batch([report.id for report in reports])
+        summary = f"{len(analyses)} reports uploaded and analyzed."
+        if duplicates:
+            summary += f" {len(duplicates)} duplicates were skipped."
+        messages.success(request, summary)
+        latest = max(reports, key=lambda item: (item.report_date, item.id))
+        return redirect("report-detail", report_id=latest.id)
+    return render(request, "health/bulk_upload.html", {"form": form})
+
+
+@login_required
+@require_POST
+def chunked_upload_start_view(request):
+    try:
+        payload = json.loads(request.body.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({"error": "Invalid JSON payload."}, status=400)
+
+    filename = os.path.basename(str(payload.get("filename") or "").strip())
+    if not filename.lower().endswith(BULK_ALLOWED_EXTENSIONS):
+        return JsonResponse({"error": "Unsupported file type."}, status=400)
+    try:
+        total_size = int(payload.get("size"))
+        report_date = date.fromisoformat(str(payload.get("report_date") or ""))
+    except (TypeError, ValueError):
+        return JsonResponse({"error": "size and report_date (YYYY-MM-DD) are required."}, status=400)
+    max_bytes = int(getattr(settings, "CHUNKED_UPLOAD_MAX_BYTES", 50 * 1024 * 1024))
+    if total_size <= 0 or total_size > max_bytes:
+        return JsonResponse({"error": f"File size must be between 1 and {max_bytes} bytes."}, status=400)
+
+    sweep_abandoned_uploads()
+    upload = ChunkedUpload.objects.create(
+        user=request.user,
+        filename=filename,
+        report_date=report_date,
+        total_size=total_size,
+    )
+    return JsonResponse(
+        {
+            **_chunked_upload_state(upload),
+            "chunk_size": int(getattr(settings, "CHUNKED_UPLOAD_MAX_CHUNK_BYTES", 5 * 1024 * 1024)),
+        },
+        status=201,
+    )
+
+
+@login_required
+@require_http_methods(["GET", "PUT"])
+@use_primary()  # resume offsets must never come from a lagging replica
+def chunked_upload_view(request, upload_id):
+    upload = ChunkedUpload.objects.filter(user=request.user, upload_id=upload_id).first()
+    if not upload:
+        raise Http404("Upload not found.")
+    if request.method == "GET" or upload.status == "complete":
+        return JsonResponse(_chunked_upload_state(upload))
+
+    try:
+        offset = int(request.headers.get("Upload-Offset", ""))
+        length = int(request.headers.get("Content-Length", ""))
+    except ValueError:
+        return JsonResponse({"error": "Upload-Offset and Content-Length headers are required."}, status=400)
+
+    try:
+        # Read the raw request stream so the chunk goes straight to disk.
+        upload = write_chunk(upload, offset, request, length)
+    except UploadOffsetMismatch as exc:
+        return JsonResponse({**_chunked_upload_state(upload), "offset": exc.expected}, status=409)
+    except UploadTooLarge as exc:
+        return JsonResponse({"error": str(exc)}, status=413)
+
+    if upload.status == "complete" and upload.report_id:
+        if not getattr(upload, "duplicate", False) or needs_reanalysis(upload.report):
+            process_report(upload.report_id)
+    return JsonResponse(_chunked_upload_state(upload))
+
+
+def _chunked_upload_state(upload: ChunkedUpload) -> dict:
+    state = {
+        "upload_id": str(upload.upload_id),
+        "status": upload.status,
+        "offset": upload.received_bytes,
+        "size": upload.total_size,
+    }
+    if upload.report_id:
+        state["report_id"] = upload.report_id
+        state["report_url"] = reverse("report-detail", args=[upload.report_id])
+        state["content_hash"] = upload.content_hash
+        state["duplicate"] = bool(getattr(upload, "duplicate", False))
+    return state
+
+
 @login_required
 def report_detail_view(request, report_id: int):
-    report = MedicalReport.objects.filter(user=request.user).prefetch_related("parameters").select_related("analysis").filter(id=report_id).first()
+    report = MedicalReport.objects.filter(user=request.user).select_related("analysis").filter(id=report_id).first()
     if not report:
         raise Http404("Report not found.")
 
-    timeline_reports = (
-        MedicalReport.objects.filter(user=request.user)
-        .prefetch_related("parameters")
-        .order_by("report_date", "created_at")
+    analysis = getattr(report, "analysis", None)
+    # Trend panels cover the whole history, so every fragment is also keyed
+    # by the user's latest report write: a reprocess or a newer upload
+    # changes the version and the stale entries simply stop being read.
+    history = MedicalReport.objects.filter(user=request.user).aggregate(count=Count("id"), stamp=Max("updated_at"))
+    version = "|".join(
+        str(part)
+        for part in (
+            report.updated_at.isoformat(),
+            analysis.updated_at.isoformat() if analysis else "",
+            history["count"],
+            history["stamp"].isoformat(),
+        )
     )
-    series_map = {}
-    for report_item in timeline_reports:
-        date_label = str(report_item.report_date)
-        for param in report_item.parameters.all():
-            item = series_map.setdefault(
-                param.name,
-                {
-                    "name": param.name,
-                    "slug": slugify(param.name),
-                    "unit": param.unit or "",
-                    "points": [],
-                },
-            )
-            item["points"].append(
-                {
-                    "date": date_label,
-                    "value": float(param.value),
-                    "risk": param.risk_flag,
-                }
-            )
-
-    current_params = list(report.parameters.all())
-    current_param_names = [p.name for p in current_params]
-    trend_series = []
-    for name in current_param_names:
-        if name not in series_map:
-            continue
-        series = series_map[name]
-        points = series.get("points", [])
-        if not points:
-            continue
-        latest_value = points[-1]["value"]
-        previous_value = points[-2]["value"] if len(points) > 1 else None
-        delta = latest_value - previous_value if previous_value is not None else None
-        if delta is None:
-            direction = "neutral"
-        elif delta > 0:
-            direction = "up"
-        elif delta < 0:
-            direction = "down"
-        else:
-            direction = "flat"
-
-        series["first_date"] = points[0]["date"]
-        series["last_date"] = points[-1]["date"]
-        series["latest_value"] = round(latest_value, 2)
-        series["delta"] = round(delta, 2) if delta is not None else None
-        series["direction"] = direction
-        series["latest_risk"] = points[-1].get("risk", "unknown")
-        series["point_count"] = len(points)
-        trend_series.append(series)
-
-    trend_series.sort(key=lambda x: (x["latest_risk"] != "high", x["latest_risk"] != "low", x["name"]))
 
+    def parameter_table():
+        return {"parameters": report.parameters.all()}
+
+    def trend_panels():
+        names = list(report.parameters.values_list("name", flat=True))
+        return {"trend_series": build_trend_series(request.user, names=names)[:10]}
+
+    def narrative():
+        full_narrative = ""
+        narrative_lang = DEFAULT_LANGUAGE
+        if analysis:
+            full_narrative = analysis.raw_response.get("comprehensive_narrative", "") or analysis.mentor_summary
+            narrative_lang = analysis.raw_response.get("language") or DEFAULT_LANGUAGE
+        return {"analysis": analysis, "full_narrative": full_narrative, "narrative_lang": narrative_lang}
+
+    fragments = {
+        name: _cached_fragment(name, report.id, version, build_context)
+        for name, build_context in (
+            ("parameter_table", parameter_table),
+            ("trend_panels", trend_panels),
+            ("narrative", narrative),
+        )
+    }
     return render(
         request,
         "health/report_detail.html",
         {
             "report": report,
-            "parameters": report.parameters.all(),
-            "analysis": getattr(report, "analysis", None),
-            "trend_series": trend_series[:10],
-            "full_narrative": (
-                getattr(report, "analysis", None).raw_response.get("comprehensive_narrative", "")
-                if getattr(report, "analysis", None)
-                else ""
-            )
-            or (getattr(report, "analysis", None).mentor_summary if getattr(report, "analysis", None) else ""),
+            "fragments": fragments,
             "tts_default_lang": (
                 getattr(getattr(request.user, "userprofile", None), "language_preference", "") or "en-IN"
             ),
@@ -113,6 +237,38 @@ def report_detail_view(request, report_id: int):
     )
 
 
+def _cached_fragment(name: str, report_id: int, version: str, build_context) -> str:
+    """Rendered partial for one report, reused until ``version`` changes."""
+    digest = hashlib.sha256(version.encode("utf-8")).hexdigest()[:16]
+    key = f"report-fragment:{name}:{report_id}:{digest}"
+    html = cache.get(key)
+    if html is not None:
+        metrics.incr("report_fragments.hit")
+        return mark_safe(html)
+    metrics.incr("report_fragments.miss")
+    html = render_to_string(f"health/partials/{name}.html", build_context())
+    cache.set(key, html, int(getattr(settings, "REPORT_FRAGMENT_CACHE_SECONDS", 24 * 60 * 60)))
+    return mark_safe(html)
+
+
+@login_required
+@require_http_methods(["GET"])
+def export_records_view(request):
+    export_format = request.GET.get("format", "csv").lower()
+    if export_format == "csv":
+        lines, content_type = csv_lines(request.user), "text/csv; charset=utf-8"
+    elif export_format == "ndjson":
+        lines, content_type = ndjson_lines(request.user), "application/x-ndjson; charset=utf-8"
+    else:
+        return JsonResponse({"error": "format must be csv or ndjson."}, status=400)
+
+    response = StreamingHttpResponse(lines, content_type=content_type)
+    filename = f"health-record-{date.today().isoformat()}.{export_format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["Cache-Control"] = "no-store"
+    return response
+
+
 @login_required
 @require_POST
 def translate_narrative_view(request):
@@ -135,20 +291,8 @@ def translate_narrative_view(request):
         return JsonResponse({"translated_text": text, "target_lang": target_lang})
 
     try:
-        response = requests.get(
-            "https://translate.googleapis.com/translate_a/single",
-            params={
-                "client": "gtx",
-                "sl": normalized_source,
-                "tl": normalized_target,
-                "dt": "t",
-                "q": text,
-            },
-            timeout=12,
-        )
-        response.raise_for_status()
-        data = response.json()
-        translated = "".join(chunk[0] for chunk in data[0] if chunk and chunk[0])
+        translate = get_provider("translation", getattr(settings, "TRANSLATION_PROVIDER", "google"))
+        translated = translate(text, normalized_source, normalized_target)
         if not translated.strip():
             raise ValueError("Empty translation response")
         return JsonResponse({"translated_text": translated, "target_lang": target_lang})
@@ -211,15 +355,11 @@ def _resolve_voice(target_lang: str) -> str:
     return VOICE_MAP.get(base, "en-IN-PrabhatNeural")
 
 
-async def _synthesize_with_edge_tts(text: str, voice: str) -> bytes:
-    import edge_tts
-
-    communicator = edge_tts.Communicate(text=text, voice=voice)
-    chunks = []
-    async for item in communicator.stream():
-        if item.get("type") == "audio":
-            chunks.append(item.get("data", b""))
-    return b"".join(chunks)
+def _tts_provider_name() -> str:
+    configured = getattr(settings, "TTS_PROVIDER", "")
+    if configured:
+        return configured
+    return "http" if getattr(settings, "TTS_BASE_URL", "") else "edge"
 
 
 @login_required
@@ -239,7 +379,8 @@ def tts_narrative_view(request):
 
     voice = _resolve_voice(target_lang)
     try:
-        audio_bytes = asyncio.run(_synthesize_with_edge_tts(text=text, voice=voice))
+        synthesize = get_provider("tts", _tts_provider_name())
+        audio_bytes = synthesize(text, voice)
         if not audio_bytes:
             raise ValueError("No audio generated")
     except ModuleNotFoundError:
@@ -256,3 +397,8 @@ def tts_narrative_view(request):
     response = HttpResponse(audio_bytes, content_type="audio/mpeg")
     response["Content-Disposition"] = 'inline; filename="narrative.mp3"'
     return response
+
+
+@staff_member_required
+def metrics_view(request):
+    return JsonResponse({"metrics": metrics.snapshot(request.GET.get("prefix", ""))})